@@ -1,6 +1,9 @@
 """Core constructs for Jac Language."""
 
+from collections import deque
+from copy import deepcopy
 from dataclasses import (
+    Field,
     MISSING,
     asdict as _asdict,
     dataclass,
@@ -14,12 +17,15 @@ from itertools import islice
 from os import getenv
 from pickle import dumps as pdumps
 from re import IGNORECASE, compile
-from types import GenericAlias, UnionType
+from types import UnionType
 from typing import (
+    AbstractSet,
     Any,
+    Callable,
     ClassVar,
     Iterable,
     Mapping,
+    SupportsIndex,
     TypeVar,
     cast,
     get_args,
@@ -47,6 +53,8 @@ from jaclang.runtimelib.architype import (
 from jaclang.runtimelib.feature import JacFeature as Jac
 from jaclang.runtimelib.utils import is_instance
 
+from motor.motor_asyncio import AsyncIOMotorClientSession
+
 from orjson import dumps
 
 from pymongo import ASCENDING, DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
@@ -57,6 +65,8 @@ from ..jaseci.datasources import Collection as BaseCollection
 from ..jaseci.utils import logger
 
 MANUAL_SAVE = getenv("MANUAL_SAVE")
+TRACK_CHANGES = getenv("TRACK_CHANGES") == "true"
+EDGE_ADJACENCY = getenv("EDGE_ADJACENCY") == "true"
 GENERIC_ID_REGEX = compile(r"^(n|e|w|o):([^:]*):([a-f\d]{24})$", IGNORECASE)
 NODE_ID_REGEX = compile(r"^n:([^:]*):([a-f\d]{24})$", IGNORECASE)
 EDGE_ID_REGEX = compile(r"^e:([^:]*):([a-f\d]{24})$", IGNORECASE)
@@ -64,6 +74,7 @@ WALKER_ID_REGEX = compile(r"^w:([^:]*):([a-f\d]{24})$", IGNORECASE)
 OBJECT_ID_REGEX = compile(r"^o:([^:]*):([a-f\d]{24})$", IGNORECASE)
 T = TypeVar("T")
 TBA = TypeVar("TBA", bound="BaseArchitype")
+ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
 
 
 def asdict_factory(data: Iterable[tuple]) -> dict[str, Any]:
@@ -86,84 +97,214 @@ def asdict(obj: object) -> dict[str, Any]:
 
 def architype_to_dataclass(cls: type[T], data: dict[str, Any], **kwargs: object) -> T:
     """Parse dict to architype."""
-    _to_dataclass(cls, data)
-    architype = object.__new__(cls)
-    hintings = get_type_hints(cls)
-    if is_dataclass(cls):
-        for attr in fields(cls):
+    return DataclassCodec.get(cls).decode(data, frozenset(), **kwargs)
+
+
+def to_dataclass(cls: type[T], data: dict[str, Any], **kwargs: object) -> T:
+    """Parse dict to dataclass."""
+    DataclassCodec.get(cls).convert(data)
+    return cls(**data, **kwargs)
+
+
+def encode_value(value: Any) -> Any:  # noqa: ANN401
+    """Encode a value the same way dataclass asdict does."""
+    if type(value) in ATOMIC_TYPES:
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return DataclassCodec.get(type(value)).encode(value)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[encode_value(v) for v in value])
+    if isinstance(value, TrackedList):
+        return [encode_value(v) for v in value]
+    if isinstance(value, TrackedDict):
+        return {encode_value(key): encode_value(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(encode_value(v) for v in value)
+    if isinstance(value, dict):
+        if hasattr(type(value), "default_factory"):
+            result = type(value)(value.default_factory)  # type: ignore[attr-defined]
+            for key, val in value.items():
+                result[encode_value(key)] = encode_value(val)
+            return result
+        return type(value)(
+            (encode_value(key), encode_value(val)) for key, val in value.items()
+        )
+    return deepcopy(value)
+
+
+@dataclass(frozen=True)
+class FieldCodec:
+    """Precomputed loading of a dataclass field."""
+
+    name: str
+    hint: Any
+    default: Any
+    default_factory: Any
+    convert: Callable[[Any], Any] | None
+    check: Callable[[Any], bool]
+
+    @staticmethod
+    def build(attr: Field, hint: Any) -> "FieldCodec":  # noqa: ANN401
+        """Build the codec of a field from its type hint."""
+        return FieldCodec(
+            name=attr.name,
+            hint=hint,
+            default=attr.default,
+            default_factory=attr.default_factory,
+            convert=FieldCodec.converter(hint),
+            check=FieldCodec.checker(hint),
+        )
+
+    @staticmethod
+    def converter(hint: Any) -> Callable[[Any], Any] | None:  # noqa: ANN401
+        """Get the conversion of stored values to nested dataclasses and enums."""
+        if is_dataclass(hint) and isinstance(hint, type):
+            dataclass_hint = hint
+            return lambda target: to_dataclass(dataclass_hint, target)
+
+        origin = get_origin(hint)
+        inner = args[-1] if (args := get_args(hint)) else None
+        if is_dataclass(inner) and isinstance(inner, type):
+            inner_cls = inner
+            if origin == dict:
+
+                def convert_dict(target: Any) -> Any:  # noqa: ANN401
+                    if isinstance(target, dict):
+                        for key, value in target.items():
+                            target[key] = to_dataclass(inner_cls, value)
+                    return target
+
+                return convert_dict
+            if origin == list:
+
+                def convert_list(target: Any) -> Any:  # noqa: ANN401
+                    if isinstance(target, list):
+                        for key, value in enumerate(target):
+                            target[key] = to_dataclass(inner_cls, value)
+                    return target
+
+                return convert_list
+
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            members = hint.__members__
+            return lambda target: (
+                members.get(target, target) if isinstance(target, str) else target
+            )
+        return None
+
+    @staticmethod
+    def checker(hint: Any) -> Callable[[Any], bool]:  # noqa: ANN401
+        """Get the validation of stored values."""
+        if hint == Any:
+            return lambda _: True
+        origin = get_origin(hint)
+        if origin is None and isinstance(hint, type):
+            return lambda val: isinstance(val, hint)
+        if origin == UnionType or origin is None:
+            return lambda val: is_instance(val, hint)
+        return lambda val: is_instance(val, origin)
+
+
+class DataclassCodec:
+    """Loading and serialization of a dataclass, built once per class.
+
+    Type hints, fields, nested dataclass converters and enum maps are derived
+    when the codec is built, so hydrating documents only runs the precomputed
+    steps.
+    """
+
+    def __init__(self, cls: type) -> None:
+        """Build the codec of a class."""
+        self.cls = cls
+        self.fields: list[FieldCodec] = []
+        if is_dataclass(cls):
+            hintings = get_type_hints(cls)
+            self.fields = [
+                FieldCodec.build(attr, hintings[attr.name]) for attr in fields(cls)
+            ]
+        self.converts = [(f.name, f.convert) for f in self.fields if f.convert]
+        self.names = [f.name for f in self.fields]
+        self.name_set = frozenset(self.names)
+
+    @staticmethod
+    def get(cls: type) -> "DataclassCodec":
+        """Get the codec of a class."""
+        # looked up on the class itself so subclasses never reuse a parent codec
+        if not isinstance(codec := cls.__dict__.get("__jac_codec__"), DataclassCodec):
+            codec = DataclassCodec(cls)
+            cls.__jac_codec__ = codec  # type: ignore[attr-defined]
+        return codec
+
+    def convert(self, data: dict[str, Any]) -> None:
+        """Convert stored values to nested dataclasses and enums in place."""
+        for name, convert in self.converts:
+            if target := data.get(name):
+                data[name] = convert(target)
+
+    def decode(
+        self,
+        data: dict[str, Any],
+        unloaded: AbstractSet[str] = frozenset(),
+        **kwargs: object,
+    ) -> Any:  # noqa: ANN401
+        """Load an instance without calling its constructor.
+
+        Fields listed in unloaded are left unset when missing from data.
+        """
+        attrs = self.fields
+        if unloaded:
+            attrs = [attr for attr in attrs if attr.name not in unloaded]
+        values = self.load(data, attrs)
+
+        instance: Any = object.__new__(self.cls)
+        instance.__dict__.update(values)
+        instance.__dict__.update(data)
+        instance.__dict__.update(kwargs)
+        return instance
+
+    def load(self, data: dict[str, Any], attrs: Iterable[FieldCodec]) -> dict[str, Any]:
+        """Pop and validate the stored values of fields."""
+        self.convert(data)
+        cls = self.cls
+        values: dict[str, Any] = {}
+        for attr in attrs:
             if (val := data.pop(attr.name, MISSING)) is MISSING:
                 if attr.default is not MISSING:
-                    setattr(architype, attr.name, attr.default)
+                    values[attr.name] = attr.default
                 elif attr.default_factory is not MISSING and callable(
                     attr.default_factory
                 ):
-                    setattr(architype, attr.name, attr.default_factory())
+                    values[attr.name] = attr.default_factory()
                 else:
                     raise ValueError(
-                        f"{cls.__name__} requires {attr.name} field with type {hintings[attr.name]}"
+                        f"{cls.__name__} requires {attr.name} field with type {attr.hint}"
                     )
+            elif attr.check(val):
+                values[attr.name] = val
             else:
-                hinter = hintings[attr.name]
-                origin = get_origin(hinter)
-                if hinter == Any:
-                    setattr(architype, attr.name, val)
-                    continue
-                elif origin == UnionType or origin is None:
-                    if is_instance(val, hinter):
-                        setattr(architype, attr.name, val)
-                        continue
-                elif origin and is_instance(val, origin):
-                    setattr(architype, attr.name, val)
-                    continue
                 raise ValueError(
                     f"Data from datasource has type {val.__class__.__name__}"
-                    f" but {cls.__name__}.{attr.name} requires {hinter}."
+                    f" but {cls.__name__}.{attr.name} requires {attr.hint}."
                 )
+        return values
+
+    def encode(
+        self, obj: object, skip: AbstractSet[str] = frozenset()
+    ) -> dict[str, Any]:
+        """Serialize an instance like asdict with enums stored by name."""
+        if skip:
+            return {
+                name: self.encode_field(obj, name)
+                for name in self.names
+                if name not in skip
+            }
+        return {name: self.encode_field(obj, name) for name in self.names}
 
-    architype.__dict__.update(data)
-    architype.__dict__.update(kwargs)
-    return architype
-
-
-def to_dataclass(cls: type[T], data: dict[str, Any], **kwargs: object) -> T:
-    """Parse dict to dataclass."""
-    _to_dataclass(cls, data)
-    return cls(**data, **kwargs)
-
-
-def _to_dataclass(cls: type[T], data: dict[str, Any]) -> None:
-    """Parse dict to dataclass implementation."""
-    hintings = get_type_hints(cls)
-    if is_dataclass(cls):
-        for attr in fields(cls):
-            if target := data.get(attr.name):
-                hint = hintings[attr.name]
-                if is_dataclass(hint) and isinstance(hint, type):
-                    data[attr.name] = to_dataclass(hint, target)
-                else:
-                    origin = get_origin(hint)
-                    if origin == dict and isinstance(target, dict):
-                        if is_dataclass(inner_cls := get_args(hint)[-1]) and isinstance(
-                            inner_cls, type
-                        ):
-                            for key, value in target.items():
-                                target[key] = to_dataclass(inner_cls, value)
-                    elif (
-                        origin == list
-                        and isinstance(target, list)
-                        and is_dataclass(inner_cls := get_args(hint)[-1])
-                        and isinstance(inner_cls, type)
-                    ):
-                        for key, value in enumerate(target):
-                            target[key] = to_dataclass(inner_cls, value)
-                    elif (
-                        origin != UnionType
-                        and not isinstance(hint, GenericAlias)
-                        and issubclass(hint, Enum)
-                        and isinstance(target, str)
-                        and (enum := hint.__members__.get(target))
-                    ):
-                        data[attr.name] = enum
+    @staticmethod
+    def encode_field(obj: object, name: str) -> Any:  # noqa: ANN401
+        """Serialize a field of an instance."""
+        value = getattr(obj, name)
+        return value.name if isinstance(value, Enum) else encode_value(value)
 
 
 @dataclass
@@ -189,6 +330,12 @@ class BulkWrite:
         }
     )
 
+    # field only updates set aside for write-behind instead of operations
+    write_behind: bool = False
+    deferred: list[tuple[type["BaseAnchor"], ObjectId, dict[str, Any]]] = field(
+        default_factory=list
+    )
+
     del_ops_nodes: list[ObjectId] = field(default_factory=list)
     del_ops_edges: list[ObjectId] = field(default_factory=list)
     del_ops_walker: list[ObjectId] = field(default_factory=list)
@@ -296,6 +443,64 @@ class BulkWrite:
                 logger.exception("Error executing bulk write!")
                 raise
 
+    @staticmethod
+    async def acommit(session: AsyncIOMotorClientSession) -> None:
+        """Commit current session with the async driver."""
+        commit_retry = 0
+        while True:
+            try:
+                await session.commit_transaction()
+                break
+            except (ConnectionFailure, OperationFailure) as ex:
+                if (
+                    ex.has_error_label("UnknownTransactionCommitResult")
+                    and commit_retry <= BulkWrite.SESSION_MAX_COMMIT_RETRY
+                ):
+                    commit_retry += 1
+                    logger.exception(
+                        "Error commiting session! "
+                        f"Retrying [{commit_retry}/{BulkWrite.SESSION_MAX_COMMIT_RETRY}] ..."
+                    )
+                    continue
+                logger.exception(
+                    f"Error commiting session after max retry [{BulkWrite.SESSION_MAX_COMMIT_RETRY}] !"
+                )
+                raise
+            except Exception:
+                logger.exception("Error commiting session!")
+                raise
+
+    async def aexecute(self, session: AsyncIOMotorClientSession) -> None:
+        """Execute all operations with the async driver."""
+        transaction_retry = 0
+        while True:
+            try:
+                for cls, operations in self.operations.items():
+                    if operations:
+                        await cls.Collection.async_collection().bulk_write(
+                            operations, ordered=False, session=session
+                        )
+                await self.acommit(session)
+                break
+            except (ConnectionFailure, OperationFailure) as ex:
+                if (
+                    ex.has_error_label("TransientTransactionError")
+                    and transaction_retry <= self.SESSION_MAX_TRANSACTION_RETRY
+                ):
+                    transaction_retry += 1
+                    logger.exception(
+                        "Error executing bulk write! "
+                        f"Retrying [{transaction_retry}/{self.SESSION_MAX_TRANSACTION_RETRY}] ..."
+                    )
+                    continue
+                logger.exception(
+                    f"Error executing bulk write after max retry [{self.SESSION_MAX_TRANSACTION_RETRY}] !"
+                )
+                raise
+            except Exception:
+                logger.exception("Error executing bulk write!")
+                raise
+
 
 @dataclass
 class Access(_Access):
@@ -335,6 +540,20 @@ class Permission(_Permission):
         )
 
 
+def context_hash(value: Any) -> int:  # noqa: ANN401
+    """Hash a serialized architype field."""
+    return hash(value if isinstance(value, bytes) else dumps(value))
+
+
+def is_atomic(value: Any) -> bool:  # noqa: ANN401
+    """Check if a value can't be changed in place."""
+    if type(value) in ATOMIC_TYPES or isinstance(value, Enum):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(is_atomic(v) for v in value)
+    return False
+
+
 @dataclass
 class AnchorState:
     """Anchor state handler."""
@@ -344,6 +563,233 @@ class AnchorState:
     context_hashes: dict[str, int] = field(default_factory=dict)
     deleted: bool | None = None
     connected: bool = False
+    # changed fields of tracked architypes, None while not tracked
+    dirty: set[str] | None = None
+    # tracked fields holding values that may change in place unnoticed
+    untracked: set[str] = field(default_factory=set)
+    # lazy architype fields not yet loaded from the datasource
+    unloaded: set[str] = field(default_factory=set)
+
+    def track(self, architype: "BaseArchitype") -> None:
+        """Start recording the changed fields of an architype.
+
+        Lists and dicts are replaced by copies that mark their field as changed
+        when mutated. Fields holding other mutable values keep being compared
+        by hash.
+        """
+        self.dirty = set()
+        self.untracked = set()
+        values = architype.__dict__
+        codec = DataclassCodec.get(architype.__class__)
+        for name in codec.names:
+            if name in values:
+                values[name] = self.wrap(name, values[name])
+        self.context_hashes = {
+            name: context_hash(codec.encode_field(architype, name))
+            for name in self.untracked
+        }
+
+    def wrap(self, name: str, value: Any) -> Any:  # noqa: ANN401
+        """Wrap a loaded field value to record in place changes."""
+        if is_atomic(value):
+            return value
+        if type(value) is list:
+            return TrackedList((self.wrap(name, v) for v in value), self, name)
+        if type(value) is dict:
+            return TrackedDict(
+                ((key, self.wrap(name, val)) for key, val in value.items()), self, name
+            )
+        self.untracked.add(name)
+        return value
+
+    def mark(self, name: str, *values: Any) -> None:  # noqa: ANN401
+        """Mark a field as changed, comparing it by hash if given mutable values."""
+        if self.dirty is not None:
+            self.dirty.add(name)
+            if not all(is_atomic(value) for value in values):
+                self.untracked.add(name)
+
+
+class TrackedList(list):
+    """List field value that marks its field as changed when mutated."""
+
+    __slots__ = ("state", "name")
+
+    def __init__(self, values: Iterable, state: AnchorState, name: str) -> None:
+        """Initialize tracked list."""
+        super().__init__(values)
+        self.state = state
+        self.name = name
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple:
+        """Copy and pickle as a plain list."""
+        return (list, (list(self),))
+
+    def __setitem__(self, index: Any, value: Any) -> None:  # noqa: ANN401
+        """Track item assignment."""
+        values = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, values if isinstance(index, slice) else value)
+        self.state.mark(self.name, *values)
+
+    def __delitem__(self, index: Any) -> None:  # noqa: ANN401
+        """Track item deletion."""
+        super().__delitem__(index)
+        self.state.mark(self.name)
+
+    def __iadd__(self, values: Iterable) -> "TrackedList":  # type: ignore[override, misc]
+        """Track in place concatenation."""
+        values = list(values)
+        super().__iadd__(values)
+        self.state.mark(self.name, *values)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> "TrackedList":
+        """Track in place repetition."""
+        super().__imul__(count)
+        self.state.mark(self.name)
+        return self
+
+    def append(self, value: Any) -> None:  # noqa: ANN401
+        """Track append."""
+        super().append(value)
+        self.state.mark(self.name, value)
+
+    def extend(self, values: Iterable) -> None:
+        """Track extend."""
+        values = list(values)
+        super().extend(values)
+        self.state.mark(self.name, *values)
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:  # noqa: ANN401
+        """Track insert."""
+        super().insert(index, value)
+        self.state.mark(self.name, value)
+
+    def pop(self, index: SupportsIndex = -1) -> Any:  # noqa: ANN401
+        """Track pop."""
+        value = super().pop(index)
+        self.state.mark(self.name)
+        return value
+
+    def remove(self, value: Any) -> None:  # noqa: ANN401
+        """Track remove."""
+        super().remove(value)
+        self.state.mark(self.name)
+
+    def clear(self) -> None:
+        """Track clear."""
+        super().clear()
+        self.state.mark(self.name)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Track sort."""
+        super().sort(*args, **kwargs)
+        self.state.mark(self.name)
+
+    def reverse(self) -> None:
+        """Track reverse."""
+        super().reverse()
+        self.state.mark(self.name)
+
+
+class TrackedDict(dict):
+    """Dict field value that marks its field as changed when mutated."""
+
+    __slots__ = ("state", "name")
+
+    def __init__(self, items: Iterable, state: AnchorState, name: str) -> None:
+        """Initialize tracked dict."""
+        super().__init__(items)
+        self.state = state
+        self.name = name
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple:
+        """Copy and pickle as a plain dict."""
+        return (dict, (dict(self),))
+
+    def __setitem__(self, key: Any, value: Any) -> None:  # noqa: ANN401
+        """Track item assignment."""
+        super().__setitem__(key, value)
+        self.state.mark(self.name, value)
+
+    def __delitem__(self, key: Any) -> None:  # noqa: ANN401
+        """Track item deletion."""
+        super().__delitem__(key)
+        self.state.mark(self.name)
+
+    def __ior__(self, other: Any) -> "TrackedDict":  # type: ignore[override, misc] # noqa: ANN401
+        """Track in place union."""
+        self.update(other)
+        return self
+
+    def pop(self, *args: Any) -> Any:  # noqa: ANN401
+        """Track pop."""
+        value = super().pop(*args)
+        self.state.mark(self.name)
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        """Track popitem."""
+        item = super().popitem()
+        self.state.mark(self.name)
+        return item
+
+    def clear(self) -> None:
+        """Track clear."""
+        super().clear()
+        self.state.mark(self.name)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Track update."""
+        items = dict(*args, **kwargs)
+        super().update(items)
+        self.state.mark(self.name, *items.values())
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:  # noqa: ANN401
+        """Track setdefault."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+class LazyField:
+    """Architype field loaded from the datasource on first access."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the field."""
+        self.name = name
+
+    def __get__(self, obj: object, owner: type | None = None) -> Any:  # noqa: ANN401
+        """Get the field value, loading it first if still unloaded."""
+        if obj is None:
+            return self
+        values = obj.__dict__
+        if self.name not in values:
+            if (anchor := values.get("__jac__")) and self.name in anchor.state.unloaded:
+                from .context import JaseciContext
+
+                JaseciContext.get().mem.hydrate(anchor)
+            if self.name not in values:
+                raise AttributeError(
+                    f"'{obj.__class__.__name__}' object has no attribute '{self.name}'"
+                )
+        return values[self.name]
+
+    def __set__(self, obj: object, value: Any) -> None:  # noqa: ANN401
+        """Set the field value, overriding the stored one."""
+        obj.__dict__[self.name] = value
+        if anchor := obj.__dict__.get("__jac__"):
+            anchor.state.unloaded.discard(self.name)
+
+    @staticmethod
+    def install(cls: type["BaseArchitype"]) -> None:
+        """Load the lazy fields of an architype on first access."""
+        codec = DataclassCodec.get(cls)
+        for name in cls.__jac_lazy__:
+            if name not in codec.name_set:
+                logger.warning(f"{cls.__name__} has no lazy field {name}!")
+            elif not isinstance(cls.__dict__.get(name), LazyField):
+                setattr(cls, name, LazyField(name))
 
 
 @dataclass(eq=False, repr=False, kw_only=True)
@@ -450,11 +896,14 @@ class BaseAnchor:
 
     def connect_edge(self, anchor: Anchor) -> None:
         """Push update that there's newly added edge."""
-        self.add_to_set("edges", anchor)
+        # edges are queried by their source and target instead
+        if not EDGE_ADJACENCY:
+            self.add_to_set("edges", anchor)
 
     def disconnect_edge(self, anchor: Anchor) -> None:
         """Push update that there's edge that has been removed."""
-        self.pull("edges", anchor)
+        if not EDGE_ADJACENCY:
+            self.pull("edges", anchor)
 
     ####################################################
     #                POPULATE OPERATIONS               #
@@ -487,6 +936,40 @@ class BaseAnchor:
                 f"{self.__class__.__name__} [{self.ref_id}] is not a valid reference!"
             )
 
+    @property
+    def lazy_fields(self) -> tuple[str, ...]:
+        """Get the architype fields left unloaded until accessed."""
+        return ()
+
+    def hydrate(self, data: dict[str, Any]) -> None:
+        """Load the unloaded architype fields from their stored values."""
+        state = self.state
+        architype = self.architype
+        # an unchanged anchor stays unchanged after loading its remaining fields
+        changed = state.dirty is None and self.has_changed()
+
+        codec = DataclassCodec.get(architype.__class__)
+        values = codec.load(
+            data, [attr for attr in codec.fields if attr.name in state.unloaded]
+        )
+        state.unloaded = set()
+
+        if state.dirty is not None:
+            for name, value in values.items():
+                architype.__dict__[name] = state.wrap(name, value)
+                if name in state.untracked:
+                    state.context_hashes[name] = context_hash(
+                        codec.encode_field(architype, name)
+                    )
+        else:
+            architype.__dict__.update(values)
+            for name in values:
+                state.context_hashes[name] = context_hash(
+                    codec.encode_field(architype, name)
+                )
+            if not changed:
+                state.full_hash = hash(pdumps(self.serialize()))
+
     def build_query(
         self,
         bulk_write: BulkWrite,
@@ -541,15 +1024,22 @@ class BaseAnchor:
 
         if Jac.check_write_access(self):  # type: ignore[arg-type]
             set_architype = changes.pop("$set", {})
-            if is_dataclass(architype := self.architype) and not isinstance(
+            if (dirty := self.state.dirty) is not None:
+                untracked = self.state.untracked
+                for key in dirty | untracked:
+                    val = DataclassCodec.encode_field(self.architype, key)
+                    if key in untracked:
+                        if (h := context_hash(val)) == self.state.context_hashes.get(
+                            key
+                        ):
+                            continue
+                        self.state.context_hashes[key] = h
+                    set_architype[f"architype.{key}"] = val
+                dirty.clear()
+            elif is_dataclass(architype := self.architype) and not isinstance(
                 architype, type
             ):
-                for (
-                    key,
-                    val,
-                ) in (
-                    architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
-                ):
+                for key, val in self.serialize_architype().items():
                     if (h := hash(dumps(val))) != self.state.context_hashes.get(key):
                         self.state.context_hashes[key] = h
                         set_architype[f"architype.{key}"] = val
@@ -612,7 +1102,10 @@ class BaseAnchor:
             # -------------------------------------------------------- #
 
         if changes:
-            operations.append(UpdateOne(operation_filter, changes))
+            if bulk_write.write_behind and changes.keys() <= {"$set", "$unset"}:
+                bulk_write.deferred.append((self.__class__, self.id, changes))
+            else:
+                operations.append(UpdateOne(operation_filter, changes))
 
     def delete(self, bulk_write: BulkWrite) -> None:
         """Append Delete Query."""
@@ -620,6 +1113,16 @@ class BaseAnchor:
 
     def has_changed(self) -> int:
         """Check if needs to update."""
+        if (dirty := self.state.dirty) is not None:
+            # tracked architypes only hash fields that can't be tracked
+            return int(
+                bool(self.state.changes or dirty)
+                or any(
+                    context_hash(DataclassCodec.encode_field(self.architype, key))
+                    != self.state.context_hashes.get(key)
+                    for key in self.state.untracked
+                )
+            )
         if self.state.full_hash != (new_hash := hash(pdumps(self.serialize()))):
             return new_hash
         return 0
@@ -629,11 +1132,15 @@ class BaseAnchor:
         if is_dataclass(architype := self.architype) and not isinstance(
             architype, type
         ):
+            if architype.__jac_tracked__:
+                self.state.track(architype)
+                return
+            serialized = self.serialize()
             self.state.context_hashes = {
                 key: hash(val if isinstance(val, bytes) else dumps(val))
-                for key, val in architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
+                for key, val in cast(dict, serialized["architype"]).items()
             }
-            self.state.full_hash = hash(pdumps(self.serialize()))
+            self.state.full_hash = hash(pdumps(serialized))
 
     # ---------------------------------------------------------------------- #
 
@@ -656,12 +1163,20 @@ class BaseAnchor:
             "root": self.root,
             "access": self.access.serialize(),
             "architype": (
-                self.architype.__serialize__()  # type:ignore[attr-defined] # mypy issue
+                self.serialize_architype()
                 if is_dataclass(self.architype) and not isinstance(self.architype, type)
                 else {}
             ),
         }
 
+    def serialize_architype(self) -> dict[str, Any]:
+        """Serialize the loaded fields of the architype."""
+        if unloaded := self.state.unloaded:
+            return DataclassCodec.get(self.architype.__class__).encode(
+                self.architype, unloaded
+            )
+        return self.architype.__serialize__()
+
     def __repr__(self) -> str:
         """Override representation."""
         if self.is_populated():
@@ -696,16 +1211,19 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
             """Parse document to NodeAnchor."""
             doc = cast(dict, doc)
 
-            architype = architype_to_dataclass(
-                NodeArchitype.__get_class__(doc.get("name") or ""),
-                doc.pop("architype"),
-            )
+            jac_class = NodeArchitype.__get_class__(doc.get("name") or "")
+            data = doc.pop("architype")
+            # lazy fields left out by the projection load on first access
+            unloaded = {name for name in jac_class.__jac_lazy__ if name not in data}
+            architype = DataclassCodec.get(jac_class).decode(data, unloaded)
             anchor = NodeAnchor(
                 architype=architype,
                 id=doc.pop("_id"),
-                edges=[e for edge in doc.pop("edges") if (e := EdgeAnchor.ref(edge))],
+                edges=[
+                    e for edge in doc.pop("edges", []) if (e := EdgeAnchor.ref(edge))
+                ],
                 access=Permission.deserialize(doc.pop("access")),
-                state=AnchorState(connected=True),
+                state=AnchorState(connected=True, unloaded=unloaded),
                 persistent=True,
                 **doc,
             )
@@ -723,6 +1241,11 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
             return anchor
         raise ValueError(f"[{ref_id}] is not a valid reference!")
 
+    @property
+    def lazy_fields(self) -> tuple[str, ...]:
+        """Get the architype fields left unloaded until accessed."""
+        return NodeArchitype.__get_class__(self.name).__jac_lazy__
+
     def insert(
         self,
         bulk_write: BulkWrite,
@@ -742,13 +1265,19 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
         for edge in pulled_edges:
             edge.delete(bulk_write)
 
+        if EDGE_ADJACENCY:
+            ref_id = self.ref_id
+            bulk_write.operations[EdgeAnchor].append(
+                DeleteMany({"$or": [{"source": ref_id}, {"target": ref_id}]})
+            )
+
         bulk_write.del_node(self.id)
 
     def serialize(self) -> dict[str, object]:
         """Serialize Node Anchor."""
         return {
             **super().serialize(),
-            "edges": [edge.ref_id for edge in self.edges],
+            "edges": ([] if EDGE_ADJACENCY else [edge.ref_id for edge in self.edges]),
         }
 
 
@@ -766,7 +1295,20 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
 
         __collection__: str | None = "edge"
         __default_indexes__: list[dict] = [
-            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]}
+            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]},
+            # adjacent pages edges of a node in _id order, of any or of some names
+            *(
+                [
+                    {"keys": keys}
+                    for end in ("source", "target")
+                    for keys in (
+                        [(end, ASCENDING), ("_id", ASCENDING)],
+                        [(end, ASCENDING), ("name", ASCENDING), ("_id", ASCENDING)],
+                    )
+                ]
+                if EDGE_ADJACENCY
+                else []
+            ),
         ]
 
         @classmethod
@@ -837,9 +1379,9 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
 
     architype: "WalkerArchitype"
     path: list[NodeAnchor] = field(default_factory=list)  # type: ignore[assignment]
-    next: list[NodeAnchor] = field(default_factory=list)  # type: ignore[assignment]
+    next: deque[NodeAnchor] = field(default_factory=deque)  # type: ignore[assignment]
     returns: list[Any] = field(default_factory=list)
-    ignores: list[NodeAnchor] = field(default_factory=list)  # type: ignore[assignment]
+    ignores: set[NodeAnchor] = field(default_factory=set)  # type: ignore[assignment]
     disengaged: bool = False
 
     class Collection(BaseCollection["WalkerAnchor"]):
@@ -954,13 +1496,27 @@ class BaseArchitype:
 
     __jac_classes__: dict[str, type["BaseArchitype"]]
     __jac_hintings__: dict[str, type]
+    # record changed fields instead of comparing serialization hashes
+    __jac_tracked__: ClassVar[bool] = TRACK_CHANGES
+    # fields left out when loading nodes, fetched on first access
+    __jac_lazy__: ClassVar[tuple[str, ...]] = ()
 
     __jac__: Anchor
 
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Record field assignments of tracked architypes."""
+        super().__setattr__(name, value)
+        if (
+            (anchor := self.__dict__.get("__jac__"))
+            and anchor.state.dirty is not None
+            and name in DataclassCodec.get(self.__class__).name_set
+        ):
+            anchor.state.mark(name, value)
+
     def __serialize__(self) -> dict[str, Any]:
         """Process default serialization."""
         if is_dataclass(self) and not isinstance(self, type):
-            return asdict(self)
+            return DataclassCodec.get(self.__class__).encode(self)
         raise ValueError(
             f"{self.__jac__.__class__.__name__} {self.__class__.__name__} is not serializable!"
         )
@@ -1024,6 +1580,8 @@ class NodeArchitype(BaseArchitype, _NodeArchitype):
         for sub in islice(cls.__subclasses__(), 1, None):
             sub.__jac_hintings__ = get_type_hints(sub)
             jac_classes[sub.__name__] = sub
+            if sub.__jac_lazy__:
+                LazyField.install(sub)
 
         Root.__jac_hintings__ = get_type_hints(Root)
         jac_classes[""] = Root
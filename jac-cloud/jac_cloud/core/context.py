@@ -1,13 +1,16 @@
 """Core constructs for Jac Language."""
 
 from contextvars import ContextVar
-from dataclasses import dataclass, is_dataclass
+from copy import deepcopy
+from dataclasses import dataclass, field, is_dataclass
 from os import getenv
-from typing import Any, Generic, TypeVar, cast
+from time import monotonic
+from typing import Any, Generic, Mapping, TypeVar, cast
 
 from bson import ObjectId
 
 from fastapi import Request, WebSocket
+from fastapi.concurrency import run_in_threadpool
 
 from jaclang.runtimelib.machine import ExecutionContext, JacMachineState
 
@@ -20,9 +23,11 @@ from .architype import (
     asdict,
 )
 from .memory import MongoDB
+from ..jaseci.security import SESSION_CACHE
 
 
 SHOW_ENDPOINT_RETURNS = getenv("SHOW_ENDPOINT_RETURNS") == "true"
+ROOT_CACHE_TTL = float(getenv("ROOT_CACHE_TTL") or "0")
 JASECI_CONTEXT = ContextVar["JaseciContext | None"]("JaseciContext")
 
 SUPER_ROOT_ID = ObjectId("000000000000000000000000")
@@ -33,6 +38,44 @@ PUBLIC_ROOT = NodeAnchor.ref(f"n::{PUBLIC_ROOT_ID}")
 RT = TypeVar("RT")
 
 
+@dataclass
+class RootCache:
+    """Process-wide read-through cache of well-known root documents.
+
+    Every context gets its own anchor built from the cached document, so no
+    anchor is shared between requests. Documents expire after `ttl` seconds
+    and are dropped as soon as a context of this process changes their root.
+    """
+
+    ttl: float
+    docs: dict[ObjectId, tuple[float, Mapping[str, Any]]] = field(default_factory=dict)
+
+    def find(self, mem: MongoDB, ref: NodeAnchor) -> NodeAnchor | None:
+        """Find a root, reading its document at most once per ttl."""
+        if self.ttl <= 0:
+            return cast(NodeAnchor | None, mem.find_by_id(ref))
+
+        if (cached := self.docs.get(ref.id)) is None or cached[0] <= monotonic():
+            if not (doc := mem.document(ref)):
+                return None
+            self.docs[ref.id] = cached = (monotonic() + self.ttl, doc)
+
+        anchor = NodeAnchor.Collection.__document__(deepcopy(cached[1]))
+        mem.set(anchor.id, anchor)
+        return anchor
+
+    def invalidate(self, mem: MongoDB) -> None:
+        """Drop the documents of cached roots changed in a context."""
+        for id in list(self.docs):
+            if isinstance(anchor := mem.__mem__.get(id), NodeAnchor) and (
+                anchor.state.changes or anchor.has_changed()
+            ):
+                self.docs.pop(id, None)
+
+
+ROOT_CACHE = RootCache(ROOT_CACHE_TTL)
+
+
 @dataclass
 class ContextResponse(Generic[RT]):
     """Default Context Response."""
@@ -61,24 +104,37 @@ class JaseciContext(ExecutionContext):
     entry_node: NodeAnchor
     base: ExecutionContext | None
     connection: Request | WebSocket
+    access_levels: dict[tuple[ObjectId, ObjectId], AccessLevel]  # type: ignore[assignment]
 
     def close(self) -> None:
         """Clean up context."""
+        ROOT_CACHE.invalidate(self.mem)
+        SESSION_CACHE.invalidate_roots(self.mem)
         self.mem.close()
 
+    async def aclose(self) -> None:
+        """Clean up context writing with the async driver."""
+        ROOT_CACHE.invalidate(self.mem)
+        SESSION_CACHE.invalidate_roots(self.mem)
+        await self.mem.aclose()
+
     @staticmethod
     def create(  # type: ignore[override]
-        connection: Request | WebSocket, entry: NodeAnchor | None = None
+        connection: Request | WebSocket,
+        entry: NodeAnchor | None = None,
+        mem: MongoDB | None = None,
     ) -> "JaseciContext":
         """Create JacContext."""
         ctx = JaseciContext(JacMachineState())
         ctx.connection = connection
-        ctx.mem = MongoDB()
+        ctx.mem = mem or MongoDB()
         ctx.reports = []
         ctx.status = 200
 
         system_root: NodeAnchor | None = None
-        if not isinstance(system_root := ctx.mem.find_by_id(SUPER_ROOT), NodeAnchor):
+        if not isinstance(
+            system_root := ROOT_CACHE.find(ctx.mem, SUPER_ROOT), NodeAnchor
+        ):
             system_root = Root().__jac__  # type: ignore[attr-defined]
             system_root.id = SUPER_ROOT_ID
             system_root.state.connected = True
@@ -94,7 +150,7 @@ class JaseciContext(ExecutionContext):
             ctx.mem.set(_root.id, _root)
         else:
             if not isinstance(
-                public_root := ctx.mem.find_by_id(PUBLIC_ROOT), NodeAnchor
+                public_root := ROOT_CACHE.find(ctx.mem, PUBLIC_ROOT), NodeAnchor
             ):
                 public_root = Root().__jac__  # type: ignore[attr-defined]
                 public_root.id = PUBLIC_ROOT_ID
@@ -117,6 +173,26 @@ class JaseciContext(ExecutionContext):
 
         return ctx
 
+    @staticmethod
+    async def acreate(
+        connection: Request | WebSocket, entry: NodeAnchor | None = None
+    ) -> "JaseciContext":
+        """Create JacContext, loading its roots and entry node with the async driver."""
+        mem = MongoDB()
+        anchors: list[NodeAnchor] = []
+        if ROOT_CACHE.ttl <= 0:
+            anchors.append(SUPER_ROOT)
+            if not getattr(connection, "_root", None):
+                anchors.append(PUBLIC_ROOT)
+        if entry:
+            anchors.append(entry)
+        await mem.afind(anchors)
+
+        # cached roots may still be read or created with the sync driver
+        ctx = await run_in_threadpool(JaseciContext.create, connection, entry, mem)
+        JASECI_CONTEXT.set(ctx)
+        return ctx
+
     @staticmethod
     def get() -> "JaseciContext":
         """Get current JaseciContext."""
@@ -1,52 +1,357 @@
 """Memory abstraction for jaseci plugin."""
 
-from dataclasses import dataclass
+from copy import deepcopy
+from dataclasses import dataclass, field
 from os import getenv
-from typing import Callable, Generator, Iterable, TypeVar, cast
+from threading import Event, Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+    cast,
+)
 
 from bson import ObjectId
 
+from jaclang.compiler.constant import EdgeDir
 from jaclang.runtimelib.feature import JacFeature as Jac
 from jaclang.runtimelib.memory import Memory
 
+from motor.motor_asyncio import AsyncIOMotorClientSession
 
-from pymongo import InsertOne
+from pymongo import InsertOne, UpdateOne
 from pymongo.client_session import ClientSession
 
 from .architype import (
     Anchor,
     BaseAnchor,
     BulkWrite,
+    EDGE_ADJACENCY,
     EdgeAnchor,
+    EdgeArchitype,
+    GenericEdge,
     NodeAnchor,
     ObjectAnchor,
     Root,
     WalkerAnchor,
 )
 from ..jaseci.datasources import Collection
+from ..jaseci.datasources.collection import AsyncCollection
+from ..jaseci.utils import logger
 
 DISABLE_AUTO_CLEANUP = getenv("DISABLE_AUTO_CLEANUP") == "true"
 SINGLE_QUERY = getenv("SINGLE_QUERY") == "true"
+WRITE_BEHIND_INTERVAL = float(getenv("WRITE_BEHIND_INTERVAL") or "1")
+WRITE_BEHIND_MAX_BATCH = int(getenv("WRITE_BEHIND_MAX_BATCH") or "1000")
+EDGE_PAGE_SIZE = int(getenv("EDGE_PAGE_SIZE") or "1000")
 IDS = ObjectId | Iterable[ObjectId]
 BA = TypeVar("BA", bound="BaseAnchor")
 
 
+def edge_names(edge_type: type[EdgeArchitype]) -> list[str]:
+    """Get the stored names of an edge class and its subclasses."""
+    names: list[str] = []
+    queue = [edge_type]
+    while queue:
+        cls = queue.pop()
+        names.append("" if cls is GenericEdge else cls.__name__)
+        queue.extend(cls.__subclasses__())
+    return names
+
+
+def coalesce(updates: list[dict[str, Any]], update: dict[str, Any]) -> None:
+    """Merge a $set/$unset update into the last pending one unless their paths nest."""
+    if updates:
+        last = updates[-1]
+        paths = {*last.get("$set", {}), *last.get("$unset", {})}
+        if not any(
+            path.startswith(f"{new}.") or new.startswith(f"{path}.")
+            for new in (*update.get("$set", {}), *update.get("$unset", {}))
+            for path in paths
+        ):
+            for op, values in update.items():
+                for path in values:
+                    for other in last.values():
+                        other.pop(path, None)
+                last.setdefault(op, {}).update(values)
+            for op in [op for op, values in last.items() if not values]:
+                del last[op]
+            return
+    updates.append(update)
+
+
+def overlay(doc: dict[str, Any], updates: Iterable[Mapping[str, Any]]) -> None:
+    """Apply pending $set/$unset updates to a loaded document."""
+    for update in updates:
+        for op, values in update.items():
+            for path, value in values.items():
+                *parents, key = path.split(".")
+                target = doc
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                if op == "$set":
+                    target[key] = deepcopy(value)
+                else:
+                    target.pop(key, None)
+
+
+@dataclass
+class WriteBehind:
+    """Process-wide buffer of field updates from walkers that aren't durable.
+
+    Updates are coalesced per anchor and written without a transaction every
+    `interval` seconds, or sooner once `max_batch` anchors are pending. Reads
+    in this process see pending updates and durable writes take the pending
+    updates of their anchors, so buffered values never overwrite newer ones.
+    """
+
+    interval: float
+    max_batch: int
+    pending: dict[ObjectId, tuple[type[BaseAnchor], list[dict[str, Any]]]] = field(
+        default_factory=dict
+    )
+    flushing: dict[ObjectId, tuple[type[BaseAnchor], list[dict[str, Any]]]] = field(
+        default_factory=dict
+    )
+    lock: Lock = field(default_factory=Lock)
+    flush_lock: Lock = field(default_factory=Lock)
+    wakeup: Event = field(default_factory=Event)
+    thread: Thread | None = None
+
+    def open(self) -> None:
+        """Start flushing on a background thread."""
+        if self.thread is None:
+            self.thread = Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def close(self) -> None:
+        """Stop the background thread and flush everything pending."""
+        if thread := self.thread:
+            self.thread = None
+            self.wakeup.set()
+            thread.join()
+        self.flush()
+
+    def run(self) -> None:
+        """Flush pending updates until closed."""
+        while self.thread is not None:
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+            self.flush()
+
+    def defer(
+        self, updates: Iterable[tuple[type[BaseAnchor], ObjectId, dict[str, Any]]]
+    ) -> None:
+        """Buffer field updates."""
+        with self.lock:
+            for cls, id, update in updates:
+                coalesce(self.pending.setdefault(id, (cls, []))[1], update)
+            full = len(self.pending) >= self.max_batch
+
+        if self.thread is None:
+            self.flush()
+        elif full:
+            self.wakeup.set()
+
+    def take(self, bulk_write: BulkWrite, ids: Iterable[ObjectId]) -> None:
+        """Move pending updates of anchors ahead of a durable write of them."""
+        if not self.pending and not self.flushing:
+            return
+
+        # an in-flight flush may still hold older values of the same anchors
+        with self.flush_lock, self.lock:
+            for id in ids:
+                if pending := self.pending.pop(id, None):
+                    cls, updates = pending
+                    bulk_write.operations[cls][:0] = [
+                        UpdateOne({"_id": id}, update) for update in updates
+                    ]
+
+    def document(self, doc: dict[str, Any]) -> dict[str, Any]:
+        """Apply pending updates of a loaded document."""
+        if self.pending or self.flushing:
+            with self.lock:
+                updates = [
+                    update
+                    for buffer in (self.flushing, self.pending)
+                    if (pending := buffer.get(doc["_id"]))
+                    for update in pending[1]
+                ]
+            overlay(doc, updates)
+        return doc
+
+    def flush(self) -> None:
+        """Write pending updates in batches."""
+        with self.flush_lock:
+            with self.lock:
+                self.flushing, self.pending = self.pending, {}
+
+            ids = list(self.flushing)
+            for i in range(0, len(ids), self.max_batch):
+                operations: dict[type[BaseAnchor], list[UpdateOne]] = {}
+                for id in ids[i : i + self.max_batch]:
+                    cls, updates = self.flushing[id]
+                    operations.setdefault(cls, []).extend(
+                        UpdateOne({"_id": id}, update) for update in updates
+                    )
+                for cls, ops in operations.items():
+                    try:
+                        cls.Collection.bulk_write(ops)
+                    except Exception:
+                        logger.exception(
+                            f"Error writing {len(ops)} deferred {cls.__name__} updates!"
+                        )
+
+            with self.lock:
+                self.flushing = {}
+
+
+WRITE_BEHIND = WriteBehind(WRITE_BEHIND_INTERVAL, WRITE_BEHIND_MAX_BATCH)
+
+
+@dataclass
+class Purge:
+    """Deletes of the graph a root owns, left to run by MongoDB.purge.
+
+    Runs in the transaction of the purging request or as a background job
+    whose status and deleted count stay readable until the root is purged
+    again.
+    """
+
+    root_id: ObjectId
+    cutoff: ObjectId
+    # nodes of other roots and the refs they may hold to owned edges
+    foreign: list[ObjectId]
+    refs: list[str]
+    status: str = "pending"
+    deleted: int = 0
+
+    @property
+    def filters(self) -> list[tuple[type[BaseAnchor], dict[str, Any]]]:
+        """Get the filters of the owned documents, except the root's."""
+        owned = {"_id": {"$lte": self.cutoff}, "root": self.root_id}
+        return [
+            (NodeAnchor, {**owned, "_id": {"$ne": self.root_id, "$lte": self.cutoff}}),
+            (EdgeAnchor, owned),
+            (WalkerAnchor, owned),
+        ]
+
+    def count(self, session: ClientSession | None = None) -> int:
+        """Count the documents the purge deletes."""
+        return sum(
+            cls.Collection.count(filter, session) for cls, filter in self.filters
+        )
+
+    def run(
+        self, session: ClientSession | None = None
+    ) -> Iterator[tuple[type[BaseAnchor], int]]:
+        """Pull refs to owned edges from other roots' nodes and delete the owned documents.
+
+        Deletes use one delete_many per collection as the returned counts are
+        consumed.
+        """
+        if self.foreign:
+            NodeAnchor.Collection.update_many(
+                {"_id": {"$in": self.foreign}},
+                {"$pull": {"edges": {"$in": self.refs}}},
+                session,
+            )
+        return (
+            (cls, cls.Collection.delete(filter, session).deleted_count)
+            for cls, filter in self.filters
+        )
+
+
 @dataclass
 class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
     """Shelf Handler."""
 
     __session__: ClientSession | None = None
+    write_behind: bool = False
 
-    def populate_data(self, edges: Iterable[EdgeAnchor]) -> None:
+    def populate_data(  # type: ignore[override]
+        self, edges: Iterable[EdgeAnchor], depth: int = 1
+    ) -> None:
         """Populate data to avoid multiple query."""
         if not SINGLE_QUERY:
-            nodes: set[NodeAnchor] = set()
-            for edge in self.find(edges):
-                if edge.source:
-                    nodes.add(edge.source)
-                if edge.target:
-                    nodes.add(edge.target)
-            self.find(nodes)
+            for _ in range(depth):
+                nodes: set[NodeAnchor] = set()
+                for edge in self.find(edges):
+                    if edge.source:
+                        nodes.add(edge.source)
+                    if edge.target:
+                        nodes.add(edge.target)
+                edges = [edge for node in self.find(nodes) for edge in node.edges]
+                if not edges:
+                    break
+
+    def prefetch(self, frontier: Iterable[NodeAnchor], depth: int = 1) -> None:
+        """Load the next levels of a walker's frontier, one query per collection per level."""
+        frontier = list(frontier)
+        # stubs populate from memory once their documents are loaded
+        list(self.find([node for node in frontier if not node.is_populated()]))
+
+        edges: list[EdgeAnchor] = []
+        for node in frontier:
+            if not (index := node.edge_index).prefetched:
+                index.prefetched = True
+                edges.extend(node.edges)
+        if edges:
+            self.populate_data(edges, depth)
+
+    async def apopulate_data(self, edges: Iterable[EdgeAnchor], depth: int = 1) -> None:
+        """Populate data to avoid multiple query using the async driver."""
+        if not SINGLE_QUERY:
+            for _ in range(depth):
+                nodes: set[NodeAnchor] = set()
+                for edge in await self.afind(edges):
+                    if edge.source:
+                        nodes.add(edge.source)
+                    if edge.target:
+                        nodes.add(edge.target)
+                edges = [
+                    edge for node in await self.afind(nodes) for edge in node.edges
+                ]
+                if not edges:
+                    break
+
+    @staticmethod
+    def projection(
+        cl: type[Collection[BaseAnchor]], lazy: tuple[str, ...]
+    ) -> Mapping[str, Any] | None:
+        """Get the projection of a collection leaving lazy architype fields out."""
+        # adjacency is read from the edge collection instead of node documents
+        edges = EDGE_ADJACENCY and cl is NodeAnchor.Collection
+        if not lazy and not edges:
+            return cl.__excluded_obj__
+        projection = {
+            **(cl.__excluded_obj__ or {}),
+            **{f"architype.{name}": False for name in lazy},
+        }
+        if edges:
+            projection["edges"] = False
+        return projection
+
+    def unloaded(
+        self, anchors: Iterable[BaseAnchor]
+    ) -> dict[tuple[type[Collection[BaseAnchor]], tuple[str, ...]], list[ObjectId]]:
+        """Group ids of anchors not yet in memory by collection and lazy fields."""
+        collections: dict[
+            tuple[type[Collection[BaseAnchor]], tuple[str, ...]], list[ObjectId]
+        ] = {}
+        for anchor in anchors:
+            if anchor.id not in self.__mem__ and anchor not in self.__gc__:
+                key = (anchor.Collection, anchor.lazy_fields)
+                coll = collections.get(key)
+                if coll is None:
+                    coll = collections[key] = []
+
+                coll.append(anchor.id)
+        return collections
 
     def find(  # type: ignore[override]
         self,
@@ -58,22 +363,13 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
         if not isinstance(anchors, Iterable):
             anchors = [anchors]
 
-        collections: dict[type[Collection[BaseAnchor]], list[ObjectId]] = {}
-        for anchor in anchors:
-            if anchor.id not in self.__mem__ and anchor not in self.__gc__:
-                coll = collections.get(anchor.Collection)
-                if coll is None:
-                    coll = collections[anchor.Collection] = []
-
-                coll.append(anchor.id)
-
-        for cl, ids in collections.items():
-            for anch_db in cl.find(
-                {
-                    "_id": {"$in": ids},
-                },
+        for (cl, lazy), ids in self.unloaded(anchors).items():
+            for doc in cl.collection().find(
+                {"_id": {"$in": ids}},
+                self.projection(cl, lazy),
                 session=session or self.__session__,
             ):
+                anch_db = cl.__document__(WRITE_BEHIND.document(doc))
                 self.__mem__[anch_db.id] = anch_db
 
         for anchor in anchors:
@@ -84,6 +380,30 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
             ):
                 yield cast(BA, anch_mem)
 
+    async def afind(
+        self,
+        anchors: BA | Iterable[BA],
+        filter: Callable[[Anchor], Anchor] | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[BA]:
+        """Find anchors from datasource by ids with filter using the async driver."""
+        anchors = list(anchors) if isinstance(anchors, Iterable) else [anchors]
+
+        for (cl, lazy), ids in self.unloaded(anchors).items():
+            async for doc in cl.async_collection().find(
+                {"_id": {"$in": ids}}, self.projection(cl, lazy), session=session
+            ):
+                anch_db = cl.__document__(WRITE_BEHIND.document(doc))
+                self.__mem__[anch_db.id] = anch_db
+
+        return [
+            cast(BA, anch_mem)
+            for anchor in anchors
+            if anchor not in self.__gc__
+            and (anch_mem := self.__mem__.get(anchor.id))
+            and (not filter or filter(anch_mem))  # type: ignore[arg-type]
+        ]
+
     def find_one(  # type: ignore[override]
         self,
         anchors: BA | Iterable[BA],
@@ -97,14 +417,181 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
         """Find one by id."""
         data = super().find_by_id(anchor.id)
 
-        if not data and (data := anchor.Collection.find_by_id(anchor.id)):
+        if not data and (doc := self.document(anchor)):
+            data = anchor.Collection.__document__(doc)
             self.__mem__[data.id] = data
 
         return data
 
+    @classmethod
+    def document(
+        cls, anchor: BaseAnchor, session: ClientSession | None = None
+    ) -> dict[str, Any] | None:
+        """Read the document of an anchor as a find would load it.
+
+        Lazy fields and adjacency are projected out and updates still pending
+        in the write-behind buffer are applied.
+        """
+        collection = anchor.Collection
+        if doc := collection.collection().find_one(
+            {"_id": anchor.id},
+            cls.projection(collection, anchor.lazy_fields),
+            session=session,
+        ):
+            return WRITE_BEHIND.document(doc)
+        return None
+
+    def adjacent(
+        self,
+        node: NodeAnchor,
+        dir: EdgeDir,
+        edge_type: type[EdgeArchitype] | None = None,
+        page_size: int = EDGE_PAGE_SIZE,
+    ) -> Iterator[list[EdgeAnchor]]:
+        """Stream the edges of a node page by page from the edge collection.
+
+        Edges are matched by their indexed source and target refs and edge
+        names, and the nodes on both ends of a page are loaded in one batch.
+        Edges of the node not saved yet come last.
+        """
+        ref_id = node.ref_id
+        query: dict[str, Any]
+        match dir:
+            case EdgeDir.OUT:
+                query = {"source": ref_id}
+            case EdgeDir.IN:
+                query = {"target": ref_id}
+            case _:
+                query = {"$or": [{"source": ref_id}, {"target": ref_id}]}
+        if edge_type and edge_type is not EdgeArchitype:
+            query["name"] = {"$in": edge_names(edge_type)}
+
+        cl = EdgeAnchor.Collection
+        seen: set[ObjectId] = set()
+        page: list[EdgeAnchor] = []
+        docs = (
+            cl.collection()
+            .find(
+                query,
+                cl.__excluded_obj__,
+                session=self.__session__,
+                batch_size=page_size,
+            )
+            .sort("_id")
+        )
+        for doc in docs:
+            seen.add(doc["_id"])
+            if not (anchor := self.__mem__.get(doc["_id"])):
+                anchor = cl.__document__(WRITE_BEHIND.document(doc))
+                if anchor in self.__gc__:
+                    continue
+                self.__mem__[anchor.id] = anchor
+            if isinstance(anchor, EdgeAnchor) and anchor.state.deleted is None:
+                page.append(anchor)
+            if len(page) >= page_size:
+                yield self.with_nodes(page)
+                page = []
+
+        page.extend(edge for edge in node.edges if edge.id not in seen)
+        if page:
+            yield self.with_nodes(page)
+
+    def with_nodes(self, edges: list[EdgeAnchor]) -> list[EdgeAnchor]:
+        """Load the nodes on both ends of edges."""
+        list(
+            self.find(
+                [node for edge in edges for node in (edge.source, edge.target) if node]
+            )
+        )
+        return edges
+
+    def hydrate(self, anchor: NodeAnchor) -> None:
+        """Load the lazy fields of a node and of its loaded siblings in one query."""
+        siblings = {anchor.id: anchor}
+        for anch in self.__mem__.values():
+            if (
+                isinstance(anch, NodeAnchor)
+                and anch.name == anchor.name
+                and anch.is_populated()
+                and anch.state.unloaded
+            ):
+                siblings[anch.id] = anch
+
+        names = set[str]().union(*(anch.state.unloaded for anch in siblings.values()))
+        for doc in NodeAnchor.Collection.collection().find(
+            {"_id": {"$in": list(siblings)}},
+            {f"architype.{name}": True for name in names},
+            session=self.__session__,
+        ):
+            data = WRITE_BEHIND.document(doc).get("architype", {})
+            siblings[doc["_id"]].hydrate(data)
+
+        # a node already deleted from the datasource falls back to defaults
+        if anchor.state.unloaded:
+            anchor.hydrate({})
+
+    def purge(self, root: NodeAnchor, session: ClientSession | None = None) -> "Purge":
+        """Detach every node, edge and walker a root owns, except the root itself.
+
+        Owned nodes and edges are dropped from memory and owned edges detached
+        from the root and from loaded nodes of other roots right away. The
+        returned purge deletes the documents and pulls the refs nodes of other
+        roots hold to owned edges. Anchors created after the purge started are
+        kept.
+        """
+        cutoff = ObjectId()
+        owned: set[ObjectId] = set()
+        ends: dict[ObjectId, list[str]] = {}
+        for doc in EdgeAnchor.Collection.collection().find(
+            {"_id": {"$lte": cutoff}, "root": root.id},
+            {"name": True, "source": True, "target": True},
+            session=session,
+        ):
+            owned.add(doc["_id"])
+            for end in (doc.get("source"), doc.get("target")):
+                if end:
+                    ends.setdefault(NodeAnchor.ref(end).id, []).append(
+                        f"e:{doc.get('name') or ''}:{doc['_id']}"
+                    )
+
+        loaded = [
+            id
+            for id, anchor in self.__mem__.items()
+            if isinstance(anchor, (NodeAnchor, EdgeAnchor))
+            and anchor is not root
+            and anchor.root == root.id
+        ]
+        owned.update(loaded)
+        self.remove(loaded)
+
+        nodes = {root.id: root}
+        for id, anchor in self.__mem__.items():
+            if isinstance(anchor, NodeAnchor) and anchor.is_populated():
+                nodes.setdefault(id, anchor)
+        for node in nodes.values():
+            for edge in list(node.edges):
+                if edge.id in owned:
+                    Jac.remove_edge(node=node, edge=edge)
+                    node.disconnect_edge(edge)
+
+        foreign: list[ObjectId] = []
+        refs: set[str] = set()
+        ends.pop(root.id, None)
+        if ends and not EDGE_ADJACENCY:
+            for doc in NodeAnchor.Collection.collection().find(
+                {"_id": {"$in": list(ends)}, "root": {"$ne": root.id}},
+                {"_id": True},
+                session=session,
+            ):
+                foreign.append(doc["_id"])
+                refs.update(ends[doc["_id"]])
+
+        return Purge(root.id, cutoff, foreign, sorted(refs))
+
     def close(self) -> None:
         """Close memory handler."""
         bulk_write = self.get_bulk_write()
+        self.write_deferred(bulk_write)
 
         if bulk_write.has_operations:
             if session := self.__session__:
@@ -115,6 +602,27 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
 
         super().close()
 
+    async def aclose(self) -> None:
+        """Close memory handler writing with the async driver."""
+        bulk_write = self.get_bulk_write()
+        self.write_deferred(bulk_write)
+
+        if bulk_write.has_operations:
+            async with await AsyncCollection.get_session() as session:
+                async with session.start_transaction():
+                    await bulk_write.aexecute(session)
+
+        super().close()
+
+    def write_deferred(self, bulk_write: BulkWrite) -> None:
+        """Hand deferred updates to write-behind or take pending ones into a durable write."""
+        if bulk_write.deferred:
+            WRITE_BEHIND.defer(bulk_write.deferred)
+        if bulk_write.has_operations:
+            WRITE_BEHIND.take(
+                bulk_write, [*self.__mem__, *(anchor.id for anchor in self.__gc__)]
+            )
+
     def sync_mem_to_db(self, bulk_write: BulkWrite, keys: Iterable[ObjectId]) -> None:
         """Manually sync memory to db."""
         for key in keys:
@@ -145,7 +653,7 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
 
     def get_bulk_write(self) -> BulkWrite:
         """Sync memory to database."""
-        bulk_write = BulkWrite()
+        bulk_write = BulkWrite(write_behind=self.write_behind)
 
         for anchor in self.__gc__:
             match anchor:
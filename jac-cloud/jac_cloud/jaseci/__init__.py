@@ -50,8 +50,12 @@ class FastAPI:
             @asynccontextmanager
             async def lifespan(app: _FaststAPI) -> AsyncGenerator[None, _FaststAPI]:
                 from .datasources import Collection
+                from .security import SESSION_CACHE
+                from ..core.memory import WRITE_BEHIND
 
                 Collection.apply_indexes()
+                SESSION_CACHE.open()
+                WRITE_BEHIND.open()
 
                 async with create_task_group() as task_group:
                     await WEBSOCKET_MANAGER.open_broadcaster(task_group)
@@ -60,6 +64,9 @@ class FastAPI:
 
                     await WEBSOCKET_MANAGER.close_broadcaster(task_group)
 
+                SESSION_CACHE.close()
+                WRITE_BEHIND.close()
+
             cls.__app__ = _FaststAPI(lifespan=lifespan)
 
             cls.__app__.add_middleware(
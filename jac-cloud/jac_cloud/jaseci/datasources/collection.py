@@ -189,6 +189,13 @@ class Collection(Generic[T]):
 
         return cls.__collection_obj__
 
+    @classmethod
+    def async_collection(cls) -> AsyncIOMotorCollection:
+        """Return the async driver's connection to the same collection."""
+        return AsyncCollection.get_collection(
+            getattr(cls, "__collection__", None) or cls.__name__.lower()
+        )
+
     @classmethod
     def insert_one(
         cls,
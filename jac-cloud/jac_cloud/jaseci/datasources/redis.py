@@ -1,14 +1,14 @@
 """Jaseci Redis."""
 
 from os import getenv
-from typing import Any
+from typing import Any, Callable
 
 from fakeredis import FakeRedis
 
 from orjson import dumps, loads
 
 from redis.asyncio.client import Redis as _AsyncRedis
-from redis.client import Redis as _Redis
+from redis.client import PubSubWorkerThread, Redis as _Redis
 
 from ..utils import logger
 
@@ -148,6 +148,30 @@ class Redis:
             logger.exception(f"Error deleting key {key} from {cls.__table__}")
             return False
 
+    @classmethod
+    def publish(cls, message: str) -> bool:
+        """Publish message to group channel."""
+        try:
+            redis = cls.get_rd()
+            redis.publish(cls.__table__, message)
+            return True
+        except Exception:
+            logger.exception(f"Error publishing {message} to {cls.__table__}")
+            return False
+
+    @classmethod
+    def subscribe(cls, handler: Callable[[str], None]) -> PubSubWorkerThread | None:
+        """Run handler on a background thread for every message of group channel."""
+        try:
+            pubsub = cls.get_rd().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(
+                **{cls.__table__: lambda message: handler(message["data"].decode())}
+            )
+            return pubsub.run_in_thread(sleep_time=1, daemon=True)
+        except Exception:
+            logger.exception(f"Error subscribing to {cls.__table__}")
+            return None
+
 
 class CodeRedis(Redis):
     """Code Memory Interface.
@@ -1,6 +1,9 @@
 """Healthz APIs."""
 
 from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
+
+from ..security import SESSION_CACHE
 
 router = APIRouter(prefix="/healthz", tags=["Monitoring APIs"])
 
@@ -9,3 +12,9 @@ router = APIRouter(prefix="/healthz", tags=["Monitoring APIs"])
 async def healthz() -> Response:
     """Healthz API."""
     return Response()
+
+
+@router.get("/session_cache", status_code=status.HTTP_200_OK)
+async def session_cache() -> ORJSONResponse:
+    """Session cache metrics API."""
+    return ORJSONResponse(SESSION_CACHE.metrics())
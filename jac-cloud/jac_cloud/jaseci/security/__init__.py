@@ -1,7 +1,11 @@
 """Jaseci Securities."""
 
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field
 from os import getenv
-from typing import Any
+from threading import Lock
+from typing import Any, Mapping
 
 from asyncer import syncify
 
@@ -13,10 +17,13 @@ from fastapi.security import APIKeyHeader, APIKeyQuery, HTTPBearer
 
 from jwt import decode, encode
 
+from redis.client import PubSubWorkerThread
+
 from ..datasources.redis import CodeRedis, TokenRedis, WebhookRedis
 from ..models import User as BaseUser, Webhook
 from ..utils import logger, random_string, utc_timestamp
-from ...core.architype import NodeAnchor
+from ...core.architype import NodeAnchor, Root
+from ...core.memory import MongoDB
 
 
 TOKEN_SECRET = getenv("TOKEN_SECRET", random_string(50))
@@ -24,9 +31,150 @@ TOKEN_ALGORITHM = getenv("TOKEN_ALGORITHM", "HS256")
 VERIFICATION_CODE_TIMEOUT = int(getenv("VERIFICATION_CODE_TIMEOUT") or "24")
 RESET_CODE_TIMEOUT = int(getenv("RESET_CODE_TIMEOUT") or "24")
 TOKEN_TIMEOUT = int(getenv("TOKEN_TIMEOUT") or "12")
+SESSION_CACHE_SIZE = int(getenv("SESSION_CACHE_SIZE") or "0")
 User = BaseUser.model()
 
 
+@dataclass
+class SessionCache:
+    """Process-wide LRU of authenticated sessions keyed by token.
+
+    Sessions are kept until their token expires and are dropped as soon as
+    any process invalidates the user's tokens or changes their root, which is
+    announced through the token channel. Roots are kept as documents so every
+    request gets its own anchor.
+    """
+
+    size: int
+    sessions: OrderedDict[str, tuple[float, BaseUser, ObjectId]] = field(
+        default_factory=OrderedDict
+    )
+    roots: dict[ObjectId, Mapping[str, Any]] = field(default_factory=dict)
+    # sessions per root, a root document is kept while any of them is cached
+    refs: dict[ObjectId, int] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    lock: Lock = field(default_factory=Lock)
+    subscriber: PubSubWorkerThread | None = None
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of requests authenticated from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def metrics(self) -> dict[str, Any]:
+        """Return cache counters."""
+        return {
+            "size": len(self.sessions),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def open(self) -> None:
+        """Listen for invalidations from other processes."""
+        if self.size > 0 and self.subscriber is None:
+            self.subscriber = TokenRedis.subscribe(self.receive)
+
+    def close(self) -> None:
+        """Stop listening for invalidations."""
+        if self.subscriber is not None:
+            self.subscriber.stop()
+            self.subscriber = None
+
+    def get(self, token: str) -> tuple[BaseUser, NodeAnchor] | None:
+        """Get the user and a fresh root anchor of a cached session."""
+        if self.size <= 0:
+            return None
+
+        with self.lock:
+            if (session := self.sessions.get(token)) is None:
+                self.misses += 1
+                return None
+            expiration, user, root_id = session
+            if (
+                expiration <= utc_timestamp()
+                or (doc := self.roots.get(root_id)) is None
+            ):
+                self.drop(token)
+                self.misses += 1
+                return None
+            self.sessions.move_to_end(token)
+            self.hits += 1
+
+        return user, NodeAnchor.Collection.__document__(deepcopy(doc))
+
+    def load(self, token: str, expiration: float, user: BaseUser) -> NodeAnchor | None:
+        """Find the root of an authenticated user and cache their session."""
+        if self.size <= 0:
+            return NodeAnchor.Collection.find_by_id(user.root_id)
+
+        if not (doc := MongoDB.document(NodeAnchor.ref(f"n::{user.root_id}"))):
+            return None
+
+        with self.lock:
+            if token in self.sessions:
+                self.drop(token)
+            self.sessions[token] = (expiration, user, user.root_id)
+            self.refs[user.root_id] = self.refs.get(user.root_id, 0) + 1
+            self.roots[user.root_id] = doc
+            while len(self.sessions) > self.size:
+                self.drop(next(iter(self.sessions)))
+                self.evictions += 1
+
+        return NodeAnchor.Collection.__document__(deepcopy(doc))
+
+    def invalidate(self, user_id: ObjectId) -> None:
+        """Drop every session of a user, in every process."""
+        if self.size > 0:
+            self.receive(f"user:{user_id}")
+            TokenRedis.publish(f"user:{user_id}")
+
+    def invalidate_roots(self, mem: MongoDB) -> None:
+        """Drop the cached documents of roots changed in a context, in every process."""
+        if self.size > 0:
+            for id, anchor in list(mem.__mem__.items()):
+                if (
+                    isinstance(anchor, NodeAnchor)
+                    and anchor.is_populated()
+                    and isinstance(anchor.architype, Root)
+                    and (anchor.state.changes or anchor.has_changed())
+                ):
+                    self.receive(f"root:{id}")
+                    TokenRedis.publish(f"root:{id}")
+
+    def receive(self, message: str) -> None:
+        """Apply an invalidation message."""
+        kind, _, id = message.partition(":")
+        with self.lock:
+            if kind == "root":
+                self.roots.pop(ObjectId(id), None)
+            elif kind == "user":
+                for token, (_, user, _) in list(self.sessions.items()):
+                    if str(user.id) == id:
+                        self.drop(token)
+                        self.invalidations += 1
+
+    def drop(self, token: str) -> None:
+        """Remove a session and, once no session uses it, its root document.
+
+        Callers hold the lock.
+        """
+        root_id = self.sessions.pop(token)[2]
+        if (refs := self.refs.pop(root_id, 1) - 1) > 0:
+            self.refs[root_id] = refs
+        else:
+            self.roots.pop(root_id, None)
+
+
+SESSION_CACHE = SessionCache(SESSION_CACHE_SIZE)
+
+
 def encrypt(data: dict) -> str:
     """Encrypt data."""
     return encode(data, key=TOKEN_SECRET, algorithm=TOKEN_ALGORITHM)
@@ -84,6 +232,7 @@ def create_token(user: dict[str, Any]) -> str:
 def invalidate_token(user_id: ObjectId) -> None:
     """Invalidate token of current user."""
     TokenRedis.hdelete_rgx(f"{user_id}:*")
+    SESSION_CACHE.invalidate(user_id)
 
 
 def validate_request(request: Request, walker: str, node: str) -> None:
@@ -94,21 +243,31 @@ def validate_request(request: Request, walker: str, node: str) -> None:
         raise HTTPException(status_code=403)
 
 
+def authenticate_token(token: str) -> tuple[BaseUser, NodeAnchor] | None:
+    """Get the user and root of a valid token."""
+    if session := SESSION_CACHE.get(token):
+        return session
+    if (
+        (decrypted := decrypt(token))
+        and decrypted["expiration"] > utc_timestamp()
+        and TokenRedis.hget(f"{decrypted['id']}:{token}")
+        and (user := User.Collection.find_by_id(decrypted["id"]))
+        and (root := SESSION_CACHE.load(token, decrypted["expiration"], user))
+    ):
+        return user, root
+    return None
+
+
 def authenticate(request: Request) -> None:
     """Authenticate current request and attach authenticated user and their root."""
     authorization = request.headers.get("Authorization")
-    if authorization and authorization.lower().startswith("bearer"):
-        token = authorization[7:]
-        if (
-            (decrypted := decrypt(token))
-            and decrypted["expiration"] > utc_timestamp()
-            and TokenRedis.hget(f"{decrypted['id']}:{token}")
-            and (user := User.Collection.find_by_id(decrypted["id"]))
-            and (root := NodeAnchor.Collection.find_by_id(user.root_id))
-        ):
-            request._user = user  # type: ignore[attr-defined]
-            request._root = root  # type: ignore[attr-defined]
-            return
+    if (
+        authorization
+        and authorization.lower().startswith("bearer")
+        and (session := authenticate_token(authorization[7:]))
+    ):
+        request._user, request._root = session  # type: ignore[attr-defined]
+        return
 
     raise HTTPException(status_code=401)
 
@@ -183,20 +342,12 @@ def authenticate_websocket(
 ) -> bool:
     """Authenticate websocket connection."""
     if (
-        authorization or (authorization := websocket.headers.get("Authorization"))
-    ) and authorization.lower().startswith("bearer"):
-        token = authorization[7:]
-        decrypted = decrypt(token)
-        if (
-            decrypted
-            and decrypted["expiration"] > utc_timestamp()
-            and TokenRedis.hget(f"{decrypted['id']}:{token}")
-            and (user := User.Collection.find_by_id(decrypted["id"]))
-            and (root := NodeAnchor.Collection.find_by_id(user.root_id))
-        ):
-            websocket._user = user  # type: ignore[attr-defined]
-            websocket._root = root  # type: ignore[attr-defined]
-            return True
+        (authorization or (authorization := websocket.headers.get("Authorization")))
+        and authorization.lower().startswith("bearer")
+        and (session := authenticate_token(authorization[7:]))
+    ):
+        websocket._user, websocket._root = session  # type: ignore[attr-defined]
+        return True
     return False
 
 
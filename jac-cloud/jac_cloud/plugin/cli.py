@@ -38,7 +38,7 @@ class JacCmd:
             mod = mod[:-4]
 
             FastAPI.enable()
-            mach = JacMachineState(base)
+            mach = JacMachineState(base, cachable=True)
 
             if filename.endswith(".jac"):
                 Jac.jac_import(
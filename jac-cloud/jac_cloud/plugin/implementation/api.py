@@ -26,6 +26,7 @@ from fastapi import (
     Response,
     UploadFile,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import ORJSONResponse
 
 from jaclang.runtimelib.feature import JacFeature as Jac
@@ -43,6 +44,8 @@ from ...jaseci.security import authenticator, generate_webhook_auth, validate_re
 from ...jaseci.utils import log_entry, log_exit
 
 DISABLE_AUTO_ENDPOINT = getenv("DISABLE_AUTO_ENDPOINT") == "true"
+# motor can't reach the local database
+ASYNC_ENDPOINT = getenv("ASYNC_ENDPOINT") == "true" and bool(getenv("DATABASE_HOST"))
 PATH_VARIABLE_REGEX = compile(r"{([^\}]+)}")
 FILE_TYPES = {
     UploadFile,
@@ -78,6 +81,8 @@ class DefaultSpecs:
     private: bool = False
     webhook: dict | None = None
     entry_type: EntryType = EntryType.BOTH
+    durable: bool = True
+    prefetch: int = 1
     tags: list[str] | None = None
     status_code: int | None = None
     summary: str | None = None
@@ -124,7 +129,10 @@ def gen_model_field(cls: type, field: Field, is_file: bool = False) -> tuple[typ
 
 def populate_apis(cls: Type[WalkerArchitype]) -> None:
     """Generate FastAPI endpoint based on WalkerArchitype class."""
-    if (specs := get_specs(cls)) and not specs.private:
+    if specs := get_specs(cls):
+        cls.__prefetch__ = specs.prefetch
+
+    if specs and not specs.private:
         path: str = specs.path or ""
         methods: list = specs.methods or []
         as_query: str | list[str] = specs.as_query or []
@@ -132,6 +140,7 @@ def populate_apis(cls: Type[WalkerArchitype]) -> None:
         auth: bool = specs.auth or False
         webhook: dict | None = specs.webhook
         entry_type: EntryType = specs.entry_type
+        durable: bool = specs.durable
         tags: list[str] | None = specs.tags
         status_code: int | None = specs.status_code
         summary: str | None = specs.summary
@@ -212,6 +221,47 @@ def populate_apis(cls: Type[WalkerArchitype]) -> None:
 
         payload_model = create_model(f"{cls.__name__.lower()}_request_model", **payload)
 
+        def parse_body(body: Any) -> dict[str, Any] | ORJSONResponse:  # noqa: ANN401
+            if isinstance(body, bytes) and body_model:
+                body = loads(body)
+                try:
+                    return body_model(**body).__dict__
+                except ValidationError as e:
+                    return ORJSONResponse({"detail": e.errors()})
+            return body.__dict__ if body else {}
+
+        def authorize(request: Request, jctx: JaseciContext) -> bool:
+            validate_request(request, cls.__name__, jctx.entry_node.name or "root")
+            return Jac.check_read_access(jctx.entry_node)
+
+        def walk(
+            jctx: JaseciContext, payload: BaseModel, body: dict[str, Any]
+        ) -> WalkerAnchor:
+            query = payload.query.__dict__  # type: ignore[attr-defined]
+            files = payload.files.__dict__  # type: ignore[attr-defined]
+
+            wlk: WalkerAnchor = cls(**body, **query, **files).__jac__
+            Jac.spawn(wlk.architype, jctx.entry_node.architype)
+            return wlk
+
+        def respond(
+            jctx: JaseciContext, wlk: WalkerAnchor | None, log: dict[str, Any]
+        ) -> ORJSONResponse:
+            if wlk is None:
+                error = {
+                    "error": f"You don't have access on target entry {jctx.entry_node.ref_id}!"
+                }
+                log_exit(error, log)
+                raise HTTPException(403, error)
+
+            if jctx.custom is not MISSING:
+                return jctx.custom
+
+            resp = jctx.response(wlk.returns)
+            log_exit(resp, log)
+
+            return ORJSONResponse(resp, jctx.status)
+
         def api_entry(
             request: Request,
             node: str | None,
@@ -224,51 +274,67 @@ def populate_apis(cls: Type[WalkerArchitype]) -> None:
                 node,
             )
 
-            query = payload.query.__dict__  # type: ignore[attr-defined]
-            files = payload.files.__dict__  # type: ignore[attr-defined]
-
-            if body := getattr(payload, "body", None):
-                if isinstance(body, BaseUploadFile) and body_model:
-                    body = loads(syncify(body.read)())
-                    try:
-                        body = body_model(**body).__dict__
-                    except ValidationError as e:
-                        return ORJSONResponse({"detail": e.errors()})
-                else:
-                    body = body.__dict__
-            else:
-                body = {}
+            if isinstance(body := getattr(payload, "body", None), BaseUploadFile):
+                body = syncify(body.read)()
+            if isinstance(body := parse_body(body), ORJSONResponse):
+                return body
 
             jctx = JaseciContext.create(request, NodeAnchor.ref(node) if node else None)
+            jctx.mem.write_behind = not durable
 
-            validate_request(request, cls.__name__, jctx.entry_node.name or "root")
+            wlk = walk(jctx, payload, body) if authorize(request, jctx) else None
+            jctx.close()
 
-            if Jac.check_read_access(jctx.entry_node):
-                wlk: WalkerAnchor = cls(**body, **query, **files).__jac__
-                Jac.spawn(wlk.architype, jctx.entry_node.architype)
-                jctx.close()
+            return respond(jctx, wlk, log)
 
-                if jctx.custom is not MISSING:
-                    return jctx.custom
+        def api_root(
+            request: Request,
+            payload: payload_model = Depends(),  # type: ignore # noqa: B008
+        ) -> Response:
+            return api_entry(request, None, payload)
 
-                resp = jctx.response(wlk.returns)
-                log_exit(resp, log)
+        async def async_api_entry(
+            request: Request,
+            node: str | None,
+            payload: payload_model = Depends(),  # type: ignore # noqa: B008
+        ) -> ORJSONResponse:
+            log = log_entry(
+                cls.__name__,
+                user.email if (user := getattr(request, "_user", None)) else None,
+                cast(BaseModel, payload).model_dump(),
+                node,
+            )
 
-                return ORJSONResponse(resp, jctx.status)
-            else:
-                error = {
-                    "error": f"You don't have access on target entry {jctx.entry_node.ref_id}!"
-                }
-                jctx.close()
+            if isinstance(body := getattr(payload, "body", None), BaseUploadFile):
+                body = await body.read()
+            if isinstance(body := parse_body(body), ORJSONResponse):
+                return body
 
-                log_exit(error, log)
-                raise HTTPException(403, error)
+            jctx = await JaseciContext.acreate(
+                request, NodeAnchor.ref(node) if node else None
+            )
+            jctx.mem.write_behind = not durable
+
+            wlk = None
+            # access checks and walker code stay sync, so run them off the event
+            # loop once what the walker visits first is loaded
+            if await run_in_threadpool(authorize, request, jctx):
+                await jctx.mem.apopulate_data(
+                    jctx.entry_node.edges, max(cls.__prefetch__, 1)
+                )
+                wlk = await run_in_threadpool(walk, jctx, payload, body)
+            await jctx.aclose()
 
-        def api_root(
+            return respond(jctx, wlk, log)
+
+        async def async_api_root(
             request: Request,
             payload: payload_model = Depends(),  # type: ignore # noqa: B008
         ) -> Response:
-            return api_entry(request, None, payload)
+            return await async_api_entry(request, None, payload)
+
+        entry_endpoint: Callable = async_api_entry if ASYNC_ENDPOINT else api_entry
+        root_endpoint: Callable = async_api_root if ASYNC_ENDPOINT else api_root
 
         if webhook is None:
             target_authenticator = authenticator
@@ -323,10 +389,12 @@ def populate_apis(cls: Type[WalkerArchitype]) -> None:
                         settings["dependencies"] = cast(list, target_authenticator)
 
                     if entry_type.upper() in ROOT_ENTRIES:
-                        walker_method(f"/{cls.__name__}{path}", **settings)(api_root)
+                        walker_method(f"/{cls.__name__}{path}", **settings)(
+                            root_endpoint
+                        )
                     if entry_type.upper() in NODE_ENTRIES:
                         walker_method(f"/{cls.__name__}/{{node}}{path}", **settings)(
-                            api_entry
+                            entry_endpoint
                         )
 
 
@@ -341,6 +409,8 @@ def specs(
     private: bool = False,
     webhook: dict | None = None,
     entry_type: EntryType = EntryType.BOTH,
+    durable: bool = True,
+    prefetch: int = 1,
     tags: list[str] | None = None,
     status_code: int | None = None,
     summary: str | None = None,
@@ -363,6 +433,8 @@ def specs(
             _private = private
             _webhook = webhook
             _entry_type = entry_type
+            _durable = durable
+            _prefetch = prefetch
             _tags = tags
             _status_code = status_code
             _summary = summary
@@ -382,6 +454,8 @@ def specs(
                 private: bool = _private
                 webhook: dict | None = _webhook
                 entry_type: EntryType = _entry_type
+                durable: bool = _durable
+                prefetch: int = _prefetch
                 tags: list[str] | None = _tags
                 status_code: int | None = _status_code
                 summary: str | None = _summary
@@ -1,18 +1,24 @@
 """Jac Language Features."""
 
+from collections import deque
 from contextlib import suppress
-from typing import Callable, Type
+from os import getenv
+from threading import Thread
+from typing import Callable, Iterator, Type
+
+from bson import ObjectId
 
 from jaclang.compiler.constant import EdgeDir
-from jaclang.runtimelib.architype import Architype
+from jaclang.runtimelib.architype import Architype, WalkerDispatch
 from jaclang.runtimelib.feature import JacFeature as Jac, JacFeatureImpl, hookimpl
-from jaclang.runtimelib.utils import all_issubclass
 
 from ..core.architype import (
     AccessLevel,
     Anchor,
     AnchorState,
     BaseAnchor,
+    BulkWrite,
+    EDGE_ADJACENCY,
     EdgeAnchor,
     EdgeArchitype,
     GenericEdge,
@@ -21,11 +27,43 @@ from ..core.architype import (
     ObjectArchitype,
     Permission,
     Root,
-    WalkerAnchor,
     WalkerArchitype,
 )
 from ..core.context import ExecutionContext, JaseciContext
+from ..core.memory import Purge
 from ..jaseci import FastAPI
+from ..jaseci.datasources import Collection
+from ..jaseci.utils import logger
+
+RESET_GRAPH_BACKGROUND = getenv("RESET_GRAPH_BACKGROUND") == "true"
+# latest background purge of each root of this process
+PURGES: dict[ObjectId, Purge] = {}
+
+
+def log_purge(
+    root_id: ObjectId, deletes: Iterator[tuple[type[BaseAnchor], int]]
+) -> int:
+    """Run graph purge deletes, logging each count, and return the total."""
+    deleted_count = 0
+    for cls, count in deletes:
+        logger.info(f"Purged {count} {cls.__name__} of root {root_id}")
+        deleted_count += count
+    return deleted_count
+
+
+def run_purge(purge: Purge) -> None:
+    """Run a background purge in its own transaction, tracking its status."""
+    purge.status = "running"
+    try:
+        with Collection.get_session() as session, session.start_transaction():
+            deleted_count = log_purge(purge.root_id, purge.run(session))
+            BulkWrite.commit(session)
+    except Exception:
+        logger.exception(f"Error purging root {purge.root_id}!")
+        purge.status = "failed"
+        return
+    purge.deleted = deleted_count
+    purge.status = "done"
 
 
 class JacAccessValidationPlugin:
@@ -55,6 +93,7 @@ class JacAccessValidationPlugin:
             access.anchors[ref_id] = level
             anchor._set.update({f"access.roots.anchors.{ref_id}": level.name})
             anchor._unset.pop(f"access.roots.anchors.{ref_id}", None)
+            JaseciContext.get().access_levels.clear()
 
     @staticmethod
     @hookimpl
@@ -79,6 +118,7 @@ class JacAccessValidationPlugin:
         ):
             anchor._unset.update({f"access.roots.anchors.{ref_id}": True})
             anchor._set.pop(f"access.roots.anchors.{ref_id}", None)
+            JaseciContext.get().access_levels.clear()
 
     @staticmethod
     @hookimpl
@@ -94,6 +134,7 @@ class JacAccessValidationPlugin:
         if isinstance(anchor, BaseAnchor) and level != anchor.access.all:
             anchor.access.all = level
             anchor._set.update({"access.all": level.name})
+            JaseciContext.get().access_levels.clear()
 
     @staticmethod
     @hookimpl
@@ -108,52 +149,124 @@ class JacAccessValidationPlugin:
         if isinstance(anchor, BaseAnchor) and anchor.access.all > AccessLevel.NO_ACCESS:
             anchor.access.all = AccessLevel.NO_ACCESS
             anchor._set.update({"access.all": AccessLevel.NO_ACCESS.name})
+            JaseciContext.get().access_levels.clear()
 
     @staticmethod
     @hookimpl
-    def check_access_level(to: Anchor) -> AccessLevel:
-        """Access validation."""
+    def check_read_access_many(to: list[Anchor]) -> list[bool]:
+        """Read Access Validation of several anchors sharing one context."""
         if not FastAPI.is_enabled():
-            return JacFeatureImpl.check_access_level(to=to)
-
-        if not to.persistent:
-            return AccessLevel.WRITE
+            return JacFeatureImpl.check_read_access_many(to=to)
 
-        from ..core.context import JaseciContext
+        if not any(anchor.persistent for anchor in to):
+            return [True] * len(to)
 
         jctx = JaseciContext.get()
+        levels = jctx.access_levels
+        root_id = jctx.root.id
+
+        readable = []
+        for anchor in to:
+            if not anchor.persistent:
+                readable.append(True)
+                continue
+            if (level := levels.get(key := (root_id, anchor.id))) is None:
+                level = levels[key] = access_level(jctx, anchor)
+            readable.append(level > AccessLevel.NO_ACCESS)
+        return readable
 
-        jroot = jctx.root
+    @staticmethod
+    @hookimpl
+    def check_access_level(to: Anchor) -> AccessLevel:
+        """Access validation."""
+        if not FastAPI.is_enabled():
+            return JacFeatureImpl.check_access_level(to=to)
 
-        # if current root is system_root
-        # if current root id is equal to target anchor's root id
-        # if current root is the target anchor
-        if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
+        if not to.persistent:
             return AccessLevel.WRITE
 
-        access_level = AccessLevel.NO_ACCESS
-
-        # if target anchor have set access.all
-        if (to_access := to.access).all > AccessLevel.NO_ACCESS:
-            access_level = to_access.all
-
-        # if target anchor's root have set allowed roots
-        # if current root is allowed to the whole graph of target anchor's root
-        if to.root and isinstance(
-            to_root := jctx.mem.find_by_id(NodeAnchor.ref(f"n::{to.root}")), Anchor
-        ):
-            if to_root.access.all > access_level:
-                access_level = to_root.access.all
-
-            if (level := to_root.access.roots.check(jroot.ref_id)) is not None:
-                access_level = level
-
-        # if target anchor have set allowed roots
-        # if current root is allowed to target anchor
-        if (level := to_access.roots.check(jroot.ref_id)) is not None:
-            access_level = level
-
-        return access_level
+        return access_level(JaseciContext.get(), to)
+
+
+def access_level(jctx: JaseciContext, to: Anchor) -> AccessLevel:
+    """Get the access level of the context's current root to a persistent anchor."""
+    jroot = jctx.root
+
+    # if current root is system_root
+    # if current root id is equal to target anchor's root id
+    # if current root is the target anchor
+    if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
+        return AccessLevel.WRITE
+
+    level = AccessLevel.NO_ACCESS
+
+    # if target anchor have set access.all
+    if (to_access := to.access).all > AccessLevel.NO_ACCESS:
+        level = to_access.all
+
+    # if target anchor's root have set allowed roots
+    # if current root is allowed to the whole graph of target anchor's root
+    if to.root and isinstance(
+        to_root := jctx.mem.find_by_id(NodeAnchor.ref(f"n::{to.root}")), Anchor
+    ):
+        if to_root.access.all > level:
+            level = to_root.access.all
+
+        if (root_level := to_root.access.roots.check(jroot.ref_id)) is not None:
+            level = root_level
+
+    # if target anchor have set allowed roots
+    # if current root is allowed to target anchor
+    if (root_level := to_access.roots.check(jroot.ref_id)) is not None:
+        level = root_level
+
+    return level
+
+
+def paged_edges(
+    node: NodeAnchor,
+    dir: EdgeDir,
+    filter: Callable[[EdgeArchitype], bool] | None,
+    target_obj: list[NodeArchitype] | None,
+    edge_type: Type[EdgeArchitype] | None,
+    has_access: Callable[[list[Anchor]], list[bool]],
+) -> Iterator[tuple[EdgeAnchor, NodeAnchor]]:
+    """Stream the edges of a node with the node on their other end.
+
+    Edges come from the edge collection one page at a time, and access to the
+    other nodes of a page is checked in one batch.
+    """
+    for page in JaseciContext.get().mem.adjacent(node, dir, edge_type):
+        matches: list[tuple[EdgeAnchor, NodeAnchor]] = []
+        for anchor in page:
+            if (
+                (source := anchor.source)
+                and (target := anchor.target)
+                and (not filter or filter(anchor.architype))
+                and (not edge_type or isinstance(anchor.architype, edge_type))
+                and source.architype
+                and target.architype
+            ):
+                if (
+                    dir in [EdgeDir.OUT, EdgeDir.ANY]
+                    and node == source
+                    and (not target_obj or target.architype in target_obj)
+                ):
+                    matches.append((anchor, target))
+                if (
+                    dir in [EdgeDir.IN, EdgeDir.ANY]
+                    and node == target
+                    and (not target_obj or source.architype in target_obj)
+                ):
+                    matches.append((anchor, source))
+        if matches:
+            yield from (
+                match
+                for match, allowed in zip(
+                    matches, has_access([other for _, other in matches])
+                )
+                if allowed
+            )
 
 
 class JacNodePlugin:
@@ -166,14 +279,28 @@ class JacNodePlugin:
         dir: EdgeDir,
         filter: Callable[[EdgeArchitype], bool] | None,
         target_obj: list[NodeArchitype] | None,
+        edge_type: Type[EdgeArchitype] | None,
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
-        if FastAPI.is_enabled():
-            JaseciContext.get().mem.populate_data(node.edges)
-
+        if EDGE_ADJACENCY and FastAPI.is_enabled():
+            return [
+                anchor.architype
+                for anchor, _ in paged_edges(
+                    node,
+                    dir,
+                    filter,
+                    target_obj,
+                    edge_type,
+                    Jac.check_read_access_many,  # type: ignore[arg-type]
+                )
+            ]
         return JacFeatureImpl.get_edges(
-            node=node, dir=dir, filter=filter, target_obj=target_obj  # type: ignore[arg-type, return-value]
-        )
+            node=node,  # type: ignore[arg-type]
+            dir=dir,
+            filter=filter,
+            target_obj=target_obj,  # type: ignore[arg-type]
+            edge_type=edge_type,  # type: ignore[arg-type]
+        )  # type: ignore[return-value]
 
     @staticmethod
     @hookimpl
@@ -182,14 +309,28 @@ class JacNodePlugin:
         dir: EdgeDir,
         filter: Callable[[EdgeArchitype], bool] | None,
         target_obj: list[NodeArchitype] | None,
+        edge_type: Type[EdgeArchitype] | None,
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
-        if FastAPI.is_enabled():
-            JaseciContext.get().mem.populate_data(node.edges)
-
+        if EDGE_ADJACENCY and FastAPI.is_enabled():
+            return [
+                other.architype
+                for _, other in paged_edges(
+                    node,
+                    dir,
+                    filter,
+                    target_obj,
+                    edge_type,
+                    Jac.check_read_access_many,  # type: ignore[arg-type]
+                )
+            ]
         return JacFeatureImpl.edges_to_nodes(
-            node=node, dir=dir, filter=filter, target_obj=target_obj  # type: ignore[arg-type, return-value]
-        )
+            node=node,  # type: ignore[arg-type]
+            dir=dir,
+            filter=filter,
+            target_obj=target_obj,  # type: ignore[arg-type]
+            edge_type=edge_type,  # type: ignore[arg-type]
+        )  # type: ignore[return-value]
 
 
 class JacEdgePlugin:
@@ -247,24 +388,20 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
         ctx = JaseciContext.get()
         ranchor = root.__jac__ if root else ctx.root
 
-        deleted_count = 0  # noqa: SIM113
+        if not Jac.check_write_access(ranchor):  # type: ignore[arg-type]
+            return 0
 
-        for node in NodeAnchor.Collection.find(
-            {"_id": {"$ne": ranchor.id}, "root": ranchor.id}
-        ):
-            ctx.mem.__mem__[node.id] = node
-            Jac.destroy(node)
-            deleted_count += 1
-
-        for edge in EdgeAnchor.Collection.find({"root": ranchor.id}):
-            ctx.mem.__mem__[edge.id] = edge
-            Jac.destroy(edge)
-            deleted_count += 1
+        if RESET_GRAPH_BACKGROUND:
+            purge = ctx.mem.purge(ranchor)
+            deleted_count = purge.count()
+            PURGES[ranchor.id] = purge
+            Thread(target=run_purge, args=(purge,), daemon=True).start()
+            return deleted_count
 
-        for walker in WalkerAnchor.Collection.find({"root": ranchor.id}):
-            ctx.mem.__mem__[walker.id] = walker
-            Jac.destroy(walker)
-            deleted_count += 1
+        with Collection.get_session() as session, session.start_transaction():
+            purge = ctx.mem.purge(ranchor, session)
+            deleted_count = log_purge(ranchor.id, purge.run(session))
+            BulkWrite.commit(session)
 
         return deleted_count
 
@@ -308,8 +445,8 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
                 access=Permission(),
                 state=AnchorState(),
             )
-            source.edges.append(eanch)
-            target.edges.append(eanch)
+            source.add_edge(eanch)
+            target.add_edge(eanch)
             source.connect_edge(eanch)
             target.connect_edge(eanch)
 
@@ -325,6 +462,53 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
 
         return builder
 
+    @staticmethod
+    @hookimpl
+    def disconnect(
+        left: NodeArchitype | list[NodeArchitype],
+        right: NodeArchitype | list[NodeArchitype],
+        dir: EdgeDir,
+        filter: Callable[[EdgeArchitype], bool] | None,
+        edge_type: Type[EdgeArchitype] | None,
+    ) -> bool:
+        """Jac's disconnect operator feature."""
+        if not EDGE_ADJACENCY or not FastAPI.is_enabled():
+            return JacFeatureImpl.disconnect(
+                left=left,  # type: ignore[arg-type]
+                right=right,  # type: ignore[arg-type]
+                dir=dir,
+                filter=filter,  # type: ignore[arg-type]
+                edge_type=edge_type,  # type: ignore[arg-type]
+            )
+
+        disconnect_occurred = False
+        left = [left] if isinstance(left, NodeArchitype) else left
+        right = [right] if isinstance(right, NodeArchitype) else right
+        if not right:
+            return disconnect_occurred
+
+        for i in left:
+            # collected first as destroying edges while paging would skip some
+            matches = {
+                anchor.id: anchor
+                for anchor, _ in paged_edges(
+                    i.__jac__,
+                    dir,
+                    filter,
+                    right,
+                    edge_type,
+                    lambda anchors: [
+                        Jac.check_connect_access(anchor)  # type: ignore[arg-type]
+                        for anchor in anchors
+                    ],
+                )
+            }
+            for anchor in matches.values():
+                (Jac.destroy(anchor) if anchor.persistent else Jac.detach(anchor))
+                disconnect_occurred = True
+
+        return disconnect_occurred
+
     @staticmethod
     @hookimpl
     def get_object(id: str) -> Architype | None:
@@ -376,84 +560,41 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
             raise TypeError("Invalid walker object")
 
         walker.path = []
-        walker.next = [node]
+        walker.next = deque([node])
         walker.returns = []
         current_node = node.architype
+        dispatch = WalkerDispatch.get(warch.__class__)
 
         # walker entry
-        for i in warch._jac_entry_funcs_:
-            if not i.trigger:
-                walker.returns.append(i.func(warch, current_node))
+        for i in dispatch.entries:
+            walker.returns.append(i.func(warch, current_node))
             if walker.disengaged:
                 return warch
 
+        mem = JaseciContext.get().mem if warch.__prefetch__ else None
         while len(walker.next):
-            if current_node := walker.next.pop(0).architype:
-                # walker entry with
-                for i in warch._jac_entry_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, NodeArchitype)
-                        and isinstance(current_node, i.trigger)
-                    ):
-                        walker.returns.append(i.func(warch, current_node))
-                    if walker.disengaged:
-                        return warch
-
-                # node entry
-                for i in current_node._jac_entry_funcs_:
-                    if not i.trigger:
-                        walker.returns.append(i.func(current_node, warch))
+            if mem and (
+                not (upcoming := walker.next[0]).is_populated()
+                or not upcoming.edge_index.prefetched
+            ):
+                mem.prefetch(walker.next, warch.__prefetch__)
+            if current_node := walker.next.popleft().architype:
+                for func, node_first in dispatch.abilities(current_node.__class__):
+                    walker.returns.append(
+                        func(current_node, warch)
+                        if node_first
+                        else func(warch, current_node)
+                    )
                     if walker.disengaged:
                         return warch
 
-                # node entry with
-                for i in current_node._jac_entry_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, WalkerArchitype)
-                        and isinstance(warch, i.trigger)
-                    ):
-                        walker.returns.append(i.func(current_node, warch))
-                    if walker.disengaged:
-                        return warch
-
-                # node exit with
-                for i in current_node._jac_exit_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, WalkerArchitype)
-                        and isinstance(warch, i.trigger)
-                    ):
-                        walker.returns.append(i.func(current_node, warch))
-                    if walker.disengaged:
-                        return warch
-
-                # node exit
-                for i in current_node._jac_exit_funcs_:
-                    if not i.trigger:
-                        walker.returns.append(i.func(current_node, warch))
-                    if walker.disengaged:
-                        return warch
-
-                # walker exit with
-                for i in warch._jac_exit_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, NodeArchitype)
-                        and isinstance(current_node, i.trigger)
-                    ):
-                        walker.returns.append(i.func(warch, current_node))
-                    if walker.disengaged:
-                        return warch
         # walker exit
-        for i in warch._jac_exit_funcs_:
-            if not i.trigger:
-                walker.returns.append(i.func(warch, current_node))
+        for i in dispatch.exits:
+            walker.returns.append(i.func(warch, current_node))
             if walker.disengaged:
                 return warch
 
-        walker.ignores = []
+        walker.ignores = set()
         return warch
 
     @staticmethod
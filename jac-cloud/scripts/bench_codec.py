@@ -0,0 +1,83 @@
+"""Benchmark for hydrating and serializing jac-cloud architypes.
+
+Decodes N node documents into architypes and serializes them back, once with
+a codec rebuilt for every document (what loading did before codecs were
+cached on the class) and once with the cached codec.
+
+    python scripts/bench_codec.py
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+
+from jac_cloud.core.architype import DataclassCodec, NodeArchitype
+
+
+class Status(Enum):
+    """Benchmark enum."""
+
+    ACTIVE = 1
+    INACTIVE = 2
+
+
+@dataclass
+class Address:
+    """Benchmark nested dataclass."""
+
+    city: str
+    zip: str = ""
+
+
+class Person(NodeArchitype):
+    """Benchmark node."""
+
+    name: str
+    age: int
+    address: Address
+    status: Status = Status.ACTIVE
+    tags: list[str] = field(default_factory=list)
+    scores: dict[str, float] = field(default_factory=dict)
+
+
+def document(i: int) -> dict:
+    """Build the stored architype of a node."""
+    return {
+        "name": f"person {i}",
+        "age": i % 90,
+        "status": "INACTIVE" if i % 2 else "ACTIVE",
+        "address": {"city": "Ann Arbor", "zip": "48104"},
+        "tags": ["a", "b", "c"],
+        "scores": {"math": 1.0, "art": 2.0},
+    }
+
+
+def main(sizes: tuple[int, ...] = (1_000, 10_000)) -> None:
+    """Run the benchmark."""
+    for size in sizes:
+        docs = [document(i) for i in range(size)]
+        start = time.perf_counter()
+        for doc in docs:
+            DataclassCodec(Person).decode(dict(doc))
+        uncached = time.perf_counter() - start
+
+        codec = DataclassCodec.get(Person)
+        start = time.perf_counter()
+        people = [codec.decode(dict(doc)) for doc in docs]
+        cached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for person in people:
+            person.__serialize__()
+        serialize = time.perf_counter() - start
+
+        print(
+            f"{size:>6} docs: decode {size / uncached:10.0f}/s uncached,"
+            f" {size / cached:10.0f}/s cached, serialize {size / serialize:10.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ from typing import Mapping
 
 from PIL import Image as PILImage
 
-from jaclang.compiler.semtable import SemRegistry
+from jaclang.compiler.semtable import SemRegistry, SemScope
 
 from loguru import logger
 
@@ -24,7 +24,7 @@ from mtllm.types import (
     TypeExplanation,
     Video,
 )
-from mtllm.utils import format_template_section
+from mtllm.utils import format_template_section, get_filtered_registry
 
 
 def aott_raise(
@@ -254,3 +254,51 @@ def get_all_type_explanations(
                         nested_type_explanation
                     )
     return list(collected_type_explanations.values())
+
+
+class PromptPlan:
+    """Static parts of the prompt of a `by llm` call site.
+
+    Everything except the values passed to a call depends only on the scope and
+    output of the call site and on the semantic registry, so it is built once
+    and reused until the registry changes.
+    """
+
+    def __init__(self, mod_registry: SemRegistry, scope: str, output: tuple) -> None:
+        """Build the plan of a call site."""
+        _scope = SemScope.get_scope_from_str(scope)
+        assert _scope is not None, f"Invalid scope: {scope}"
+        self.registry = mod_registry
+        self.version = mod_registry.version
+        self.filtered_registry = get_filtered_registry(mod_registry, _scope)
+        self.output_hint = OutputHint(output[0], output[1])
+        self.output_types = self.output_hint.get_types()
+        self.output_type_explanations = get_all_type_explanations(
+            self.output_types, mod_registry
+        )
+        self.type_explanations: dict[tuple, list[TypeExplanation]] = {}
+
+    def is_current(self, mod_registry: SemRegistry) -> bool:
+        """Check the plan was built from the current state of the registry."""
+        return self.registry is mod_registry and self.version == mod_registry.version
+
+    def get_type_explanations(self, type_list: list) -> list[TypeExplanation]:
+        """Get the type explanations of the types collected in a call."""
+        key = tuple(type_list)
+        if (type_explanations := self.type_explanations.get(key)) is None:
+            type_explanations = self.type_explanations[key] = get_all_type_explanations(
+                type_list, self.registry
+            )
+        return type_explanations
+
+
+PROMPT_PLANS: dict[tuple, PromptPlan] = {}
+
+
+def get_prompt_plan(mod_registry: SemRegistry, scope: str, output: tuple) -> PromptPlan:
+    """Get the prompt plan of a call site, rebuilding it if the registry changed."""
+    key = (scope, *output)
+    plan = PROMPT_PLANS.get(key)
+    if plan is None or not plan.is_current(mod_registry):
+        plan = PROMPT_PLANS[key] = PromptPlan(mod_registry, scope, output)
+    return plan
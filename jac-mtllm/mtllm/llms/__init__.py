@@ -2,6 +2,7 @@
 
 from .anthropic import Anthropic
 from .base import BaseLLM
+from .cache import MemoryCache, ResponseCache, SqliteCache
 from .groq import Groq
 from .huggingface import Huggingface
 from .ollama import Ollama
@@ -17,4 +18,7 @@ __all__ = [
     "OpenAI",
     "TogetherAI",
     "BaseLLM",
+    "MemoryCache",
+    "ResponseCache",
+    "SqliteCache",
 ]
@@ -1,6 +1,9 @@
 """Anthropic API client for MTLLM."""
 
+from typing import Optional
+
 from mtllm.llms.base import BaseLLM
+from mtllm.llms.cache import ResponseCache
 
 
 REASON_SUFFIX = """
@@ -46,12 +49,13 @@ class Anthropic(BaseLLM):
         verbose: bool = False,
         max_tries: int = 10,
         type_check: bool = False,
+        cache: Optional[ResponseCache] = None,
         **kwargs: dict,
     ) -> None:
         """Initialize the Anthropic API client."""
         import anthropic  # type: ignore
 
-        super().__init__(verbose, max_tries, type_check)
+        super().__init__(verbose, max_tries, type_check, cache)
         self.client = anthropic.Anthropic()
         self.model_name = str(kwargs.get("model_name", "claude-3-sonnet-20240229"))
         self.temperature = kwargs.get("temperature", 0.7)
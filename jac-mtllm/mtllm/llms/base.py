@@ -1,15 +1,23 @@
 """Base Large Language Model (LLM) class."""
 
+import asyncio
 import logging
 import re
-from typing import Any, Mapping, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Callable, Iterable, Mapping, Optional, TypeVar
 
 from loguru import logger
 
+from mtllm.llms.cache import ResponseCache
+from mtllm.repair import RepairStats, parse_output
 from mtllm.types import InputInformation, OutputHint, ReActOutput, TypeExplanation
 from mtllm.utils import format_template_section
 
 
+T = TypeVar("T")
+
 httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
 
@@ -149,19 +157,46 @@ class BaseLLM:
     OUTPUT_CHECK_PROMPT: str = OUTPUT_CHECK_PROMPT
     OUTPUT_FIX_PROMPT: str = OUTPUT_FIX_PROMPT
     REACT_OUTPUT_FIX_PROMPT: str = REACT_OUTPUT_FIX_PROMPT
+    max_concurrency: int = 8
 
     def __init__(
-        self, verbose: bool = False, max_tries: int = 10, type_check: bool = False
+        self,
+        verbose: bool = False,
+        max_tries: int = 10,
+        type_check: bool = False,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         """Initialize the Large Language Model (LLM) client."""
         self.verbose = verbose
         self.max_tries = max_tries
         self.type_check = type_check
+        self.cache = cache
+        self.repair_stats = RepairStats()
 
     def __infer__(self, meaning_in: str | list[dict], **kwargs: dict) -> str:
         """Infer a response from the input meaning."""
         raise NotImplementedError
 
+    async def __ainfer__(self, meaning_in: str | list[dict], **kwargs: dict) -> str:
+        """Infer a response from the input meaning asynchronously.
+
+        Runs __infer__ on the thread pool of the model, so at most
+        max_concurrency requests are in flight. Clients with an async API can
+        override it.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(self.__infer__, meaning_in, **kwargs)
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool running __infer__ for __ainfer__."""
+        if (executor := self.__dict__.get("_executor")) is None:
+            executor = self._executor = ThreadPoolExecutor(
+                self.max_concurrency, thread_name_prefix="mtllm"
+            )
+        return executor
+
     def __call__(
         self,
         input_text: str | list[dict],
@@ -171,7 +206,62 @@ class BaseLLM:
         """Infer a response from the input text."""
         if self.verbose:
             logger.info(f"Meaning In\n{input_text}")
-        return self.__infer__(input_text, **kwargs)
+        key, response = self._lookup_cache(input_text, kwargs)
+        if response is None:
+            response = self.__infer__(input_text, **kwargs)
+            self._store_cache(key, response)
+        return response
+
+    async def acall(
+        self,
+        input_text: str | list[dict],
+        media: list[Optional[InputInformation]],
+        **kwargs: dict,
+    ) -> str:
+        """Infer a response from the input text asynchronously."""
+        if self.verbose:
+            logger.info(f"Meaning In\n{input_text}")
+        key, response = self._lookup_cache(input_text, kwargs)
+        if response is None:
+            response = await self.__ainfer__(input_text, **kwargs)
+            self._store_cache(key, response)
+        return response
+
+    def map(
+        self,
+        func: Callable[[Any], T],
+        items: Iterable,
+        max_concurrency: Optional[int] = None,
+    ) -> list[T]:
+        """Call func, such as a `by llm` ability, on each item concurrently.
+
+        Calls run on at most max_concurrency threads, defaulting to the one of
+        the model, and their results are returned in the order of the items.
+        """
+        with ThreadPoolExecutor(max_concurrency or self.max_concurrency) as pool:
+            return list(pool.map(lambda item: copy_context().run(func, item), items))
+
+    def _lookup_cache(
+        self, input_text: str | list[dict], kwargs: dict
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Get the cache key of a call and its cached response, if any."""
+        # `cache=False` in the model params skips the cache for a call
+        if not kwargs.pop("cache", True) or self.cache is None:
+            return None, None
+        key = self.cache.key(
+            f"{type(self).__qualname__}:{getattr(self, 'model_name', '')}",
+            input_text,
+            kwargs,
+        )
+        response = self.cache.get(key)
+        if response is not None and self.verbose:
+            logger.info("Meaning Out served from the response cache")
+        return key, response
+
+    def _store_cache(self, key: Optional[str], response: str) -> None:
+        """Cache the response of a call."""
+        if key is not None and self.cache is not None:
+            self.cache.set(key, response)
 
     def resolve_output(
         self,
@@ -185,7 +275,25 @@ class BaseLLM:
         if self.verbose:
             logger.info(f"Meaning Out\n{meaning_out}")
         output_match = re.search(r"\[Output\](.*)", meaning_out, re.DOTALL)
+        local = output_hint.type != "str"
         if not output_match:
+            # only a bare value is taken, not one found in the reasoning
+            parsed, value = (
+                parse_output(
+                    meaning_out,
+                    output_hint.type,
+                    output_type_explanations,
+                    _globals,
+                    _locals,
+                    crop=False,
+                )
+                if local
+                else (False, None)
+            )
+            if parsed:
+                # extracting takes at least an extraction and a check request
+                self._resolved_locally(2)
+                return value
             output = self._extract_output(
                 meaning_out,
                 output_hint,
@@ -195,6 +303,20 @@ class BaseLLM:
         else:
             output = output_match.group(1).strip()
         if self.type_check:
+            parsed, value = (
+                parse_output(
+                    output,
+                    output_hint.type,
+                    output_type_explanations,
+                    _globals,
+                    _locals,
+                )
+                if local
+                else (False, None)
+            )
+            if parsed:
+                self._resolved_locally(1)
+                return value
             is_in_desired_format = self._check_output(
                 output, output_hint.type, output_type_explanations
             )
@@ -211,6 +333,13 @@ class BaseLLM:
             output, output_hint, output_type_explanations, _globals, _locals
         )
 
+    def _resolved_locally(self, avoided: int) -> None:
+        """Count an output resolved without the LLM repair requests avoided."""
+        self.repair_stats.resolved += 1
+        self.repair_stats.avoided += avoided
+        if self.verbose:
+            logger.info(f"Output resolved locally, {self.repair_stats}")
+
     def resolve_react_output(
         self,
         meaning_out: str,
@@ -266,6 +395,7 @@ class BaseLLM:
         react_output_fix_prompt = format_template_section(
             self.REACT_OUTPUT_FIX_PROMPT, react_output_fix_values
         )
+        self.repair_stats.requests += 1
         return self.__infer__(react_output_fix_prompt)
 
     def _check_output(
@@ -285,6 +415,7 @@ class BaseLLM:
         output_check_prompt = format_template_section(
             self.OUTPUT_CHECK_PROMPT, react_values
         )
+        self.repair_stats.requests += 1
         llm_output = self.__infer__(output_check_prompt)
         return "yes" in llm_output.lower()
 
@@ -321,6 +452,7 @@ class BaseLLM:
         output_extract_prompt = format_template_section(
             self.OUTPUT_EXTRACT_PROMPT, output_check_values
         )
+        self.repair_stats.requests += 1
         llm_output = self.__infer__(output_extract_prompt)
         is_in_desired_format = self._check_output(
             llm_output, output_hint.type, output_type_explanations
@@ -370,6 +502,12 @@ class BaseLLM:
         try:
             return eval(output, _globals, _locals)
         except Exception as e:
+            parsed, value = parse_output(
+                output, output_hint.type, output_type_explanations, _globals, _locals
+            )
+            if parsed:
+                self._resolved_locally(1)
+                return value
             return self.to_object(
                 output,
                 output_hint,
@@ -401,4 +539,5 @@ class BaseLLM:
         output_fix_prompt = format_template_section(
             self.OUTPUT_FIX_PROMPT, output_fix_values
         )
+        self.repair_stats.requests += 1
         return self.__infer__(output_fix_prompt)
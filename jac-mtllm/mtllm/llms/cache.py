@@ -0,0 +1,170 @@
+"""Response caches for MTLLM calls."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class ResponseCache:
+    """Base class for caches of LLM responses.
+
+    Responses are stored under a hash of the model, the rendered prompt and
+    the call parameters, and expire ttl seconds after they were stored. At
+    most max_size responses are kept, dropping the least recently used.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, meaning_in: str | list[dict], params: dict) -> str:
+        """Get the cache key of a call."""
+        data = json.dumps([model, meaning_in, params], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, counting hits and misses."""
+        with self.lock:
+            response = self.load(key, time.time())
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """Cache a response."""
+        with self.lock:
+            self.store(key, response, time.time())
+
+    def load(self, key: str, now: float) -> Optional[str]:
+        """Read a response that hasn't expired."""
+        raise NotImplementedError
+
+    def store(self, key: str, response: str, now: float) -> None:
+        """Write a response, dropping the least recently used over max_size."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        raise NotImplementedError
+
+    def expired(self, stored: float, now: float) -> bool:
+        """Check if a response stored at a time has expired."""
+        return self.ttl is not None and now - stored > self.ttl
+
+
+class MemoryCache(ResponseCache):
+    """In memory least recently used response cache."""
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None) -> None:
+        """Initialize the cache."""
+        super().__init__(max_size, ttl)
+        self.responses: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def load(self, key: str, now: float) -> Optional[str]:
+        """Read a response that hasn't expired."""
+        if (entry := self.responses.get(key)) is None:
+            return None
+        if self.expired(entry[1], now):
+            del self.responses[key]
+            return None
+        self.responses.move_to_end(key)
+        return entry[0]
+
+    def store(self, key: str, response: str, now: float) -> None:
+        """Write a response, dropping the least recently used over max_size."""
+        self.responses[key] = (response, now)
+        self.responses.move_to_end(key)
+        while len(self.responses) > self.max_size:
+            self.responses.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self.lock:
+            self.responses.clear()
+
+    def __len__(self) -> int:
+        """Count cached responses."""
+        return len(self.responses)
+
+
+class SqliteCache(ResponseCache):
+    """SQLite backed response cache, shared across runs and processes."""
+
+    def __init__(
+        self, path: str, max_size: int = 100_000, ttl: Optional[float] = None
+    ) -> None:
+        """Open or create the database."""
+        super().__init__(max_size, ttl)
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY,"
+            " response TEXT NOT NULL, stored REAL NOT NULL, used REAL NOT NULL)"
+            " WITHOUT ROWID"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_used ON responses (used)"
+        )
+        self.size = len(self)
+
+    def load(self, key: str, now: float) -> Optional[str]:
+        """Read a response that hasn't expired."""
+        row = self.conn.execute(
+            "SELECT response, stored FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if self.expired(row[1], now):
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.size -= 1
+            return None
+        self.conn.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def store(self, key: str, response: str, now: float) -> None:
+        """Write a response, dropping the least recently used over max_size."""
+        updated = self.conn.execute(
+            "UPDATE responses SET response = ?, stored = ?, used = ? WHERE key = ?",
+            (response, now, now, key),
+        )
+        if updated.rowcount:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, stored, used)"
+            " VALUES (?, ?, ?, ?)",
+            (key, response, now, now),
+        )
+        self.size += 1
+        if self.size > self.max_size:
+            self.conn.execute(
+                "DELETE FROM responses WHERE key IN"
+                " (SELECT key FROM responses ORDER BY used LIMIT ?)",
+                (self.size - self.max_size,),
+            )
+            # other processes may share the database
+            self.size = len(self)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.size = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        self.conn.close()
+
+    def __len__(self) -> int:
+        """Count cached responses."""
+        return self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -1,6 +1,9 @@
 """Groq API client for MTLLM."""
 
+from typing import Optional
+
 from mtllm.llms.base import BaseLLM
+from mtllm.llms.cache import ResponseCache
 
 
 REASON_SUFFIX = """
@@ -46,12 +49,13 @@ class Groq(BaseLLM):
         verbose: bool = False,
         max_tries: int = 10,
         type_check: bool = False,
+        cache: Optional[ResponseCache] = None,
         **kwargs: dict
     ) -> None:
         """Initialize the Groq API client."""
         import groq  # type: ignore
 
-        super().__init__(verbose, max_tries, type_check)
+        super().__init__(verbose, max_tries, type_check, cache)
         self.client = groq.Groq()
         self.model_name = kwargs.get("model_name", "mixtral-8x7b-32768")
         self.temperature = kwargs.get("temperature", 0.7)
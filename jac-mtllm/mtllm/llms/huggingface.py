@@ -1,6 +1,9 @@
 """Huggingface client for MTLLM."""
 
+from typing import Optional
+
 from mtllm.llms.base import BaseLLM
+from mtllm.llms.cache import ResponseCache
 
 
 REASON_SUFFIX = """
@@ -48,13 +51,14 @@ class Huggingface(BaseLLM):
         verbose: bool = False,
         max_tries: int = 10,
         type_check: bool = False,
+        cache: Optional[ResponseCache] = None,
         **kwargs: dict
     ) -> None:
         """Initialize the Huggingface API client."""
         import torch  # type: ignore
         from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline  # type: ignore
 
-        super().__init__(verbose, max_tries, type_check)
+        super().__init__(verbose, max_tries, type_check, cache)
         torch.random.manual_seed(0)
         model = AutoModelForCausalLM.from_pretrained(
             kwargs.get("model_name", "microsoft/Phi-3-mini-128k-instruct"),
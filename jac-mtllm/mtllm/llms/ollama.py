@@ -1,6 +1,9 @@
 """Ollama client for MTLLM."""
 
+from typing import Optional
+
 from mtllm.llms.base import BaseLLM
+from mtllm.llms.cache import ResponseCache
 
 REASON_SUFFIX = """
 Reason and return the output result(s) only, adhering to the provided Type in the following format
@@ -45,12 +48,13 @@ class Ollama(BaseLLM):
         verbose: bool = False,
         max_tries: int = 10,
         type_check: bool = False,
+        cache: Optional[ResponseCache] = None,
         **kwargs: dict
     ) -> None:
         """Initialize the Ollama API client."""
         import ollama  # type: ignore
 
-        super().__init__(verbose, max_tries, type_check)
+        super().__init__(verbose, max_tries, type_check, cache)
         self.client = ollama.Client(host=kwargs.get("host", "http://localhost:11434"))
         self.model_name = kwargs.get("model_name", "phi3")
         self.default_model_params = {
@@ -1,6 +1,9 @@
 """Anthropic API client for MTLLM."""
 
+from typing import Optional
+
 from mtllm.llms.base import BaseLLM
+from mtllm.llms.cache import ResponseCache
 
 REASON_SUFFIX = """
 Reason and return the output result(s) only, adhering to the provided Type in the following format
@@ -45,12 +48,13 @@ class TogetherAI(BaseLLM):
         verbose: bool = False,
         max_tries: int = 10,
         type_check: bool = False,
+        cache: Optional[ResponseCache] = None,
         **kwargs: dict
     ) -> None:
         """Initialize the Anthropic API client."""
         import together  # type: ignore
 
-        super().__init__(verbose, max_tries, type_check)
+        super().__init__(verbose, max_tries, type_check, cache)
         self.client = together.Together()
         self.model_name = kwargs.get("model_name", "mistralai/Mistral-7B-Instruct-v0.3")
         self.temperature = kwargs.get("temperature", 0.7)
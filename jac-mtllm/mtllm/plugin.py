@@ -6,17 +6,13 @@ from typing import Any, Callable, Mapping, Optional, Sequence
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
-from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+from jaclang.compiler.semtable import SemInfo, SemRegistry
 from jaclang.runtimelib.default import hookimpl
 from jaclang.runtimelib.utils import extract_params, extract_type, get_sem_scope
 
-from mtllm.aott import (
-    aott_raise,
-    get_all_type_explanations,
-)
+from mtllm.aott import aott_raise, get_prompt_plan
 from mtllm.llms.base import BaseLLM
-from mtllm.types import Information, InputInformation, OutputHint, Tool
-from mtllm.utils import get_filtered_registry
+from mtllm.types import Information, InputInformation, Tool
 
 
 def callable_to_tool(tool: Callable, mod_registry: SemRegistry) -> Tool:
@@ -54,9 +50,8 @@ class JacFeature:
         from jaclang.runtimelib.machine import JacMachineState
 
         mod_registry = JacMachineState.get().jac_program.sem_ir
-
-        _scope = SemScope.get_scope_from_str(scope)
-        assert _scope is not None, f"Invalid scope: {scope}"
+        output = outputs[0] if isinstance(outputs, list) else outputs
+        plan = get_prompt_plan(mod_registry, scope, output)
 
         method = model_params.pop("method") if "method" in model_params else "Normal"
         is_custom = (
@@ -76,10 +71,12 @@ class JacFeature:
 
         type_collector: list = []
 
-        filtered_registry = get_filtered_registry(mod_registry, _scope)
         incl_info = [x for x in incl_info if not isinstance(x[1], type)]
-        informations = [Information(filtered_registry, x[0], x[1]) for x in incl_info]
-        type_collector.extend([x.get_types() for x in informations])
+        informations = [
+            Information(plan.filtered_registry, x[0], x[1]) for x in incl_info
+        ]
+        for info in informations:
+            type_collector.extend(info.get_types())
 
         inputs_information = []
         for input_item in inputs:
@@ -87,14 +84,11 @@ class JacFeature:
             type_collector.extend(_input.get_types())
             inputs_information.append(_input)
 
-        output = outputs[0] if isinstance(outputs, list) else outputs
-        output_hint = OutputHint(output[0], output[1])
-        type_collector.extend(output_hint.get_types())
-        output_type_explanations = get_all_type_explanations(
-            output_hint.get_types(), mod_registry
-        )
+        output_hint = plan.output_hint
+        type_collector.extend(plan.output_types)
+        output_type_explanations = plan.output_type_explanations
 
-        type_explanations = get_all_type_explanations(type_collector, mod_registry)
+        type_explanations = plan.get_type_explanations(type_collector)
 
         tools = model_params.pop("tools") if "tools" in model_params else None
         if method == "ReAct":
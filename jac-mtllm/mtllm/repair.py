@@ -0,0 +1,215 @@
+"""Local parsing and repair of LLM outputs.
+
+Outputs that don't evaluate as they are often only need small fixes, like
+dropping markdown fences or trailing prose, reading JSON literals or adding
+the class of an enum member. These are tried locally, guided by the expected
+output type, before asking the LLM to fix the output.
+"""
+
+import ast
+import dataclasses
+import re
+import types
+import typing
+from collections import ChainMap
+from enum import Enum
+from typing import Any, Iterator, Mapping, Optional
+
+from mtllm.types import TypeExplanation
+
+FENCE = re.compile(r"```[\w+-]*[ \t]*\n?(.*?)```", re.DOTALL)
+# characters a python literal or call can end with
+ENDS = re.compile(r"[)\]}\"']|\w\b")
+JSON_NAMES = {"true": True, "false": False, "null": None}
+MAX_CANDIDATES = 200
+
+
+class RepairStats:
+    """Counts of outputs resolved locally and of LLM repair requests."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.resolved = 0
+        self.avoided = 0
+        self.requests = 0
+
+    def __repr__(self) -> str:
+        """Get the representation of the counters."""
+        return (
+            f"RepairStats(resolved={self.resolved}, avoided={self.avoided},"
+            f" requests={self.requests})"
+        )
+
+
+class OutputParser:
+    """Parse an output to the value of its expected type without the LLM."""
+
+    def __init__(
+        self,
+        output_type: str,
+        type_explanations: list[TypeExplanation],
+        _globals: dict,
+        _locals: Mapping,
+    ) -> None:
+        """Resolve the expected type and the enums the output may refer to."""
+        self._globals = _globals
+        self._locals = _locals
+        self.type = self.resolve(output_type)
+        names: dict[str, Any] = {}
+        for type_explanation in type_explanations:
+            cls = self.resolve(type_explanation.type_item)
+            if isinstance(cls, type) and issubclass(cls, Enum):
+                for member in cls:
+                    names.setdefault(member.name, member)
+        for name, value in JSON_NAMES.items():
+            names.setdefault(name, value)
+        # names the output may use unqualified, never shadowing the caller's
+        self.names = {
+            name: value
+            for name, value in names.items()
+            if name not in _locals and name not in _globals
+        }
+
+    def resolve(self, type_str: str) -> Any:  # noqa: ANN401
+        """Get the type named by a type string, None if it isn't known."""
+        try:
+            resolved = eval(type_str, self._globals, dict(self._locals))
+        except Exception:
+            return None
+        if resolved is Any or isinstance(
+            resolved, (type, types.GenericAlias, types.UnionType)
+        ):
+            return resolved
+        if typing.get_origin(resolved) is not None:
+            return resolved
+        return None
+
+    def parse(self, output: str, crop: bool = True) -> tuple[bool, Any]:
+        """Parse an output, trying prefixes of it when crop is set."""
+        if self.type is None:
+            return False, None
+        namespace = ChainMap(dict(self._locals), self.names)
+        for candidate in self.candidates(output, crop):
+            try:
+                value = eval(candidate, self._globals, namespace)
+                return True, self.coerce(value, self.type)
+            except Exception:
+                continue
+        return False, None
+
+    def candidates(self, output: str, crop: bool) -> Iterator[str]:
+        """Get the parts of an output that may hold the value."""
+        texts = [match.group(1).strip() for match in FENCE.finditer(output)]
+        texts.append(output.strip())
+        count = 0
+        for text in texts:
+            ends = [len(text)]
+            if crop:
+                ends.extend(match.end() for match in ENDS.finditer(text))
+            for end in sorted(set(ends), reverse=True):
+                if (count := count + 1) > MAX_CANDIDATES:
+                    return
+                try:
+                    ast.parse(text[:end], mode="eval")
+                except SyntaxError:
+                    continue
+                yield text[:end]
+
+    def coerce(self, value: Any, tp: Any) -> Any:  # noqa: ANN401
+        """Convert a value to a type, raising TypeError if it doesn't fit."""
+        if tp is Any or tp is object:
+            return value
+        if tp is None or tp is type(None):
+            if value is None:
+                return value
+            raise TypeError(f"{value!r} is not None")
+        origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if origin is typing.Union or origin is types.UnionType:
+            for arg in args:
+                try:
+                    return self.coerce(value, arg)
+                except (TypeError, ValueError):
+                    continue
+            raise TypeError(f"{value!r} is not a {tp}")
+        if origin in (list, set, frozenset):
+            if not isinstance(value, (list, tuple, set, frozenset)):
+                raise TypeError(f"{value!r} is not a {tp}")
+            return origin(
+                self.coerce(item, args[0]) if args else item for item in value
+            )
+        if origin is tuple:
+            if not isinstance(value, (list, tuple)):
+                raise TypeError(f"{value!r} is not a {tp}")
+            if len(args) == 2 and args[1] is Ellipsis:
+                return tuple(self.coerce(item, args[0]) for item in value)
+            if args and len(args) != len(value):
+                raise TypeError(f"{value!r} is not a {tp}")
+            return tuple(
+                self.coerce(item, arg) for item, arg in zip(value, args or value)
+            )
+        if origin is dict:
+            if not isinstance(value, dict):
+                raise TypeError(f"{value!r} is not a {tp}")
+            if not args:
+                return value
+            return {
+                self.coerce(key, args[0]): self.coerce(item, args[1])
+                for key, item in value.items()
+            }
+        if origin is typing.Literal:
+            if value in args:
+                return value
+            raise ValueError(f"{value!r} is not one of {args}")
+        if not isinstance(tp, type):
+            return value
+        if issubclass(tp, Enum):
+            return self.to_enum(value, tp)
+        if tp is float and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        if not isinstance(value, tp):
+            raise TypeError(f"{value!r} is not a {tp.__name__}")
+        if dataclasses.is_dataclass(value):
+            self.coerce_fields(value)
+        return value
+
+    def coerce_fields(self, obj: Any) -> None:  # noqa: ANN401
+        """Convert the fields of an object to their annotated types."""
+        try:
+            hints = typing.get_type_hints(type(obj))
+        except Exception:
+            return
+        for field in dataclasses.fields(obj):
+            if field.name in hints and hasattr(obj, field.name):
+                value = getattr(obj, field.name)
+                coerced = self.coerce(value, hints[field.name])
+                if coerced is not value:
+                    setattr(obj, field.name, coerced)
+
+    @staticmethod
+    def to_enum(value: Any, tp: type[Enum]) -> Enum:  # noqa: ANN401
+        """Get the member of an enum a value names."""
+        if isinstance(value, tp):
+            return value
+        if isinstance(value, str):
+            name = value.strip().removeprefix(f"{tp.__name__}.")
+            members = {member.name.lower(): member for member in tp}
+            if (member := members.get(name.lower())) is not None:
+                return member
+        for member in tp:
+            if member.value == value:
+                return member
+        raise ValueError(f"{value!r} is not a {tp.__name__}")
+
+
+def parse_output(
+    output: str,
+    output_type: str,
+    type_explanations: list[TypeExplanation],
+    _globals: dict,
+    _locals: Mapping,
+    crop: bool = True,
+) -> tuple[bool, Optional[Any]]:
+    """Parse an output to the value of its expected type without the LLM."""
+    return OutputParser(output_type, type_explanations, _globals, _locals).parse(
+        output, crop
+    )
@@ -2,6 +2,7 @@
 
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from jaclang.compiler.semtable import SemRegistry, SemScope
@@ -92,16 +93,16 @@ def get_filtered_registry(mod_registry: SemRegistry, scope: SemScope) -> SemRegi
         scope = scope.parent
 
     filtered_registry = SemRegistry()
-    for _scope, sem_info_list in mod_registry.registry.items():
-        if str(_scope) in avail_scopes:
-            filtered_registry.registry[_scope] = sem_info_list
+    for _scope in mod_registry.get_scopes(avail_scopes):
+        filtered_registry.registry[_scope] = mod_registry.registry[_scope]
 
     return filtered_registry
 
 
-def extract_template_placeholders(template: str) -> list:
+@lru_cache
+def extract_template_placeholders(template: str) -> tuple[str, ...]:
     """Extract placeholders from the template."""
-    return re.findall(r"{(.*?)}", template)
+    return tuple(re.findall(r"{(.*?)}", template))
 
 
 def format_template_section(template_section: str, values_dict: dict) -> str:
@@ -0,0 +1,63 @@
+"""Benchmark for concurrent MTLLM calls.
+
+Sends independent calls to a mock LLM with a simulated round-trip latency,
+one after another, through BaseLLM.map and through gathered async calls.
+Wall clock time should drop with the number of calls in flight.
+
+    python scripts/bench_concurrent_calls.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from mtllm.llms import BaseLLM
+
+LATENCY = 0.05
+
+
+class MockLLM(BaseLLM):
+    """LLM answering after a fixed latency."""
+
+    def __infer__(self, meaning_in: str | list[dict], **kwargs: dict) -> str:
+        """Wait for the simulated round trip and answer."""
+        time.sleep(LATENCY)
+        return f"[Output] {meaning_in}"
+
+
+def call_mapped(llm: BaseLLM, prompts: list[str]) -> list[str]:
+    """Call the LLM on each prompt through map."""
+    return llm.map(lambda prompt: llm(prompt, []), prompts)
+
+
+async def call_gathered(llm: BaseLLM, prompts: list[str]) -> list[str]:
+    """Call the LLM on each prompt asynchronously."""
+    return await asyncio.gather(*(llm.acall(prompt, []) for prompt in prompts))
+
+
+def main(calls: int = 200, concurrency: tuple[int, ...] = (1, 8, 32)) -> None:
+    """Run the benchmark."""
+    prompts = [str(i) for i in range(calls)]
+    for max_concurrency in concurrency:
+        llm = MockLLM()
+        llm.max_concurrency = max_concurrency
+
+        start = time.perf_counter()
+        results = call_mapped(llm, prompts)
+        mapped = time.perf_counter() - start
+        assert results == [f"[Output] {prompt}" for prompt in prompts]
+
+        start = time.perf_counter()
+        assert asyncio.run(call_gathered(llm, prompts)) == results
+        gathered = time.perf_counter() - start
+
+        print(
+            f"{calls} calls, {max_concurrency:>2} in flight:"
+            f" map {mapped:6.2f} s, async {gathered:6.2f} s"
+            f" (sequential {calls * LATENCY:.2f} s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
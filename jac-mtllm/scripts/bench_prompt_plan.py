@@ -0,0 +1,67 @@
+"""Benchmark for the prompt plans of `by llm` call sites.
+
+Builds a registry with a chain of nested object types and times preparing the
+static parts of a prompt returning the outermost type, from scratch and from
+the call site's cached plan.
+
+    python scripts/bench_prompt_plan.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+
+from mtllm.aott import get_all_type_explanations, get_prompt_plan
+from mtllm.utils import get_filtered_registry
+
+FIELDS = 10
+REPEAT = 1_000
+SCOPE = "app(Module).make(Ability)"
+
+
+def build(depth: int) -> SemRegistry:
+    """Build a registry of depth object types, each holding the next one."""
+    registry = SemRegistry()
+    module = SemScope("app", "Module")
+    registry.add(module, SemInfo(None, "make", "Ability", "Make"))  # type: ignore[arg-type]
+    for level in range(depth):
+        name = f"Type{level}"
+        registry.add(module, SemInfo(None, name, "obj", name))  # type: ignore[arg-type]
+        scope = SemScope(name, "obj", module)
+        for fld in range(FIELDS):
+            registry.add(scope, SemInfo(None, f"f{fld}", "int", f"Field {fld}"))  # type: ignore[arg-type]
+        if level + 1 < depth:
+            registry.add(scope, SemInfo(None, "child", f"list[Type{level + 1}]", ""))  # type: ignore[arg-type]
+    return registry
+
+
+def main(depths: tuple[int, ...] = (5, 20, 50)) -> None:
+    """Run the benchmark."""
+    for depth in depths:
+        registry = build(depth)
+        output = ("Made", "Type0")
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            scope = SemScope.get_scope_from_str(SCOPE)
+            assert scope is not None
+            get_filtered_registry(registry, scope)
+            get_all_type_explanations(["Type0"], registry)
+        uncached = (time.perf_counter() - start) / REPEAT
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            plan = get_prompt_plan(registry, SCOPE, output)
+            plan.get_type_explanations(["Type0"])
+        cached = (time.perf_counter() - start) / REPEAT
+
+        print(
+            f"{depth:>3} nested types: rebuilt {uncached * 1e6:8.1f} us,"
+            f" planned {cached * 1e6:6.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Tests for the MTLLM response caches."""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+from jaclang.utils.test import TestCase
+
+from mtllm.llms import BaseLLM, MemoryCache, SqliteCache
+
+
+class FakeLLM(BaseLLM):
+    """LLM answering with a counter of its calls."""
+
+    model_name = "fake"
+
+    def __init__(self, **kwargs: dict) -> None:
+        """Initialize the fake LLM."""
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self.calls: list[tuple] = []
+
+    def __infer__(self, meaning_in: str | list[dict], **kwargs: dict) -> str:
+        """Count the call and answer it."""
+        self.calls.append((meaning_in, kwargs))
+        return f"[Output] {len(self.calls)}"
+
+
+class TestResponseCache(TestCase):
+    """Test caching LLM responses."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """Tear down test."""
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def test_memory_cache(self) -> None:
+        """Test repeated calls are answered from the cache."""
+        cache = MemoryCache(max_size=2)
+        llm = FakeLLM(cache=cache)
+        self.assertEqual(llm("a", [], temperature=0.5), "[Output] 1")
+        self.assertEqual(llm("a", [], temperature=0.5), "[Output] 1")
+        self.assertEqual(llm("a", [], temperature=0.7), "[Output] 2")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # opting out neither reads nor writes the cache
+        self.assertEqual(llm("a", [], temperature=0.5, cache=False), "[Output] 3")
+        self.assertEqual(llm.calls[-1], ("a", {"temperature": 0.5}))
+        self.assertEqual(llm("a", [], temperature=0.5), "[Output] 1")
+
+        # the least recently used response is dropped
+        llm("b", [])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(llm("a", [], temperature=0.7), "[Output] 5")
+        self.assertEqual(llm("b", []), "[Output] 4")
+
+        # other models don't share responses
+        self.assertEqual(FakeLLM(cache=cache)("b", []), "[Output] 4")
+        other = FakeLLM(cache=cache)
+        other.model_name = "other"
+        self.assertEqual(other("b", []), "[Output] 1")
+
+    def test_ttl(self) -> None:
+        """Test responses expire."""
+        for cache in (
+            MemoryCache(ttl=10),
+            SqliteCache(os.path.join(self.tmp.name, "ttl.db"), ttl=10),
+        ):
+            llm = FakeLLM(cache=cache)
+            with patch("time.time", return_value=100):
+                llm("a", [])
+            with patch("time.time", return_value=105):
+                self.assertEqual(llm("a", []), "[Output] 1")
+            with patch("time.time", return_value=120):
+                self.assertEqual(llm("a", []), "[Output] 2")
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_sqlite_cache(self) -> None:
+        """Test responses are shared across runs and bounded."""
+        path = os.path.join(self.tmp.name, "cache.db")
+        cache = SqliteCache(path, max_size=2)
+        llm = FakeLLM(cache=cache)
+        for prompt in ("a", "b", "a", "c"):
+            llm(prompt, [])
+        self.assertEqual(len(cache), 2)
+        cache.close()
+
+        cache = SqliteCache(path, max_size=2)
+        llm = FakeLLM(cache=cache)
+        self.assertEqual(llm("a", []), "[Output] 1")
+        self.assertEqual(llm("c", []), "[Output] 3")
+        self.assertEqual(llm("b", []), "[Output] 1")
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.close()
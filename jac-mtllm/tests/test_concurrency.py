@@ -0,0 +1,63 @@
+"""Tests for concurrent MTLLM calls."""
+
+import asyncio
+import threading
+import time
+
+from jaclang.utils.test import TestCase
+
+from mtllm.llms import BaseLLM, MemoryCache
+
+
+class SlowLLM(BaseLLM):
+    """LLM echoing its input after a delay, recording concurrent calls."""
+
+    max_concurrency = 3
+
+    def __init__(self, **kwargs: dict) -> None:
+        """Initialize the slow LLM."""
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self.lock = threading.Lock()
+        self.active = self.peak = self.calls = 0
+
+    def __infer__(self, meaning_in: str | list[dict], **kwargs: dict) -> str:
+        """Answer after a delay shorter for later inputs."""
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05 / (int(str(meaning_in)) + 1))
+        with self.lock:
+            self.active -= 1
+        return f"[Output] {meaning_in}"
+
+
+class TestConcurrency(TestCase):
+    """Test fanning out independent calls."""
+
+    def test_map(self) -> None:
+        """Test map keeps the order of the items and bounds concurrency."""
+        llm = SlowLLM()
+        self.assertEqual(
+            llm.map(lambda i: llm(str(i), []), range(10)),
+            [f"[Output] {i}" for i in range(10)],
+        )
+        self.assertGreater(llm.peak, 1)
+        self.assertLessEqual(llm.peak, 3)
+
+        llm.peak = 0
+        llm.map(lambda i: llm(str(i), []), range(4), max_concurrency=1)
+        self.assertEqual(llm.peak, 1)
+
+    def test_acall(self) -> None:
+        """Test async calls are bounded, ordered and cached."""
+        llm = SlowLLM(cache=MemoryCache())
+
+        async def run() -> list[str]:
+            return await asyncio.gather(*(llm.acall(str(i % 6), []) for i in range(12)))
+
+        self.assertEqual(asyncio.run(run()), [f"[Output] {i % 6}" for i in range(12)])
+        self.assertLessEqual(llm.peak, 3)
+        self.assertEqual(asyncio.run(run())[5], "[Output] 5")
+        self.assertEqual(llm.cache.hits, 12)  # type: ignore[union-attr]
+        self.assertEqual(llm.calls, 12)
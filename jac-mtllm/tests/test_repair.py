@@ -0,0 +1,96 @@
+"""Tests for repairing LLM outputs locally."""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+from jaclang.utils.test import TestCase
+
+from mtllm.aott import get_all_type_explanations
+from mtllm.llms import BaseLLM
+from mtllm.repair import parse_output
+from mtllm.types import OutputHint
+
+
+class Role(Enum):
+    """Role of a person."""
+
+    ADMIN = "admin"
+    GUEST = "guest"
+
+
+@dataclass
+class Person:
+    """A person."""
+
+    name: str
+    role: Role
+
+
+class FixingLLM(BaseLLM):
+    """LLM answering repair requests with a fixed output."""
+
+    def __infer__(self, meaning_in: str | list[dict], **kwargs: dict) -> str:
+        """Answer with a valid output."""
+        return "[1, 2]"
+
+
+class TestOutputRepair(TestCase):
+    """Test parsing outputs without the LLM."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        registry = SemRegistry()
+        module = SemScope("app", "Module")
+        registry.add(module, SemInfo(None, "Role", "Enum", "Role"))  # type: ignore[arg-type]
+        registry.add(SemScope("Role", "Enum", module), SemInfo(None, "ADMIN", None, ""))  # type: ignore[arg-type]
+        self.explanations = get_all_type_explanations(["Role"], registry)
+
+    def parse(self, output: str, output_type: str, crop: bool = True) -> tuple:
+        """Parse an output in the namespace of this module."""
+        return parse_output(output, output_type, self.explanations, globals(), {}, crop)
+
+    def test_parse_output(self) -> None:
+        """Test common malformed outputs are repaired."""
+        self.assertEqual(
+            self.parse("```python\n[1, 2]\n```", "list[int]"), (True, [1, 2])
+        )
+        self.assertEqual(
+            self.parse("[1, 2]\n\nThese are the numbers.", "list[int]"), (True, [1, 2])
+        )
+        self.assertEqual(
+            self.parse('{"a": true, "b": null}', "dict[str, bool | None]"),
+            (True, {"a": True, "b": None}),
+        )
+        self.assertEqual(self.parse("ADMIN", "Role"), (True, Role.ADMIN))
+        self.assertEqual(
+            self.parse("['guest', 'Role.ADMIN', GUEST]", "list[Role]"),
+            (True, [Role.GUEST, Role.ADMIN, Role.GUEST]),
+        )
+        self.assertEqual(
+            self.parse("Person(name='Ann', role='admin'). Done!", "Person"),
+            (True, Person("Ann", Role.ADMIN)),
+        )
+        self.assertEqual(self.parse("3", "float"), (True, 3.0))
+
+        self.assertFalse(self.parse("[1, 2] is the answer", "list[int]", crop=False)[0])
+        self.assertFalse(self.parse("['a']", "list[int]")[0])
+        self.assertFalse(self.parse("[1]", "list[Unknown]")[0])
+
+    def test_resolve_output(self) -> None:
+        """Test repair requests are only sent when needed, and counted."""
+        llm = FixingLLM()
+        hint = OutputHint("Numbers", "list[int]")
+
+        def resolve(meaning_out: str) -> list:
+            return llm.resolve_output(meaning_out, hint, [], globals(), {})
+
+        self.assertEqual(resolve("[1, 2]"), [1, 2])
+        self.assertEqual(resolve("[Output] ```\n[1, 2]\n```"), [1, 2])
+        stats = llm.repair_stats
+        self.assertEqual((stats.resolved, stats.avoided, stats.requests), (2, 3, 0))
+
+        # the llm still fixes what can't be parsed locally
+        self.assertEqual(resolve("[Output] [1, 2"), [1, 2])
+        self.assertEqual((stats.resolved, stats.avoided, stats.requests), (2, 3, 1))
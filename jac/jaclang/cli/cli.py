@@ -20,6 +20,7 @@ from jaclang.runtimelib.builtin import dotgen
 from jaclang.runtimelib.constructs import WalkerArchitype
 from jaclang.runtimelib.feature import JacFeature as Jac
 from jaclang.runtimelib.machine import JacMachineState, call_jac_func_with_machine
+from jaclang.runtimelib.memory import migrate_session
 from jaclang.utils.helpers import debugger as db
 from jaclang.utils.lang_tools import AstTool
 
@@ -67,7 +68,11 @@ def format(path: str, outfile: str = "", to_screen: bool = False) -> None:
 
 
 def proc_file_sess(
-    filename: str, session: str, root: Optional[str] = None, interp: bool = False
+    filename: str,
+    session: str,
+    root: Optional[str] = None,
+    interp: bool = False,
+    cache: bool = False,
 ) -> tuple[str, str, JacMachineState]:
     if session == "":
         session = (
@@ -80,7 +85,9 @@ def proc_file_sess(
     base, mod = os.path.split(filename)
     base = base if base else "./"
     mod = mod[:-4]
-    mach = JacMachineState(base, session=session, root=root, interp_mode=interp)
+    mach = JacMachineState(
+        base, session=session, root=root, interp_mode=interp, cachable=cache
+    )
     return base, mod, mach
 
 
@@ -95,7 +102,7 @@ def run(
     """Run the specified .jac file."""
     # if no session specified, check if it was defined when starting the command shell
     # otherwise default to jaclang.session
-    base, mod, mach = proc_file_sess(filename, session, interp=interp)
+    base, mod, mach = proc_file_sess(filename, session, interp=interp, cache=cache)
 
     if filename.endswith(".jac"):
         try:
@@ -130,7 +137,7 @@ def get_object(
     filename: str, id: str, session: str = "", main: bool = True, cache: bool = True
 ) -> dict:
     """Get the object with the specified id."""
-    base, mod, mach = proc_file_sess(filename, session)
+    base, mod, mach = proc_file_sess(filename, session, cache=cache)
 
     if filename.endswith(".jac"):
         Jac.jac_import(
@@ -222,6 +229,7 @@ def enter(
     main: bool = True,
     root: str = "",
     node: str = "",
+    cache: bool = True,
 ) -> None:
     """
     Run the specified entrypoint function in the given .jac file.
@@ -232,8 +240,9 @@ def enter(
     :param session: shelve.Shelf file path.
     :param root: root executor.
     :param node: starting node.
+    :param cache: use the __jac_gen__ bytecode cache.
     """
-    base, mod, mach = proc_file_sess(filename, session, root)
+    base, mod, mach = proc_file_sess(filename, session, root, cache=cache)
 
     if filename.endswith(".jac"):
         ret_module = Jac.jac_import(
@@ -269,7 +278,9 @@ def enter(
             if isinstance(architype, WalkerArchitype) and call_jac_func_with_machine(
                 mach, Jac.check_read_access, mach.exec_ctx.entry_node
             ):
-                Jac.spawn(mach.exec_ctx.entry_node.architype, architype)
+                call_jac_func_with_machine(
+                    mach, Jac.spawn, mach.exec_ctx.entry_node.architype, architype
+                )
 
     mach.exec_ctx.close()
 
@@ -346,13 +357,24 @@ def clean() -> None:
     current_dir = os.getcwd()
     for root, dirs, _files in os.walk(current_dir, topdown=True):
         for folder_name in dirs[:]:
-            if folder_name in [Constants.JAC_MYPY_CACHE]:
+            if folder_name in [Constants.JAC_MYPY_CACHE, Constants.JAC_GEN_DIR]:
                 folder_to_remove = os.path.join(root, folder_name)
                 shutil.rmtree(folder_to_remove)
                 print(f"Removed folder: {folder_to_remove}")
     print("Done cleaning.")
 
 
+@cmd_registry.register
+def migrate(source: str, target: str) -> None:
+    """Copy the anchors of a session to another session.
+
+    :param source: session to copy from.
+    :param target: session to copy to, e.g. sqlite://graph.db
+    """
+    count = migrate_session(source, target)
+    print(f"Migrated {count} anchors to {target}.")
+
+
 @cmd_registry.register
 def debug(filename: str, main: bool = True, cache: bool = False) -> None:
     """Debug the specified .jac file using pdb."""
@@ -0,0 +1,114 @@
+"""Bytecode Cache for Jac Modules.
+
+Compiled modules are stored in a __jac_gen__ folder next to their source file,
+much like Python's __pycache__. Every entry is keyed by a checksum of the
+module source, its annexed .impl.jac/.test.jac files and the running
+jaclang/Python versions, so stale entries are simply recompiled and replaced.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from typing import Optional
+
+from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.semtable import SemRegistry
+from jaclang.settings import settings
+from jaclang.utils.log import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_jaclang_version() -> str:
+    """Get the installed jaclang version."""
+    try:
+        return importlib.metadata.version("jaclang")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@dataclass
+class CacheEntry:
+    """Cached compilation output of a single module."""
+
+    checksum: str
+    bytecode: bytes
+    registry: Optional[SemRegistry] = None
+
+
+class BytecodeCache:
+    """On-disk bytecode cache handler."""
+
+    version: str = get_jaclang_version()
+
+    @staticmethod
+    def get_cache_path(mod_path: str) -> str:
+        """Get the cache file location of a module."""
+        directory, file_name = os.path.split(os.path.abspath(mod_path))
+        return os.path.join(
+            directory, Con.JAC_GEN_DIR, os.path.splitext(file_name)[0] + ".jbc"
+        )
+
+    @classmethod
+    def compute_checksum(cls, mod_path: str, annex_paths: list[str]) -> str:
+        """Compute the checksum of a module and its annexed files."""
+        hasher = hashlib.sha256()
+        hasher.update(importlib.util.MAGIC_NUMBER)
+        hasher.update(cls.version.encode())
+        hasher.update(f"{settings.ignore_test_annex}{settings.disable_mtllm}".encode())
+        for path in [mod_path, *sorted(annex_paths)]:
+            hasher.update(path.encode())
+            with open(path, "rb") as file:
+                hasher.update(hashlib.sha256(file.read()).digest())
+        return hasher.hexdigest()
+
+    @classmethod
+    def load(cls, mod_path: str, annex_paths: list[str]) -> Optional[CacheEntry]:
+        """Load the cached entry of a module if still valid."""
+        cache_path = cls.get_cache_path(mod_path)
+        if not os.path.isfile(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as file:
+                entry = pickle.load(file)
+            checksum = cls.compute_checksum(mod_path, annex_paths)
+        except Exception as e:
+            logger.debug(f"Unable to read bytecode cache {cache_path}: {e}")
+            return None
+        if isinstance(entry, CacheEntry) and entry.checksum == checksum:
+            return entry
+        return None
+
+    @classmethod
+    def store(
+        cls,
+        mod_path: str,
+        annex_paths: list[str],
+        bytecode: bytes,
+        registry: Optional[SemRegistry] = None,
+    ) -> None:
+        """Store the compiled bytecode of a module."""
+        cache_path = cls.get_cache_path(mod_path)
+        try:
+            entry = CacheEntry(
+                checksum=cls.compute_checksum(mod_path, annex_paths),
+                bytecode=bytecode,
+                registry=registry,
+            )
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename so concurrent readers never see partial entries
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=cache_dir, suffix=".tmp", delete=False
+            ) as tmp_file:
+                pickle.dump(entry, tmp_file)
+            os.replace(tmp_file.name, cache_path)
+        except Exception as e:
+            logger.debug(f"Unable to write bytecode cache {cache_path}: {e}")
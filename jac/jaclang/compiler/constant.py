@@ -94,6 +94,7 @@ class Constants(StrEnum):
     ROOT = "root"
     JAC_CHECK = "_check"
     JAC_MYPY_CACHE = ".jac_mypy_cache"
+    JAC_GEN_DIR = "__jac_gen__"
     SUPER_ROOT_UUID = "00000000-0000-0000-0000-000000000000"
 
     def __str__(self) -> str:
@@ -2243,6 +2243,8 @@ class PyastGenPass(AstPass):
                         ),
                     )
                 )
+                if edge_type := self.edge_type_keyword(node.op.edge_spec):
+                    keywords.append(edge_type)
 
             node.gen.py_ast = [
                 self.sync(
@@ -3184,6 +3186,8 @@ class PyastGenPass(AstPass):
                     )
                 )
             )
+            if edge_type := self.edge_type_keyword(node):
+                keywords.append(edge_type)
 
         if edges_only:
             keywords.append(
@@ -3203,6 +3207,17 @@ class PyastGenPass(AstPass):
             )
         )
 
+    def edge_type_keyword(self, node: ast.EdgeOpRef) -> Optional[ast3.keyword]:
+        """Generate the edge_type keyword of a typed edge ref."""
+        if not (node.filter_cond and node.filter_cond.f_type):
+            return None
+        return self.sync(
+            ast3.keyword(
+                arg="edge_type",
+                value=cast(ast3.expr, node.filter_cond.f_type.gen.py_ast[0]),
+            )
+        )
+
     def exit_disconnect_op(self, node: ast.DisconnectOp) -> None:
         """Sub objects.
 
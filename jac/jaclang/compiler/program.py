@@ -10,6 +10,7 @@ from typing import Optional, Type
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.absyntree import Module
+from jaclang.compiler.cache import BytecodeCache
 from jaclang.compiler.parser import JacParser
 from jaclang.compiler.passes import AstPass
 from jaclang.compiler.passes.main import (
@@ -39,7 +40,7 @@ logger = logging.getLogger(__name__)
 class JacProgram:
     """JacProgram to handle the Jac program-related functionalities."""
 
-    def __init__(self) -> None:
+    def __init__(self, cachable: bool = False) -> None:
         """Initialize the JacProgram object."""
         self.sem_ir = SemRegistry()
         self.modules: dict[str, Module] = {}
@@ -47,6 +48,8 @@ class JacProgram:
         self.py_raise_map: dict[str, str] = {}
         self.errors_had: list[Alert] = []
         self.warnings_had: list[Alert] = []
+        self.cachable = cachable
+        self.cached_bytecode: dict[str, bytes] = {}
 
     def get_bytecode(
         self, full_target: str, full_compile: bool = True
@@ -55,15 +58,54 @@ class JacProgram:
         if full_target in self.modules:
             codeobj = self.modules[full_target].gen.py_bytecode
             return marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
+        if full_target in self.cached_bytecode:
+            return marshal.loads(self.cached_bytecode[full_target])
+
+        use_cache = self.cachable and full_compile and full_target.endswith(".jac")
+        if use_cache and (bytecode := self.load_cached_bytecode(full_target)):
+            return marshal.loads(bytecode)
+
+        errors_count = len(self.errors_had)
         result = self.jac_file_to_pass(file_path=full_target, full_compile=full_compile)
         if result.errors_had:
             for alrt in result.errors_had:
                 logger.error(alrt.pretty_print())
+        elif use_cache and len(self.errors_had) == errors_count:
+            self.store_cached_bytecode()
         if result.ir_out.gen.py_bytecode is not None:
             return marshal.loads(result.ir_out.gen.py_bytecode)
         else:
             return None
 
+    def load_cached_bytecode(self, mod_path: str) -> Optional[bytes]:
+        """Load bytecode of a module from the bytecode cache."""
+        impl_files, test_files = self.get_annex_paths(mod_path)
+        if not (entry := BytecodeCache.load(mod_path, impl_files + test_files)):
+            return None
+        if entry.registry:
+            if self.sem_ir:
+                self.sem_ir.registry.update(entry.registry.registry)
+            else:
+                self.sem_ir = entry.registry
+        self.cached_bytecode[mod_path] = entry.bytecode
+        return entry.bytecode
+
+    def store_cached_bytecode(self) -> None:
+        """Store bytecode of all compiled Jac modules in the bytecode cache."""
+        for mod_path, mod in self.modules.items():
+            if (
+                mod_path in self.cached_bytecode
+                or mod.stub_only
+                or not mod_path.endswith(".jac")
+                or not isinstance(mod.gen.py_bytecode, bytes)
+            ):
+                continue
+            impl_files, test_files = self.get_annex_paths(mod_path)
+            BytecodeCache.store(
+                mod_path, impl_files + test_files, mod.gen.py_bytecode, mod.registry
+            )
+            self.cached_bytecode[mod_path] = mod.gen.py_bytecode
+
     def jac_file_to_pass(
         self,
         file_path: str,
@@ -232,8 +274,25 @@ class JacProgram:
             logger.error("Module has no path")
         if not node.loc.mod_path.endswith(".jac"):
             return
-        base_path = node.loc.mod_path[:-4]
-        directory = os.path.dirname(node.loc.mod_path)
+        impl_files, test_files = self.get_annex_paths(node.loc.mod_path)
+        for cur_file in impl_files:
+            mod = self.jac_file_to_pass(file_path=cur_file, schedule=[]).ir_out
+            if mod:
+                node.add_kids_left(mod.kid, parent_update=True, pos_update=False)
+                node.impl_mod.append(mod)
+        for cur_file in test_files:
+            mod = self.jac_file_to_pass(file_path=cur_file, schedule=[]).ir_out
+            if mod and not settings.ignore_test_annex:
+                node.test_mod.append(mod)
+                node.add_kids_right(mod.kid, parent_update=True, pos_update=False)
+
+    @staticmethod
+    def get_annex_paths(mod_path: str) -> tuple[list[str], list[str]]:
+        """Get the impl and test files annexed to a module."""
+        impl_files: list[str] = []
+        test_files: list[str] = []
+        base_path = mod_path[:-4]
+        directory = os.path.dirname(mod_path)
         if not directory:
             directory = os.getcwd()
             base_path = os.path.join(directory, base_path)
@@ -253,24 +312,19 @@ class JacProgram:
                 for test_file in os.listdir(test_folder)
             ]
         for cur_file in search_files:
-            if node.loc.mod_path.endswith(cur_file):
+            if mod_path.endswith(cur_file):
                 continue
             if (
                 cur_file.startswith(f"{base_path}.")
                 or impl_folder == os.path.dirname(cur_file)
             ) and cur_file.endswith(".impl.jac"):
-                mod = self.jac_file_to_pass(file_path=cur_file, schedule=[]).ir_out
-                if mod:
-                    node.add_kids_left(mod.kid, parent_update=True, pos_update=False)
-                    node.impl_mod.append(mod)
+                impl_files.append(cur_file)
             if (
                 cur_file.startswith(f"{base_path}.")
                 or test_folder == os.path.dirname(cur_file)
             ) and cur_file.endswith(".test.jac"):
-                mod = self.jac_file_to_pass(file_path=cur_file, schedule=[]).ir_out
-                if mod and not settings.ignore_test_annex:
-                    node.test_mod.append(mod)
-                    node.add_kids_right(mod.kid, parent_update=True, pos_update=False)
+                test_files.append(cur_file)
+        return impl_files, test_files
 
     @staticmethod
     def jac_file_formatter(
@@ -6,11 +6,15 @@ semantic information.
 
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from itertools import count
+from typing import Any, Iterable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import jaclang.compiler.absyntree as ast
 
+# shared by all registries so a version never matches another registry's
+VERSIONS = count(1)
+
 
 class SemInfo:
     """Semantic information class."""
@@ -92,22 +96,136 @@ class SemScope:
         return type_str
 
 
+class SemScopes(dict):
+    """Scopes of a registry, counting changes made without SemRegistry.add."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the scopes."""
+        super().__init__(*args, **kwargs)
+        self.version = next(VERSIONS)
+
+    def __setitem__(self, key: SemScope, value: list[SemInfo]) -> None:
+        """Set the semantic information of a scope."""
+        super().__setitem__(key, value)
+        self.version = next(VERSIONS)
+
+    def __delitem__(self, key: SemScope) -> None:
+        """Remove a scope."""
+        super().__delitem__(key)
+        self.version = next(VERSIONS)
+
+    def __ior__(self, other: Any) -> SemScopes:  # type: ignore[override, misc] # noqa: ANN401
+        """Merge scopes in place."""
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Merge scopes."""
+        super().update(*args, **kwargs)
+        self.version = next(VERSIONS)
+
+    def setdefault(self, key: SemScope, default: Any = None) -> Any:  # noqa: ANN401
+        """Get or set the semantic information of a scope."""
+        self.version = next(VERSIONS)
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:  # noqa: ANN401
+        """Remove a scope."""
+        self.version = next(VERSIONS)
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[SemScope, list[SemInfo]]:
+        """Remove the last scope."""
+        self.version = next(VERSIONS)
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Remove all scopes."""
+        super().clear()
+        self.version = next(VERSIONS)
+
+
+class SemIndex:
+    """Hashed lookups over the scopes of a registry.
+
+    Scopes are keyed by their dotted string, and semantic information by name
+    and type both within a scope string and across the registry. Only the first
+    match in registry order is kept, as linear lookups would find it first.
+    """
+
+    def __init__(self, registry: SemScopes) -> None:
+        """Index the scopes of a registry."""
+        self.version = registry.version
+        self.scopes: dict[str, list[SemScope]] = {}
+        self.order: dict[int, int] = {}
+        self.names: dict[tuple[Optional[str], str], tuple[SemScope, SemInfo]] = {}
+        self.types: dict[tuple[Optional[str], str], tuple[SemScope, SemInfo]] = {}
+        for scope, infos in registry.items():
+            scope_str = self.add_scope(scope)
+            for info in infos:
+                self.add(scope, info, scope_str)
+
+    def add_scope(self, scope: SemScope) -> str:
+        """Index a scope appended to the registry."""
+        self.order[id(scope)] = len(self.order)
+        self.scopes.setdefault(scope_str := str(scope), []).append(scope)
+        return scope_str
+
+    def add(self, scope: SemScope, info: SemInfo, scope_str: str = "") -> None:
+        """Index semantic information appended to a scope."""
+        order = self.order[id(scope)]
+        scope_str = scope_str or str(scope)
+        for index, key in ((self.names, info.name), (self.types, info.type)):
+            if key:
+                for entry in ((scope_str, key), (None, key)):
+                    # a later scope can't shadow an earlier one
+                    current = index.get(entry)
+                    if current is None or order < self.order[id(current[0])]:
+                        index[entry] = (scope, info)
+
+
 class SemRegistry:
     """Registry class."""
 
     def __init__(self) -> None:
         """Initialize the class."""
-        self.registry: dict[SemScope, list[SemInfo]] = {}
+        self.registry: dict[SemScope, list[SemInfo]] = SemScopes()
+
+    @property
+    def index(self) -> SemIndex:
+        """Get the lookup index, rebuilding it if scopes changed outside add."""
+        registry = self.registry
+        if not isinstance(registry, SemScopes):
+            # assigned or unpickled from an older version
+            registry = self.registry = SemScopes(registry)
+        index: Optional[SemIndex] = self.__dict__.get("_index")
+        if index is None or index.version != registry.version:
+            index = self._index = SemIndex(registry)
+        return index
+
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the registry does."""
+        return self.index.version
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the pickled state without the lookup index."""
+        state = self.__dict__.copy()
+        state.pop("_index", None)
+        return state
 
     def add(self, scope: SemScope, seminfo: SemInfo) -> None:
         """Add semantic information to the registry."""
-        for k in self.registry.keys():
-            if str(k) == str(scope):
-                scope = k
-                break
+        index = self.index
+        if scopes := index.scopes.get(scope_str := str(scope)):
+            scope = scopes[0]
         else:
-            self.registry[scope] = []
+            dict.__setitem__(self.registry, scope, [])
+            index.add_scope(scope)
         self.registry[scope].append(seminfo)
+        index.add(scope, seminfo, scope_str)
+        # count the change while keeping the index that was just updated
+        index.version = self.registry.version = next(VERSIONS)  # type: ignore[attr-defined]
 
     def lookup(
         self,
@@ -116,31 +234,28 @@ class SemRegistry:
         type: Optional[str] = None,
     ) -> tuple[Optional[SemScope], Optional[SemInfo | list[SemInfo]]]:
         """Lookup semantic information in the registry."""
-        if scope:
-            for k, v in self.registry.items():
-                if str(k) == str(scope):
-                    if name:
-                        for i in v:
-                            if i.name == name:
-                                return k, i
-                    elif type:
-                        for i in v:
-                            if i.type == type:
-                                return k, i
-                    else:
-                        return k, v
-        else:
-            for k, v in self.registry.items():
-                if name:
-                    for i in v:
-                        if i.name == name:
-                            return k, i
-                elif type:
-                    for i in v:
-                        if i.type == type:
-                            return k, i
+        index = self.index
+        scope_str = str(scope) if scope else None
+        if name:
+            return index.names.get((scope_str, name), (None, None))
+        if type:
+            return index.types.get((scope_str, type), (None, None))
+        if scope_str and (scopes := index.scopes.get(scope_str)):
+            return scopes[0], self.registry[scopes[0]]
         return None, None
 
+    def get_scopes(self, scope_strs: Iterable[str]) -> list[SemScope]:
+        """Get the scopes matching any of the given scope strings, in registry order."""
+        index = self.index
+        return sorted(
+            (
+                scope
+                for scope_str in set(scope_strs)
+                for scope in index.scopes.get(scope_str, [])
+            ),
+            key=lambda scope: index.order[id(scope)],
+        )
+
     @property
     def module_scope(self) -> SemScope:
         """Get the module scope."""
@@ -0,0 +1,94 @@
+"""Tests for the semantic registry."""
+
+import pickle
+
+from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+from jaclang.utils.test import TestCase
+
+
+def info(name: str, type: str | None = None) -> SemInfo:
+    """Create semantic information without an ast node."""
+    return SemInfo(None, name, type, f"{name} semstr")  # type: ignore[arg-type]
+
+
+class TestSemRegistry(TestCase):
+    """Test registry lookups."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        self.module = SemScope("app", "Module")
+        self.person = SemScope("Person", "obj", self.module)
+        self.registry = SemRegistry()
+        self.registry.add(self.module, info("Person", "obj"))
+        self.registry.add(self.person, info("name", "str"))
+        self.registry.add(SemScope("Person", "obj", self.module), info("age", "int"))
+
+    def test_lookup(self) -> None:
+        """Test lookups by scope, name and type."""
+        registry = self.registry
+        scope = SemScope.get_scope_from_str("app(Module).Person(obj)")
+        found, children = registry.lookup(scope=scope)
+        self.assertIs(found, self.person)
+        self.assertEqual([i.name for i in children], ["name", "age"])  # type: ignore[union-attr]
+        self.assertEqual(registry.lookup(scope=scope, name="age")[1].type, "int")  # type: ignore[union-attr]
+        self.assertEqual(registry.lookup(scope=scope, type="str")[1].name, "name")  # type: ignore[union-attr]
+        self.assertEqual(
+            registry.lookup(name="Person"),
+            (self.module, registry.registry[self.module][0]),
+        )
+        self.assertEqual(registry.lookup(scope=self.module, name="age"), (None, None))
+        self.assertEqual(registry.lookup(name="missing"), (None, None))
+        self.assertEqual(registry.lookup(), (None, None))
+        self.assertEqual(
+            [i.name for i in registry.registry[self.module][0].get_children(registry)],
+            ["name", "age"],
+        )
+
+    def test_merged_registries(self) -> None:
+        """Test registries merged with update keep the first match in order."""
+        other = SemRegistry()
+        other_person = SemScope("Person", "obj", SemScope("app", "Module"))
+        other.add(other_person, info("age", "float"))
+        other.add(other_person, info("email", "str"))
+
+        registry = self.registry
+        registry.lookup(name="age")
+        registry.registry.update(other.registry)
+        scope = SemScope.get_scope_from_str("app(Module).Person(obj)")
+        self.assertEqual(registry.lookup(scope=scope, name="age")[1].type, "int")  # type: ignore[union-attr]
+        self.assertEqual(
+            registry.lookup(scope=scope, name="email"),
+            (other_person, other.registry[other_person][1]),
+        )
+        self.assertIs(registry.lookup(scope=scope)[0], self.person)
+        self.assertEqual(
+            registry.get_scopes(["app(Module).Person(obj)", "app(Module)"]),
+            [self.module, self.person, other_person],
+        )
+
+        # adding to a merged scope string appends to its first scope
+        registry.add(SemScope("Person", "obj", self.module), info("phone", "str"))
+        self.assertIs(registry.lookup(name="phone")[0], self.person)
+
+        loaded = pickle.loads(pickle.dumps(registry))
+        self.assertNotIn("_index", loaded.__dict__)
+        self.assertEqual(loaded.lookup(scope=scope, name="email")[1].type, "str")  # type: ignore[union-attr]
+
+        # registries assigned a plain dict are indexed too
+        registry.registry = {self.module: [info("Other", "obj")]}
+        self.assertEqual(registry.lookup(name="Other")[0], self.module)
+        self.assertEqual(registry.lookup(name="Person"), (None, None))
+
+    def test_version(self) -> None:
+        """Test the version changes with the registry and is never shared."""
+        registry = self.registry
+        version = registry.version
+        self.assertEqual(registry.version, version)
+        registry.add(self.person, info("email", "str"))
+        self.assertNotEqual(registry.version, version)
+
+        version = registry.version
+        registry.registry.update(SemRegistry().registry)
+        self.assertNotEqual(registry.version, version)
+        self.assertNotEqual(SemRegistry().version, SemRegistry().version)
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import inspect
+from bisect import bisect_left
+from collections import deque
 from dataclasses import asdict, dataclass, field, fields, is_dataclass
-from enum import IntEnum
+from enum import Enum, IntEnum, IntFlag
 from functools import cached_property
 from logging import getLogger
+from operator import indexOf
 from pickle import dumps
 from types import UnionType
 from typing import Any, Callable, ClassVar, Optional, TypeVar
@@ -39,6 +42,19 @@ class AccessLevel(IntEnum):
                 return val
 
 
+class AnchorChange(IntFlag):
+    """Parts of an anchor changed since it was loaded."""
+
+    NONE = 0
+    ARCHITYPE = 1
+    ACCESS = 2
+    EDGES = 4
+    ALL = ARCHITYPE | ACCESS | EDGES
+
+
+IMMUTABLE_TYPES = (str, int, float, complex, bytes, bool, type(None), UUID, Enum)
+
+
 @dataclass
 class Access:
     """Access Structure."""
@@ -76,6 +92,8 @@ class Anchor:
     access: Permission = field(default_factory=Permission)
     persistent: bool = False
     hash: int = 0
+    # new anchors are written whole, loaded ones only when changed
+    changes: AnchorChange = field(default=AnchorChange.ALL, repr=False)
 
     def is_populated(self) -> bool:
         """Check if state."""
@@ -137,14 +155,40 @@ class Anchor:
 
         if self.is_populated() and self.architype:
             self.architype.__jac__ = self
-            self.hash = hash(dumps(self))
+            self.changes = AnchorChange.NONE
+            # in place mutations are only caught by comparing pickles
+            self.hash = 0 if self.is_tracked() else hash(dumps(self))
+
+    def is_tracked(self) -> bool:
+        """Check if every architype value is immutable.
+
+        Changes of such architypes are all attribute assignments, which mark
+        the anchor as changed.
+        """
+
+        def immutable(value: object) -> bool:
+            if isinstance(value, (tuple, frozenset)):
+                return all(immutable(i) for i in value)
+            return isinstance(value, IMMUTABLE_TYPES)
+
+        return all(
+            immutable(value)
+            for name, value in self.architype.__dict__.items()
+            if name != "__jac__"
+        )
+
+    def get_changes(self) -> AnchorChange:
+        """Get the parts changed since the anchor was loaded."""
+        if self.hash and self.hash != hash(dumps(self)):
+            return AnchorChange.ALL
+        return self.changes
 
     def __repr__(self) -> str:
         """Override representation."""
         if self.is_populated():
             attrs = ""
             for f in fields(self):
-                if f.name in self.__dict__:
+                if f.repr and f.name in self.__dict__:
                     attrs += f"{f.name}={self.__dict__[f.name]}, "
             attrs = attrs[:-2]
         else:
@@ -191,6 +235,148 @@ class NodeAnchor(Anchor):
 
         return state
 
+    @property
+    def edge_index(self) -> EdgeIndex:
+        """Get the adjacency index of the current edges."""
+        index: EdgeIndex | None = self.__dict__.get("_edge_index")
+        # rebuilt whenever edges is replaced or changed without add/remove_edge
+        if index is None or index.edges is not self.edges or not index.is_synced():
+            index = self.__dict__["_edge_index"] = EdgeIndex(self, self.edges)
+        return index
+
+    def add_edge(self, edge: EdgeAnchor) -> None:
+        """Attach an edge to this node."""
+        self.edge_index.add(edge)
+        # populated stubs are copies, mark the anchor held by the architype
+        self.architype.__jac__.changes |= AnchorChange.EDGES
+
+    def remove_edge(self, edge: EdgeAnchor) -> bool:
+        """Detach an edge from this node."""
+        if removed := self.edge_index.remove(edge):
+            self.architype.__jac__.changes |= AnchorChange.EDGES
+        return removed
+
+
+@dataclass(eq=False, repr=False)
+class EdgeIndex:
+    """Adjacency index of a node's edges.
+
+    Edges are indexed by id and insertion order, and once queried, grouped by
+    direction and edge class so typed refs and removals only touch matching
+    edges. Directional groups need populated edges so they are built lazily.
+    Traversals prefetch the edges of a node before first querying its index.
+    """
+
+    node: NodeAnchor
+    edges: list[EdgeAnchor]
+    size: int = 0
+    ids: dict[UUID, list[EdgeAnchor]] = field(default_factory=dict)
+    order: dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    outgoing: dict[type | None, dict[UUID, EdgeAnchor]] | None = None
+    incoming: dict[type | None, dict[UUID, EdgeAnchor]] | None = None
+    prefetched: bool = False
+
+    def __post_init__(self) -> None:
+        """Index current edges."""
+        for edge in self.edges:
+            self.index(edge)
+
+    def is_synced(self) -> bool:
+        """Check if edges were not changed outside the index."""
+        return self.size == len(self.edges)
+
+    def index(self, edge: EdgeAnchor) -> None:
+        """Index an edge at the end of the node's edges."""
+        self.ids.setdefault(edge.id, []).append(edge)
+        # edges only get appended so their order stays sorted for bisect
+        self.order.setdefault(id(edge), self.count)
+        self.count += 1
+        self.size += 1
+        if self.outgoing is not None:
+            self.group(edge)
+
+    def add(self, edge: EdgeAnchor) -> None:
+        """Append an edge."""
+        self.edges.append(edge)
+        self.index(edge)
+
+    def remove(self, edge: EdgeAnchor) -> bool:
+        """Remove an edge by id."""
+        try:
+            return self.discard(edge)
+        except (KeyError, ValueError):
+            # edges were replaced in place, leaving their count unchanged
+            self.rebuild()
+            return self.discard(edge)
+
+    def rebuild(self) -> None:
+        """Reindex the current edges."""
+        self.ids, self.order, self.count, self.size = {}, {}, 0, 0
+        self.outgoing = self.incoming = None
+        self.__post_init__()
+
+    def discard(self, edge: EdgeAnchor) -> bool:
+        """Remove an edge by id from an index in sync with the edges."""
+        if not (anchors := self.ids.get(edge.id)):
+            return False
+        anchor = anchors.pop(0)
+
+        order = self.order
+        pos = bisect_left(self.edges, order[id(anchor)], key=lambda e: order[id(e)])
+        if pos >= len(self.edges) or self.edges[pos] is not anchor:
+            pos = indexOf(map(id, self.edges), id(anchor))
+        del self.edges[pos]
+        self.size -= 1
+
+        if not any(i is anchor for i in anchors):
+            del order[id(anchor)]
+        if not anchors:
+            del self.ids[edge.id]
+            for groups in (self.outgoing or {}, self.incoming or {}):
+                for edge_type in list(groups):
+                    group = groups[edge_type]
+                    if group.pop(edge.id, None) and not group:
+                        del groups[edge_type]
+        return True
+
+    def group(self, edge: EdgeAnchor) -> None:
+        """Group an edge by direction and edge class."""
+        if self.outgoing is None or self.incoming is None:
+            return
+        edge_type = type(edge.architype)
+        for groups, node in (
+            (self.outgoing, edge.source),
+            (self.incoming, edge.target),
+        ):
+            if node == self.node:
+                groups.setdefault(None, {})[edge.id] = edge
+                groups.setdefault(edge_type, {})[edge.id] = edge
+
+    def directed(
+        self, outgoing: bool, edge_type: type | None = None
+    ) -> list[EdgeAnchor] | None:
+        """Get edges in one direction, optionally of an edge class.
+
+        Returns None if matches span several edge classes, as grouped results
+        would not keep the node's edge order.
+        """
+        if self.outgoing is None or self.incoming is None:
+            self.outgoing, self.incoming = {}, {}
+            for edge in self.edges:
+                self.group(edge)
+
+        groups = self.outgoing if outgoing else self.incoming
+        if edge_type is None:
+            return list(groups.get(None, {}).values())
+
+        matched = [
+            cls for cls in groups if cls is not None and issubclass(cls, edge_type)
+        ]
+        if len(matched) > 1:
+            return None
+        return list(groups[matched[0]].values()) if matched else []
+
 
 @dataclass(eq=False, repr=False, kw_only=True)
 class EdgeAnchor(Anchor):
@@ -223,8 +409,8 @@ class WalkerAnchor(Anchor):
 
     architype: WalkerArchitype
     path: list[NodeAnchor] = field(default_factory=list)
-    next: list[NodeAnchor] = field(default_factory=list)
-    ignores: list[NodeAnchor] = field(default_factory=list)
+    next: deque[NodeAnchor] = field(default_factory=deque)
+    ignores: set[NodeAnchor] = field(default_factory=set)
     disengaged: bool = False
 
 
@@ -241,6 +427,7 @@ class Architype:
 
     _jac_entry_funcs_: ClassVar[list[DataSpatialFunction]] = []
     _jac_exit_funcs_: ClassVar[list[DataSpatialFunction]] = []
+    _jac_dispatch_: ClassVar[WalkerDispatch | None] = None
 
     @cached_property
     def __jac__(self) -> Anchor:
@@ -254,6 +441,18 @@ class Architype:
 
             _.make_architype(cls)
 
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Mark the anchor as changed on attribute assignment."""
+        super().__setattr__(name, value)
+        if name != "__jac__" and (anchor := self.__dict__.get("__jac__")):
+            anchor.changes |= AnchorChange.ARCHITYPE
+
+    def __delattr__(self, name: str) -> None:
+        """Mark the anchor as changed on attribute deletion."""
+        super().__delattr__(name)
+        if anchor := self.__dict__.get("__jac__"):
+            anchor.changes |= AnchorChange.ARCHITYPE
+
     def __repr__(self) -> str:
         """Override repr for architype."""
         return f"{self.__class__.__name__}"
@@ -281,6 +480,8 @@ class WalkerArchitype(Architype):
     """Walker Architype Protocol."""
 
     __jac_base__: ClassVar[bool] = True
+    # levels of neighbors to load ahead from each visited node
+    __prefetch__: ClassVar[int] = 0
 
     @cached_property
     def __jac__(self) -> WalkerAnchor:
@@ -342,3 +543,85 @@ class DataSpatialFunction:
             ty = second_param.annotation
             return ty if ty != inspect._empty else None
         return None
+
+
+@dataclass(eq=False)
+class WalkerDispatch:
+    """Precomputed abilities of a walker class per visited node class."""
+
+    walker: type[WalkerArchitype]
+    entries: list[DataSpatialFunction]
+    exits: list[DataSpatialFunction]
+    visits: dict[type, list[tuple[Callable[[Any, Any], Any], bool]]] = field(
+        default_factory=dict
+    )
+
+    @staticmethod
+    def get(walker: type[WalkerArchitype]) -> WalkerDispatch:
+        """Get the dispatch table of a walker class."""
+        # looked up on the class itself so subclasses never reuse a parent table
+        if not isinstance(
+            dispatch := walker.__dict__.get("_jac_dispatch_"), WalkerDispatch
+        ):
+            dispatch = WalkerDispatch(
+                walker=walker,
+                entries=[i for i in walker._jac_entry_funcs_ if not i.trigger],
+                exits=[i for i in walker._jac_exit_funcs_ if not i.trigger],
+            )
+            walker._jac_dispatch_ = dispatch
+        return dispatch
+
+    def abilities(
+        self, node: type[NodeArchitype]
+    ) -> list[tuple[Callable[[Any, Any], Any], bool]]:
+        """Get the ordered abilities to run when visiting a node class.
+
+        Each item is the ability and whether the node is its first argument.
+        """
+        if (abilities := self.visits.get(node)) is None:
+            self.visits[node] = abilities = self.build(node)
+        return abilities
+
+    def build(
+        self, node: type[NodeArchitype]
+    ) -> list[tuple[Callable[[Any, Any], Any], bool]]:
+        """Build the ordered abilities of a node class."""
+        from jaclang.runtimelib.utils import all_issubclass
+
+        walker = self.walker
+
+        def with_walker(funcs: list[DataSpatialFunction]) -> list[Callable]:
+            return [
+                i.func
+                for i in funcs
+                if i.trigger
+                and all_issubclass(i.trigger, WalkerArchitype)
+                and issubclass(walker, i.trigger)
+            ]
+
+        def with_node(funcs: list[DataSpatialFunction]) -> list[Callable]:
+            return [
+                i.func
+                for i in funcs
+                if i.trigger
+                and all_issubclass(i.trigger, NodeArchitype)
+                and issubclass(node, i.trigger)
+            ]
+
+        def untriggered(funcs: list[DataSpatialFunction]) -> list[Callable]:
+            return [i.func for i in funcs if not i.trigger]
+
+        return [
+            # walker entry with
+            *((func, False) for func in with_node(walker._jac_entry_funcs_)),
+            # node entry
+            *((func, True) for func in untriggered(node._jac_entry_funcs_)),
+            # node entry with
+            *((func, True) for func in with_walker(node._jac_entry_funcs_)),
+            # node exit with
+            *((func, True) for func in with_walker(node._jac_exit_funcs_)),
+            # node exit
+            *((func, True) for func in untriggered(node._jac_exit_funcs_)),
+            # walker exit with
+            *((func, False) for func in with_node(walker._jac_exit_funcs_)),
+        ]
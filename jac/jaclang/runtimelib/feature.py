@@ -10,7 +10,7 @@ import os
 import sys
 import tempfile
 import types
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from functools import wraps
 from inspect import getfile
@@ -37,9 +37,11 @@ from jaclang.compiler.constant import EdgeDir, colors
 from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
 from jaclang.compiler.program import JacProgram
 from jaclang.runtimelib.architype import (
+    AnchorChange,
     DataSpatialFunction,
     GenericEdge as _GenericEdge,
     Root as _Root,
+    WalkerDispatch,
 )
 from jaclang.runtimelib.constructs import (
     AccessLevel,
@@ -57,7 +59,6 @@ from jaclang.runtimelib.constructs import (
 from jaclang.runtimelib.machine import ExecutionContext, JacMachineState
 from jaclang.runtimelib.memory import Shelf, ShelfStorage
 from jaclang.runtimelib.utils import (
-    all_issubclass,
     collect_node_connections,
     traverse_graph,
 )
@@ -65,7 +66,61 @@ from jaclang.runtimelib.utils import (
 import pluggy
 
 
-plugin_manager = pluggy.PluginManager("jac")
+class JacPluginManager(pluggy.PluginManager):
+    """Plugin manager that resets resolved feature dispatch on plugin changes."""
+
+    def __init__(self, project_name: str) -> None:
+        """Initialize JacPluginManager."""
+        super().__init__(project_name)
+        self.direct_dispatch = True
+        self.dispatch_resets: list[Callable[[], None]] = []
+
+    def reset_dispatch(self) -> None:
+        """Drop all resolved dispatchers so they are rebuilt on next call."""
+        for reset in self.dispatch_resets:
+            reset()
+
+    def register(self, plugin: object, name: str | None = None) -> str | None:
+        """Register a plugin and reset resolved dispatch."""
+        ret = super().register(plugin, name)
+        self.reset_dispatch()
+        return ret
+
+    def unregister(
+        self, plugin: object | None = None, name: str | None = None
+    ) -> Any | None:  # noqa: ANN401
+        """Unregister a plugin and reset resolved dispatch."""
+        ret = super().unregister(plugin, name)
+        self.reset_dispatch()
+        return ret
+
+    def set_blocked(self, name: str) -> None:
+        """Block a plugin and reset resolved dispatch."""
+        super().set_blocked(name)
+        self.reset_dispatch()
+
+    def add_hookspecs(self, module_or_class: types.ModuleType | type) -> None:
+        """Add hookspecs and reset resolved dispatch."""
+        super().add_hookspecs(module_or_class)
+        self.reset_dispatch()
+
+    def add_hookcall_monitoring(
+        self, before: Callable[..., None], after: Callable[..., None]
+    ) -> Callable[[], None]:
+        """Monitor hook calls, which requires dispatching through pluggy."""
+        undo = super().add_hookcall_monitoring(before, after)
+        self.direct_dispatch = False
+        self.reset_dispatch()
+
+        def undo_monitoring() -> None:
+            undo()
+            self.direct_dispatch = True
+            self.reset_dispatch()
+
+        return undo_monitoring
+
+
+plugin_manager = JacPluginManager("jac")
 hookspec = pluggy.HookspecMarker("jac")
 hookimpl = pluggy.HookimplMarker("jac")
 logger = getLogger(__name__)
@@ -92,11 +147,14 @@ class JacAccessValidation:
     ) -> None:
         """Allow all access from target root graph to current Architype."""
         level = AccessLevel.cast(level)
-        access = architype.__jac__.access.roots
+        anchor = architype.__jac__
+        access = anchor.access.roots
 
         _root_id = str(root_id)
         if level != access.anchors.get(_root_id, AccessLevel.NO_ACCESS):
             access.anchors[_root_id] = level
+            anchor.changes |= AnchorChange.ACCESS
+            JacFeature.get_context().access_levels.clear()
 
     @staticmethod
     def disallow_root(
@@ -106,9 +164,12 @@ class JacAccessValidation:
     ) -> None:
         """Disallow all access from target root graph to current Architype."""
         level = AccessLevel.cast(level)
-        access = architype.__jac__.access.roots
+        anchor = architype.__jac__
+        access = anchor.access.roots
 
-        access.anchors.pop(str(root_id), None)
+        if access.anchors.pop(str(root_id), None) is not None:
+            anchor.changes |= AnchorChange.ACCESS
+            JacFeature.get_context().access_levels.clear()
 
     @staticmethod
     def unrestrict(
@@ -120,6 +181,8 @@ class JacAccessValidation:
         level = AccessLevel.cast(level)
         if level != anchor.access.all:
             anchor.access.all = level
+            anchor.changes |= AnchorChange.ACCESS
+            JacFeature.get_context().access_levels.clear()
 
     @staticmethod
     def restrict(architype: Architype) -> None:
@@ -128,6 +191,8 @@ class JacAccessValidation:
         anchor = architype.__jac__
         if anchor.access.all > AccessLevel.NO_ACCESS:
             anchor.access.all = AccessLevel.NO_ACCESS
+            anchor.changes |= AnchorChange.ACCESS
+            JacFeature.get_context().access_levels.clear()
 
     @staticmethod
     def check_read_access(to: Anchor) -> bool:
@@ -141,6 +206,31 @@ class JacAccessValidation:
             )
         return access_level
 
+    @staticmethod
+    def check_read_access_many(to: list[Anchor]) -> list[bool]:
+        """Read Access Validation of several anchors sharing one context."""
+        # non persistent anchors are always accessible, no context needed
+        if not any(anchor.persistent for anchor in to):
+            return [True] * len(to)
+
+        jctx = JacFeature.get_context()
+        levels = jctx.access_levels
+        root_id = jctx.root.id
+
+        readable = []
+        for anchor in to:
+            if not anchor.persistent:
+                readable.append(True)
+                continue
+            if (level := levels.get(key := (root_id, anchor.id))) is None:
+                level = levels[key] = access_level(jctx, anchor)
+            if not (allowed := level > AccessLevel.NO_ACCESS):
+                logger.info(
+                    f"Current root doesn't have read access to {anchor.__class__.__name__}[{anchor.id}]"
+                )
+            readable.append(allowed)
+        return readable
+
     @staticmethod
     def check_connect_access(to: Anchor) -> bool:
         """Write Access Validation."""
@@ -170,37 +260,7 @@ class JacAccessValidation:
         if not to.persistent:
             return AccessLevel.WRITE
 
-        jctx = JacFeature.get_context()
-
-        jroot = jctx.root
-
-        # if current root is system_root
-        # if current root id is equal to target anchor's root id
-        # if current root is the target anchor
-        if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
-            return AccessLevel.WRITE
-
-        access_level = AccessLevel.NO_ACCESS
-
-        # if target anchor have set access.all
-        if (to_access := to.access).all > AccessLevel.NO_ACCESS:
-            access_level = to_access.all
-
-        # if target anchor's root have set allowed roots
-        # if current root is allowed to the whole graph of target anchor's root
-        if to.root and isinstance(to_root := jctx.mem.find_one(to.root), Anchor):
-            if to_root.access.all > access_level:
-                access_level = to_root.access.all
-
-            if (level := to_root.access.roots.check(str(jroot.id))) is not None:
-                access_level = level
-
-        # if target anchor have set allowed roots
-        # if current root is allowed to target anchor
-        if (level := to_access.roots.check(str(jroot.id))) is not None:
-            access_level = level
-
-        return access_level
+        return access_level(JacFeature.get_context(), to)
 
 
 class JacNode:
@@ -237,32 +297,20 @@ class JacNode:
         dir: EdgeDir,
         filter: Callable[[EdgeArchitype], bool] | None,
         target_obj: list[NodeArchitype] | None,
+        edge_type: Optional[Type[EdgeArchitype]] = None,
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
-        ret_edges: list[EdgeArchitype] = []
-        for anchor in node.edges:
-            if (
-                (source := anchor.source)
-                and (target := anchor.target)
-                and (not filter or filter(anchor.architype))
-                and source.architype
-                and target.architype
-            ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and node == source
-                    and (not target_obj or target.architype in target_obj)
-                    and JacFeature.check_read_access(target)
-                ):
-                    ret_edges.append(anchor.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and node == target
-                    and (not target_obj or source.architype in target_obj)
-                    and JacFeature.check_read_access(source)
-                ):
-                    ret_edges.append(anchor.architype)
-        return ret_edges
+        return [
+            anchor.architype
+            for anchor, _ in adjacent_edges(
+                node,
+                dir,
+                filter,
+                target_obj,
+                edge_type,
+                JacFeature.check_read_access_many,
+            )
+        ]
 
     @staticmethod
     def edges_to_nodes(
@@ -270,41 +318,25 @@ class JacNode:
         dir: EdgeDir,
         filter: Callable[[EdgeArchitype], bool] | None,
         target_obj: list[NodeArchitype] | None,
+        edge_type: Optional[Type[EdgeArchitype]] = None,
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
-        ret_edges: list[NodeArchitype] = []
-        for anchor in node.edges:
-            if (
-                (source := anchor.source)
-                and (target := anchor.target)
-                and (not filter or filter(anchor.architype))
-                and source.architype
-                and target.architype
-            ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and node == source
-                    and (not target_obj or target.architype in target_obj)
-                    and JacFeature.check_read_access(target)
-                ):
-                    ret_edges.append(target.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and node == target
-                    and (not target_obj or source.architype in target_obj)
-                    and JacFeature.check_read_access(source)
-                ):
-                    ret_edges.append(source.architype)
-        return ret_edges
+        return [
+            other.architype
+            for _, other in adjacent_edges(
+                node,
+                dir,
+                filter,
+                target_obj,
+                edge_type,
+                JacFeature.check_read_access_many,
+            )
+        ]
 
     @staticmethod
     def remove_edge(node: NodeAnchor, edge: EdgeAnchor) -> None:
         """Remove reference without checking sync status."""
-
-        for idx, ed in enumerate(node.edges):
-            if ed.id == edge.id:
-                node.edges.pop(idx)
-                break
+        node.remove_edge(edge)
 
 
 class JacEdge:
@@ -374,10 +406,10 @@ class JacWalker:
             ):
                 if anchor not in wanch.ignores:
                     if isinstance(anchor, NodeAnchor):
-                        wanch.ignores.append(anchor)
+                        wanch.ignores.add(anchor)
                     elif isinstance(anchor, EdgeAnchor):
                         if target := anchor.target:
-                            wanch.ignores.append(target)
+                            wanch.ignores.add(target)
                         else:
                             raise ValueError("Edge has no target.")
             return len(wanch.ignores) > before_len
@@ -410,83 +442,37 @@ class JacWalker:
             raise TypeError("Invalid walker object")
 
         walker.path = []
-        walker.next = [node]
+        walker.next = deque([node])
         current_node = node.architype
+        dispatch = WalkerDispatch.get(warch.__class__)
+        mem = JacFeature.get_context().mem if warch.__prefetch__ else None
 
         # walker entry
-        for i in warch._jac_entry_funcs_:
-            if not i.trigger:
-                i.func(warch, current_node)
+        for i in dispatch.entries:
+            i.func(warch, current_node)
             if walker.disengaged:
                 return warch
 
         while len(walker.next):
-            if current_node := walker.next.pop(0).architype:
-                # walker entry with
-                for i in warch._jac_entry_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, NodeArchitype)
-                        and isinstance(current_node, i.trigger)
-                    ):
-                        i.func(warch, current_node)
-                    if walker.disengaged:
-                        return warch
-
-                # node entry
-                for i in current_node._jac_entry_funcs_:
-                    if not i.trigger:
-                        i.func(current_node, warch)
-                    if walker.disengaged:
-                        return warch
-
-                # node entry with
-                for i in current_node._jac_entry_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, WalkerArchitype)
-                        and isinstance(warch, i.trigger)
-                    ):
-                        i.func(current_node, warch)
-                    if walker.disengaged:
-                        return warch
-
-                # node exit with
-                for i in current_node._jac_exit_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, WalkerArchitype)
-                        and isinstance(warch, i.trigger)
-                    ):
-                        i.func(current_node, warch)
-                    if walker.disengaged:
-                        return warch
-
-                # node exit
-                for i in current_node._jac_exit_funcs_:
-                    if not i.trigger:
-                        i.func(current_node, warch)
+            if mem and not (index := walker.next[0].edge_index).prefetched:
+                mem.populate_data(index.edges, warch.__prefetch__)
+                index.prefetched = True
+            if current_node := walker.next.popleft().architype:
+                for func, node_first in dispatch.abilities(current_node.__class__):
+                    if node_first:
+                        func(current_node, warch)
+                    else:
+                        func(warch, current_node)
                     if walker.disengaged:
                         return warch
 
-                # walker exit with
-                for i in warch._jac_exit_funcs_:
-                    if (
-                        i.trigger
-                        and all_issubclass(i.trigger, NodeArchitype)
-                        and isinstance(current_node, i.trigger)
-                    ):
-                        i.func(warch, current_node)
-                    if walker.disengaged:
-                        return warch
         # walker exit
-        for i in warch._jac_exit_funcs_:
-            if not i.trigger:
-                i.func(warch, current_node)
+        for i in dispatch.exits:
+            i.func(warch, current_node)
             if walker.disengaged:
                 return warch
 
-        walker.ignores = []
+        walker.ignores = set()
         return warch
 
     @staticmethod
@@ -679,6 +665,7 @@ class JacBasics:
 
         cls._jac_entry_funcs_ = [*entries.values()]
         cls._jac_exit_funcs_ = [*exits.values()]
+        cls._jac_dispatch_ = None
 
         dataclass(eq=False)(cls)
         return cls
@@ -912,6 +899,7 @@ class JacBasics:
         dir: EdgeDir = EdgeDir.OUT,
         filter: Callable[[EdgeArchitype], bool] | None = None,
         edges_only: bool = False,
+        edge_type: Optional[Type[EdgeArchitype]] = None,
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         if isinstance(sources, NodeArchitype):
@@ -921,24 +909,30 @@ class JacBasics:
             if isinstance(targets, NodeArchitype)
             else targets if targets else None
         )
+        # dedupe by identity, architypes may define __eq__ without __hash__
+        seen: set[int] = set()
         if edges_only:
             connected_edges: list[EdgeArchitype] = []
             for node in sources:
                 edges = JacFeature.get_edges(
-                    node.__jac__, dir, filter, target_obj=targ_obj_set
+                    node.__jac__, dir, filter, targ_obj_set, edge_type
                 )
                 connected_edges.extend(
-                    edge for edge in edges if edge not in connected_edges
+                    edge
+                    for edge in edges
+                    if id(edge) not in seen and not seen.add(id(edge))  # type: ignore[func-returns-value]
                 )
             return connected_edges
         else:
             connected_nodes: list[NodeArchitype] = []
             for node in sources:
                 nodes = JacFeature.edges_to_nodes(
-                    node.__jac__, dir, filter, target_obj=targ_obj_set
+                    node.__jac__, dir, filter, targ_obj_set, edge_type
                 )
                 connected_nodes.extend(
-                    node for node in nodes if node not in connected_nodes
+                    node
+                    for node in nodes
+                    if id(node) not in seen and not seen.add(id(node))  # type: ignore[func-returns-value]
                 )
             return connected_nodes
 
@@ -986,46 +980,37 @@ class JacBasics:
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir = EdgeDir.OUT,
         filter: Callable[[EdgeArchitype], bool] | None = None,
+        edge_type: Optional[Type[EdgeArchitype]] = None,
     ) -> bool:
         """Jac's disconnect operator feature."""
         disconnect_occurred = False
         left = [left] if isinstance(left, NodeArchitype) else left
         right = [right] if isinstance(right, NodeArchitype) else right
+        if not right:
+            return disconnect_occurred
 
         for i in left:
-            node = i.__jac__
-            for anchor in set(node.edges):
-                if (
-                    (source := anchor.source)
-                    and (target := anchor.target)
-                    and (not filter or filter(anchor.architype))
-                    and source.architype
-                    and target.architype
-                ):
-                    if (
-                        dir in [EdgeDir.OUT, EdgeDir.ANY]
-                        and node == source
-                        and target.architype in right
-                        and JacFeature.check_connect_access(target)
-                    ):
-                        (
-                            JacFeature.destroy(anchor)
-                            if anchor.persistent
-                            else JacFeature.detach(anchor)
-                        )
-                        disconnect_occurred = True
-                    if (
-                        dir in [EdgeDir.IN, EdgeDir.ANY]
-                        and node == target
-                        and source.architype in right
-                        and JacFeature.check_connect_access(source)
-                    ):
-                        (
-                            JacFeature.destroy(anchor)
-                            if anchor.persistent
-                            else JacFeature.detach(anchor)
-                        )
-                        disconnect_occurred = True
+            # collected first as destroying edges updates the adjacency index
+            matches = {
+                anchor.id: anchor
+                for anchor, _ in adjacent_edges(
+                    i.__jac__,
+                    dir,
+                    filter,
+                    right,
+                    edge_type,
+                    lambda anchors: [
+                        JacFeature.check_connect_access(anchor) for anchor in anchors
+                    ],
+                )
+            }
+            for anchor in matches.values():
+                (
+                    JacFeature.destroy(anchor)
+                    if anchor.persistent
+                    else JacFeature.detach(anchor)
+                )
+                disconnect_occurred = True
 
         return disconnect_occurred
 
@@ -1063,8 +1048,8 @@ class JacBasics:
                 target=target,
                 is_undirected=is_undirected,
             )
-            source.edges.append(eanch)
-            target.edges.append(eanch)
+            source.add_edge(eanch)
+            target.add_edge(eanch)
 
             if conn_assign:
                 for fld, val in zip(conn_assign[0], conn_assign[1]):
@@ -1587,6 +1572,10 @@ def generate_plugin_helpers(
             """Create a proxy method for the proxy class."""
 
             def proxy(*args: object, **kwargs: object) -> object:
+                # resolve once, later calls go straight to the dispatcher
+                if dispatcher := make_dispatcher(name, sig):  # noqa
+                    setattr(proxy_cls, name, dispatcher)  # noqa
+                    return dispatcher(*args, **kwargs)
                 # bind positionals to parameter names
                 bound = sig.bind_partial(*args, **kwargs)  # noqa
                 bound.apply_defaults()
@@ -1611,8 +1600,171 @@ def generate_plugin_helpers(
     proxy_namespace.update(proxy_methods)
     proxy_cls = type(f"{plugin_class.__name__}", (object,), proxy_namespace)
 
+    def reset_proxies() -> None:
+        """Restore the resolving proxies after plugins have changed."""
+        for name, proxy in proxy_methods.items():
+            setattr(proxy_cls, name, proxy)
+
+    plugin_manager.dispatch_resets.append(reset_proxies)
+
     return spec_cls, impl_cls, proxy_cls
 
 
+def access_level(jctx: ExecutionContext, to: Anchor) -> AccessLevel:
+    """Get the access level of the context's current root to a persistent anchor."""
+    jroot = jctx.root
+
+    # if current root is system_root
+    # if current root id is equal to target anchor's root id
+    # if current root is the target anchor
+    if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
+        return AccessLevel.WRITE
+
+    level = AccessLevel.NO_ACCESS
+
+    # if target anchor have set access.all
+    if (to_access := to.access).all > AccessLevel.NO_ACCESS:
+        level = to_access.all
+
+    # if target anchor's root have set allowed roots
+    # if current root is allowed to the whole graph of target anchor's root
+    if to.root and isinstance(to_root := jctx.mem.find_one(to.root), Anchor):
+        if to_root.access.all > level:
+            level = to_root.access.all
+
+        if (root_level := to_root.access.roots.check(str(jroot.id))) is not None:
+            level = root_level
+
+    # if target anchor have set allowed roots
+    # if current root is allowed to target anchor
+    if (root_level := to_access.roots.check(str(jroot.id))) is not None:
+        level = root_level
+
+    return level
+
+
+def adjacent_edges(
+    node: NodeAnchor,
+    dir: EdgeDir,
+    filter: Callable[[EdgeArchitype], bool] | None,
+    target_obj: list[NodeArchitype] | None,
+    edge_type: Optional[Type[EdgeArchitype]],
+    has_access: Callable[[list[Anchor]], list[bool]],
+) -> list[tuple[EdgeAnchor, NodeAnchor]]:
+    """
+    Get the edges of a node with the node on their other end.
+
+    Directed lookups go through the node's adjacency index so only edges of the
+    requested direction and edge class are visited. Lookups on both directions
+    scan the edges in order, matching an edge once per matching direction.
+    Access to the other nodes is checked in one batch.
+    """
+    index = node.edge_index
+    if not index.prefetched:
+        # only edges loaded from a datasource are unpopulated
+        if not all(edge.is_populated() for edge in node.edges):
+            JacFeature.get_context().mem.populate_data(node.edges)
+        index.prefetched = True
+
+    candidates = (
+        index.directed(dir == EdgeDir.OUT, edge_type) if dir != EdgeDir.ANY else None
+    )
+    matches: list[tuple[EdgeAnchor, NodeAnchor]] = []
+    for anchor in node.edges if candidates is None else candidates:
+        if (
+            (source := anchor.source)
+            and (target := anchor.target)
+            and (not filter or filter(anchor.architype))
+            and (not edge_type or isinstance(anchor.architype, edge_type))
+            and source.architype
+            and target.architype
+        ):
+            if (
+                dir in [EdgeDir.OUT, EdgeDir.ANY]
+                and node == source
+                and (not target_obj or target.architype in target_obj)
+            ):
+                matches.append((anchor, target))
+            if (
+                dir in [EdgeDir.IN, EdgeDir.ANY]
+                and node == target
+                and (not target_obj or source.architype in target_obj)
+            ):
+                matches.append((anchor, source))
+    if not matches:
+        return matches
+    return [
+        match
+        for match, allowed in zip(matches, has_access([other for _, other in matches]))
+        if allowed
+    ]
+
+
+def make_dispatcher(name: str, sig: inspect.Signature) -> Callable | None:
+    """
+    Build a function that calls the registered hookimpls of a feature directly.
+
+    The generated function keeps the feature signature (so Python binds the
+    arguments and defaults natively) and reproduces pluggy's firstresult loop:
+    impls are called in reverse registration order until one returns a value
+    other than None. Returns None when pluggy has to be used instead, such as
+    when hookwrappers or hook call monitoring are in place.
+    """
+    if not plugin_manager.direct_dispatch:
+        return None
+
+    hookcaller = getattr(plugin_manager.hook, name, None)
+    if hookcaller is None or hookcaller.spec is None:
+        return None
+
+    params: list[str] = []
+    namespace: dict[str, Any] = {}
+    kw_only = False
+    for param in sig.parameters.values():
+        match param.kind:
+            case inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                pass
+            case inspect.Parameter.KEYWORD_ONLY:
+                if not kw_only:
+                    params.append("*")
+                    kw_only = True
+            case _:
+                return None
+        if param.default is inspect.Parameter.empty:
+            params.append(param.name)
+        else:
+            namespace[f"_default_{param.name}"] = param.default
+            params.append(f"{param.name}=_default_{param.name}")
+
+    impls = hookcaller.get_hookimpls()
+    body: list[str] = []
+    for idx, impl in enumerate(reversed(impls)):
+        if (
+            impl.hookwrapper
+            or impl.wrapper
+            or any(arg not in sig.parameters for arg in impl.argnames)
+        ):
+            return None
+        namespace[f"_impl_{idx}"] = impl.function
+        call = f"_impl_{idx}({', '.join(impl.argnames)})"
+        if idx == len(impls) - 1:
+            body.append(f"    return {call}")
+        else:
+            body += [
+                f"    if (res := {call}) is not None:",
+                "        return res",
+            ]
+    if not body:
+        body.append("    return None")
+
+    source = f"def {name}({', '.join(params)}):\n" + "\n".join(body)
+    exec(compile(source, f"<jac dispatch {name}>", "exec"), namespace)
+
+    dispatcher = namespace[name]
+    dispatcher.__doc__ = hookcaller.spec.function.__doc__
+    dispatcher.__signature__ = sig
+    return dispatcher
+
+
 JacFeatureSpec, JacFeatureImpl, JacFeature = generate_plugin_helpers(JacFeature)  # type: ignore[misc]
 plugin_manager.add_hookspecs(JacFeatureSpec)
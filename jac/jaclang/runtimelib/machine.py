@@ -10,8 +10,8 @@ from uuid import UUID
 
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.program import JacProgram
-from jaclang.runtimelib.architype import NodeAnchor, Root
-from jaclang.runtimelib.memory import Memory, ShelfStorage
+from jaclang.runtimelib.architype import AccessLevel, NodeAnchor, Root
+from jaclang.runtimelib.memory import Memory, MemoryStats, ShelfStorage
 from jaclang.utils.log import logging
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,7 @@ class ExecutionContext:
     system_root: NodeAnchor
     root: NodeAnchor
     entry_node: NodeAnchor
+    access_levels: dict[tuple[UUID, UUID], AccessLevel]
 
     def __init__(
         self,
@@ -47,6 +48,8 @@ class ExecutionContext:
         self.mach = mach
         self.mem = ShelfStorage(session)
         self.reports = []
+        # (root id, anchor id) -> access level, cleared on permission changes
+        self.access_levels = {}
         sr_arch = Root()
         sr_anch = sr_arch.__jac__
         sr_anch.id = UUID(Con.SUPER_ROOT_UUID)
@@ -62,6 +65,7 @@ class ExecutionContext:
         self.system_root = system_root
 
         self.entry_node = self.root = self.init_anchor(root, self.system_root)
+        self.mem.pin(self.root.id)
 
     def init_anchor(
         self,
@@ -78,6 +82,7 @@ class ExecutionContext:
     def set_entry_node(self, entry_node: str | None) -> None:
         """Override entry."""
         self.entry_node = self.init_anchor(entry_node, self.root)
+        self.mem.pin(self.entry_node.id)
 
     def close(self) -> None:
         """Close current ExecutionContext."""
@@ -91,6 +96,11 @@ class ExecutionContext:
         """Get global system root."""
         return self.system_root
 
+    @property
+    def mem_stats(self) -> MemoryStats:
+        """Get the anchor cache counters."""
+        return self.mem.stats
+
 
 class JacMachineState:
     """JacMachine to handle the VM-related functionalities and loaded programs."""
@@ -101,6 +111,7 @@ class JacMachineState:
         session: Optional[str] = None,
         root: Optional[str] = None,
         interp_mode: bool = False,
+        cachable: bool = False,
     ) -> None:
         """Initialize the JacMachine object."""
         self.loaded_modules: dict[str, types.ModuleType] = {}
@@ -113,6 +124,6 @@ class JacMachineState:
             if not os.path.isdir(base_path)
             else os.path.abspath(base_path)
         )
-        self.jac_program: JacProgram = JacProgram()
+        self.jac_program: JacProgram = JacProgram(cachable=cachable)
         self.interp_mode = interp_mode
         self.exec_ctx = ExecutionContext(session=session, root=root, mach=self)
@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
+import os
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass, field
-from pickle import dumps
+from pickle import loads
 from shelve import Shelf, open
-from typing import Callable, Generator, Generic, Iterable, TypeVar
+from sys import getrefcount
+from typing import Callable, Generator, Generic, Iterable, Literal, TypeVar
+from urllib.parse import parse_qs, quote, urlsplit
 from uuid import UUID
 
-from .architype import Anchor, NodeAnchor, Root, TANCH
+from jaclang.settings import settings
+
+from .architype import Anchor, AnchorChange, EdgeAnchor, NodeAnchor, Root, TANCH
 
 ID = TypeVar("ID")
 
+SQLITE_SCHEME = "sqlite://"
+
+
+@dataclass
+class MemoryStats:
+    """Anchor cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    flushes: int = 0
+
 
 @dataclass
 class Memory(Generic[ID, TANCH]):
@@ -19,6 +39,7 @@ class Memory(Generic[ID, TANCH]):
 
     __mem__: dict[ID, TANCH] = field(default_factory=dict)
     __gc__: set[TANCH] = field(default_factory=set)
+    stats: MemoryStats = field(default_factory=MemoryStats)
 
     def close(self) -> None:
         """Close memory handler."""
@@ -56,6 +77,12 @@ class Memory(Generic[ID, TANCH]):
         """Find one by id."""
         return self.__mem__.get(id)
 
+    def populate_data(self, edges: Iterable[EdgeAnchor], depth: int = 1) -> None:
+        """Load edges and their nodes ahead of traversal."""
+
+    def pin(self, id: ID) -> None:
+        """Keep an anchor the running context uses cached."""
+
     def set(self, id: ID, data: TANCH) -> None:
         """Save anchor to memory."""
         self.__mem__[id] = data
@@ -75,11 +102,30 @@ class ShelfStorage(Memory[UUID, Anchor]):
     """Shelf Handler."""
 
     __shelf__: Shelf[Anchor] | None = None
-
-    def __init__(self, session: str | None = None) -> None:
+    # node id to levels of neighbors already prefetched from it
+    __prefetched__: dict[UUID, int] = field(default_factory=dict)
+    # most anchors kept cached before unloading least recently used ones, 0 for no limit
+    max_anchors: int = 0
+    # cached anchors count that triggers the next eviction pass
+    __evict_at__: int = 0
+    __pinned__: set[UUID] = field(default_factory=set)
+
+    def __init__(
+        self, session: str | None = None, max_anchors: int | None = None
+    ) -> None:
         """Initialize memory handler."""
         super().__init__()
-        self.__shelf__ = open(session) if session else None  # noqa: SIM115
+        self.__shelf__ = open_session(session) if session else None
+        self.__prefetched__ = {}
+        self.max_anchors = (
+            settings.memory_max_anchors if max_anchors is None else max_anchors
+        )
+        if self.max_anchors and self.__shelf__ is not None:
+            self.__mem__ = OrderedDict()
+        else:
+            self.max_anchors = 0
+        self.__evict_at__ = self.max_anchors
+        self.__pinned__ = set()
 
     def close(self) -> None:
         """Close memory handler."""
@@ -97,6 +143,8 @@ class ShelfStorage(Memory[UUID, Anchor]):
             self.sync_mem_to_db(set(self.__mem__.keys() - keys))
 
             self.__shelf__.close()
+        self.__prefetched__.clear()
+        self.__pinned__.clear()
         super().close()
 
     def sync_mem_to_db(self, keys: Iterable[UUID]) -> None:
@@ -108,12 +156,13 @@ class ShelfStorage(Memory[UUID, Anchor]):
                 if (
                     (d := self.__mem__.get(key))
                     and d.persistent
-                    and d.hash != hash(dumps(d))
+                    and (changes := d.get_changes())
                 ):
                     _id = str(d.id)
                     if p_d := self.__shelf__.get(_id):
                         if (
-                            isinstance(p_d, NodeAnchor)
+                            changes & AnchorChange.EDGES
+                            and isinstance(p_d, NodeAnchor)
                             and isinstance(d, NodeAnchor)
                             and p_d.edges != d.edges
                             and Jac.check_connect_access(d)
@@ -124,9 +173,9 @@ class ShelfStorage(Memory[UUID, Anchor]):
                             p_d.edges = d.edges
 
                         if Jac.check_write_access(d):
-                            if hash(dumps(p_d.access)) != hash(dumps(d.access)):
+                            if changes & AnchorChange.ACCESS:
                                 p_d.access = d.access
-                            if hash(dumps(p_d.architype)) != hash(dumps(d.architype)):
+                            if changes & AnchorChange.ARCHITYPE:
                                 p_d.architype = d.architype
 
                         self.__shelf__[_id] = p_d
@@ -148,28 +197,315 @@ class ShelfStorage(Memory[UUID, Anchor]):
 
         if isinstance(self.__shelf__, Shelf):
             for id in ids:
-                anchor = self.__mem__.get(id)
-
-                if (
-                    not anchor
-                    and id not in self.__gc__
-                    and (_anchor := self.__shelf__.get(str(id)))
-                ):
-                    self.__mem__[id] = anchor = _anchor
+                if anchor := self.__mem__.get(id):
+                    self.hit(id)
+                elif id not in self.__gc__:
+                    self.stats.misses += 1
+                    if _anchor := self.__shelf__.get(str(id)):
+                        self.__mem__[id] = anchor = _anchor
+                        self.evict()
                 if anchor and (not filter or filter(anchor)):
                     yield anchor
         else:
             yield from super().find(ids, filter)
 
+    def populate_data(self, edges: Iterable[EdgeAnchor], depth: int = 1) -> None:
+        """Load edges and the nodes on both of their ends in batches.
+
+        Each further level loads the edges and nodes of the previous level's
+        nodes, so walkers expanding breadth first read their next levels in
+        a few batched reads instead of one read per anchor.
+        """
+        if not isinstance(self.__shelf__, Shelf):
+            return
+
+        ids = [edge.id for edge in edges]
+        for remaining in range(depth - 1, -1, -1):
+            nodes: dict[UUID, None] = {}
+            for edge in self.load(ids):
+                if isinstance(edge, EdgeAnchor):
+                    nodes[edge.source.id] = None
+                    nodes[edge.target.id] = None
+
+            ids = []
+            for node in self.load(nodes):
+                if (
+                    remaining
+                    and isinstance(node, NodeAnchor)
+                    and self.__prefetched__.get(node.id, 0) < remaining
+                ):
+                    self.__prefetched__[node.id] = remaining
+                    ids.extend(edge.id for edge in node.edges)
+            if not ids:
+                break
+
+    def load(self, ids: Iterable[UUID]) -> list[Anchor]:
+        """Get anchors by id, reading uncached ones in one batch."""
+        if not isinstance(self.__shelf__, Shelf):
+            return list(self.find(ids))
+
+        anchors: list[Anchor] = []
+        missing: list[str] = []
+        for id in ids:
+            if anchor := self.__mem__.get(id):
+                self.hit(id)
+                anchors.append(anchor)
+            else:
+                self.stats.misses += 1
+                missing.append(str(id))
+
+        if missing:
+            store: MutableMapping[bytes, bytes] = self.__shelf__.dict  # type: ignore[attr-defined]
+            if isinstance(store, SqliteStore):
+                rows = store.get_many(key.encode() for key in missing)
+            else:
+                rows = (
+                    (key, store[key])
+                    for key in (key.encode() for key in missing)
+                    if key in store
+                )
+            for _, data in rows:
+                loaded: Anchor = loads(data)
+                anchors.append(self.__mem__.setdefault(loaded.id, loaded))
+            self.evict()
+        return anchors
+
     def find_by_id(self, id: UUID) -> Anchor | None:
         """Find one by id."""
-        data = super().find_by_id(id)
+        if not isinstance(self.__shelf__, Shelf):
+            return super().find_by_id(id)
+
+        if data := self.__mem__.get(id):
+            self.hit(id)
+        else:
+            self.stats.misses += 1
+            if data := self.__shelf__.get(str(id)):
+                self.__mem__[id] = data
+                self.evict()
+
+        return data
 
+    def set(self, id: UUID, data: Anchor) -> None:
+        """Save anchor to memory."""
+        super().set(id, data)
+        self.evict()
+
+    def hit(self, id: UUID) -> None:
+        """Count a cache hit and mark the anchor as recently used."""
+        self.stats.hits += 1
+        if self.max_anchors:
+            self.__mem__.move_to_end(id)  # type: ignore[attr-defined]
+
+    def pin(self, id: UUID) -> None:
+        """Keep an anchor the running context uses cached."""
+        self.__pinned__.add(id)
+
+    def evict(self) -> None:
+        """Unload least recently used anchors while over the anchor budget.
+
+        Only anchors nothing else uses are unloaded. Roots, pinned anchors,
+        anchors that are not persistent and anchors whose architype is still
+        referenced, by `here`, locals or walker fields, are kept and marked as
+        recently used. Changed anchors are written to the shelf first and
+        unloaded anchors are turned back into stubs that reload on access.
+        When the kept anchors alone exceed the budget, the next pass waits for
+        another max_anchors anchors to be cached instead of rescanning them on
+        every insert.
+        """
+        mem: OrderedDict[UUID, Anchor] = self.__mem__  # type: ignore[assignment]
         if (
-            not data
-            and isinstance(self.__shelf__, Shelf)
-            and (data := self.__shelf__.get(str(id)))
+            not self.max_anchors
+            or not isinstance(self.__shelf__, Shelf)
+            or len(mem) <= self.__evict_at__
         ):
-            self.__mem__[id] = data
+            return
+
+        for _ in range(len(mem)):
+            if len(mem) <= self.max_anchors:
+                break
+            id, anchor = next(iter(mem.items()))
+            if not self.is_evictable(anchor):
+                mem.move_to_end(id)
+                continue
+
+            if anchor.get_changes():
+                self.sync_mem_to_db([id])
+                self.stats.flushes += 1
+            del mem[id]
+            self.__prefetched__.pop(id, None)
+            anchor.__dict__.clear()
+            anchor.id = id
+            self.stats.evictions += 1
+
+        self.__evict_at__ = (
+            len(mem) + self.max_anchors
+            if len(mem) > self.max_anchors
+            else self.max_anchors
+        )
 
-        return data
+    def is_evictable(self, anchor: Anchor) -> bool:
+        """Check nothing but the cache uses an anchor."""
+        return (
+            anchor.is_populated()
+            and anchor.persistent
+            and anchor.id not in self.__pinned__
+            and not isinstance(anchor.architype, Root)
+            # only the anchor and this call refer to an unused architype
+            and getrefcount(anchor.__dict__["architype"]) <= 2
+        )
+
+
+class SqliteStore(MutableMapping[bytes, bytes]):
+    """SQLite backed key-value store for shelf sessions.
+
+    Writes are buffered and flushed by sync() in one transaction with
+    executemany, so closing a session commits every changed anchor at once.
+    """
+
+    def __init__(self, path: str, mmap_size: int = 0, readonly: bool = False) -> None:
+        """Open or create the database, only opening an existing one if readonly."""
+        if readonly:
+            self.conn = sqlite3.connect(
+                f"file:{quote(path)}?mode=ro", isolation_level=None, uri=True
+            )
+        else:
+            self.conn = sqlite3.connect(path, isolation_level=None)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        if mmap_size:
+            self.conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        if not readonly:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS anchors"
+                " (id BLOB PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID"
+            )
+        # pending writes, None marks a deletion
+        self.writes: dict[bytes, bytes | None] = {}
+
+    def __getitem__(self, key: bytes) -> bytes:
+        """Get the stored value of a key."""
+        if key in self.writes:
+            if (value := self.writes[key]) is None:
+                raise KeyError(key)
+            return value
+        row = self.conn.execute(
+            "SELECT data FROM anchors WHERE id = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def get_many(self, keys: Iterable[bytes]) -> Iterator[tuple[bytes, bytes]]:
+        """Get the stored items of many keys at once."""
+        keys = list(keys)
+        found = [(key, self.writes[key]) for key in keys if key in self.writes]
+        for key, value in found:
+            if value is not None:
+                yield key, value
+
+        pending = [key for key in keys if key not in self.writes]
+        # stay under SQLite's default limit of bound parameters
+        for i in range(0, len(pending), 500):
+            chunk = pending[i : i + 500]
+            yield from self.conn.execute(
+                "SELECT id, data FROM anchors WHERE id IN"
+                f" ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        """Buffer a write."""
+        self.writes[key] = value
+
+    def __delitem__(self, key: bytes) -> None:
+        """Buffer a deletion."""
+        if key not in self:
+            raise KeyError(key)
+        self.writes[key] = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over stored keys."""
+        self.sync()
+        for (key,) in self.conn.execute("SELECT id FROM anchors"):
+            yield key
+
+    def __len__(self) -> int:
+        """Count stored keys."""
+        self.sync()
+        return self.conn.execute("SELECT COUNT(*) FROM anchors").fetchone()[0]
+
+    def sync(self) -> None:
+        """Flush buffered writes in a single transaction."""
+        if not self.writes:
+            return
+        upserts = [(k, v) for k, v in self.writes.items() if v is not None]
+        deletes = [(k,) for k, v in self.writes.items() if v is None]
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany(
+                "INSERT INTO anchors (id, data) VALUES (?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                upserts,
+            )
+            self.conn.executemany("DELETE FROM anchors WHERE id = ?", deletes)
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        self.writes.clear()
+
+    def close(self) -> None:
+        """Flush buffered writes and close the database."""
+        self.sync()
+        self.conn.close()
+
+
+def open_store(
+    session: str, flag: Literal["c", "r"] = "c"
+) -> MutableMapping[bytes, bytes]:
+    """Open the raw key-value store of a session.
+
+    Flag "c" creates missing sessions, "r" opens an existing session read-only
+    and raises FileNotFoundError if there is none.
+    """
+    import dbm
+
+    if not session.startswith(SQLITE_SCHEME):
+        if flag == "r" and dbm.whichdb(session) is None:
+            raise FileNotFoundError(f"Session {session} does not exist!")
+        return dbm.open(session, flag)  # type: ignore[return-value]
+
+    uri = urlsplit(session)
+    path = uri.netloc + uri.path
+    if flag == "r" and not os.path.isfile(path):
+        raise FileNotFoundError(f"Session {session} does not exist!")
+    mmap_size = parse_qs(uri.query).get("mmap_size", ["0"])[0]
+    return SqliteStore(path, int(mmap_size), readonly=flag == "r")
+
+
+def open_session(session: str) -> Shelf[Anchor]:
+    """Open a session shelf.
+
+    Sessions given as `sqlite://<path>[?mmap_size=<bytes>]` are stored in
+    SQLite, anything else is a shelve/dbm file path.
+    """
+    if not session.startswith(SQLITE_SCHEME):
+        return open(session)  # noqa: SIM115
+    return Shelf(open_store(session))
+
+
+def migrate_session(source: str, target: str) -> int:
+    """Copy every anchor of an existing session to another session.
+
+    Pickled anchors are copied as is, without loading them.
+    """
+    src = open_store(source, "r")
+    dest = open_store(target)
+    try:
+        keys = list(src.keys())
+        for key in keys:
+            dest[key] = src[key]
+        return len(keys)
+    finally:
+        src.close()  # type: ignore[attr-defined]
+        dest.close()  # type: ignore[attr-defined]
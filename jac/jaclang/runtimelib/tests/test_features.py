@@ -3,7 +3,13 @@
 import inspect
 from typing import List, Type
 
-from jaclang.runtimelib.feature import JacFeature, JacFeatureImpl, JacFeatureSpec
+from jaclang.runtimelib.feature import (
+    JacFeature,
+    JacFeatureImpl,
+    JacFeatureSpec,
+    hookimpl,
+    plugin_manager,
+)
 from jaclang.utils.test import TestCase
 
 import pluggy
@@ -67,3 +73,90 @@ class TestFeatures(TestCase):
         # Execute the hook and check both results are returned
         results = pm.hook.setup()
         self.assertIn("I'm here", results)
+
+    def test_direct_dispatch(self) -> None:
+        """Test features resolve to direct dispatchers and reset on register."""
+        archi = JacFeature.Node()
+        ref = JacFeature.object_ref(archi)
+        resolved = JacFeature.object_ref
+        self.assertEqual(resolved.__code__.co_filename, "<jac dispatch object_ref>")
+        self.assertEqual(JacFeature.object_ref(archi), ref)
+
+        class OverridePlugin:
+            @staticmethod
+            @hookimpl
+            def object_ref(obj: object) -> str:
+                return "overridden"
+
+        class FallthroughPlugin:
+            @staticmethod
+            @hookimpl
+            def object_ref(obj: object) -> None:
+                return None
+
+        override, fallthrough = OverridePlugin(), FallthroughPlugin()
+        plugin_manager.register(override)
+        try:
+            self.assertIsNot(JacFeature.object_ref, resolved)
+            self.assertEqual(JacFeature.object_ref(obj=archi), "overridden")
+
+            # impls returning None fall through to the next one like pluggy
+            plugin_manager.register(fallthrough)
+            self.assertEqual(JacFeature.object_ref(archi), "overridden")
+        finally:
+            plugin_manager.unregister(fallthrough)
+            plugin_manager.unregister(override)
+
+        self.assertEqual(JacFeature.object_ref(archi), ref)
+
+    def test_direct_dispatch_monitoring(self) -> None:
+        """Test hook call monitoring falls back to pluggy dispatch."""
+        calls: list[str] = []
+        undo = plugin_manager.add_hookcall_monitoring(
+            lambda name, impls, kwargs: calls.append(name),
+            lambda outcome, name, impls, kwargs: None,
+        )
+        try:
+            JacFeature.object_ref(JacFeature.Node())
+            self.assertEqual(calls, ["object_ref"])
+        finally:
+            undo()
+        JacFeature.object_ref(JacFeature.Node())
+        self.assertEqual(calls, ["object_ref"])
+
+    def test_check_read_access_many(self) -> None:
+        """Test bulk read access checks share a per context memo."""
+        from uuid import uuid4
+
+        from jaclang.runtimelib.architype import AccessLevel, Root
+        from jaclang.runtimelib.machine import JacMachineState
+
+        __jac_mach__ = JacMachineState()  # noqa: F841
+        jctx = __jac_mach__.exec_ctx
+        jctx.root = Root().__jac__
+
+        other_root = uuid4()
+        private, public, local = (JacFeature.Node() for _ in range(3))
+        for node in (private, public):
+            node.__jac__.persistent = True
+            node.__jac__.root = other_root
+        public.__jac__.access.all = AccessLevel.READ
+
+        anchors = [private.__jac__, public.__jac__, local.__jac__]
+        self.assertEqual(
+            JacFeature.check_read_access_many(anchors), [False, True, True]
+        )
+        self.assertEqual(
+            jctx.access_levels,
+            {
+                (jctx.root.id, private.__jac__.id): AccessLevel.NO_ACCESS,
+                (jctx.root.id, public.__jac__.id): AccessLevel.READ,
+            },
+        )
+
+        # permission changes drop memoized decisions
+        JacFeature.unrestrict(private, AccessLevel.READ)
+        self.assertEqual(jctx.access_levels, {})
+        self.assertEqual(JacFeature.check_read_access_many(anchors), [True, True, True])
+        self.assertEqual(JacFeature.check_read_access_many([]), [])
+        jctx.close()
@@ -0,0 +1,239 @@
+"""Tests for Jac memory handlers."""
+
+import io
+import os
+import sys
+import tempfile
+from dataclasses import field
+from shelve import Shelf
+from typing import Any, Iterable, Iterator
+from unittest.mock import patch
+
+from jaclang.cli import cli
+from jaclang.runtimelib.architype import AnchorChange, NodeArchitype
+from jaclang.runtimelib.feature import JacFeature as Jac
+from jaclang.runtimelib.machine import JacMachineState
+from jaclang.runtimelib.memory import SqliteStore, migrate_session
+from jaclang.settings import settings
+from jaclang.utils.test import TestCase
+
+
+class Counter(NodeArchitype):
+    """Node with immutable values only."""
+
+    value: int = 0
+
+
+class Bag(NodeArchitype):
+    """Node with a mutable value."""
+
+    items: list = field(default_factory=list)
+
+
+class TestShelfStorage(TestCase):
+    """Test shelf backed memory."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.session = os.path.join(self.tmp.name, "session")
+
+    def tearDown(self) -> None:
+        """Tear down test."""
+        self.tmp.cleanup()
+        super().tearDown()
+        sys.stdout = sys.__stdout__
+
+    def close(self, mach: JacMachineState) -> list[str]:
+        """Close the session of a machine and return the written shelf keys."""
+        written: list[str] = []
+        setitem = Shelf.__setitem__
+
+        def record(shelf: Shelf, key: str, value: Any) -> None:  # noqa: ANN401
+            written.append(key)
+            setitem(shelf, key, value)
+
+        with patch.object(Shelf, "__setitem__", record):
+            mach.exec_ctx.close()
+        return written
+
+    def load(self, mach: JacMachineState, ids: list[Any]) -> list[Any]:
+        """Load anchors by id."""
+        return [mach.exec_ctx.mem.find_by_id(id) for id in ids]
+
+    def test_dirty_tracking(self) -> None:
+        """Test only changed anchors are written on close."""
+        __jac_mach__ = JacMachineState(session=self.session)
+        counter, other, bag = Counter(), Counter(), Bag()
+        Jac.connect(Jac.root(), [counter, other, bag])
+        ids = [counter.__jac__.id, other.__jac__.id, bag.__jac__.id]
+        self.close(__jac_mach__)
+
+        # untouched anchors are skipped, immutable ones without pickling
+        __jac_mach__ = JacMachineState(session=self.session)
+        counter_anchor, _, bag_anchor = self.load(__jac_mach__, ids)
+        self.assertEqual(counter_anchor.changes, AnchorChange.NONE)
+        self.assertEqual(counter_anchor.hash, 0)
+        self.assertNotEqual(bag_anchor.hash, 0)
+        self.assertEqual(self.close(__jac_mach__), [])
+
+        # assignments and in place mutations are both written
+        __jac_mach__ = JacMachineState(session=self.session)
+        counter_anchor, _, bag_anchor = self.load(__jac_mach__, ids)
+        counter_anchor.architype.value = 5
+        bag_anchor.architype.items.append(1)
+        self.assertEqual(counter_anchor.changes, AnchorChange.ARCHITYPE)
+        self.assertEqual(bag_anchor.changes, AnchorChange.NONE)
+        self.assertEqual(bag_anchor.get_changes(), AnchorChange.ALL)
+        self.assertEqual(
+            sorted(self.close(__jac_mach__)), sorted(str(id) for id in ids[::2])
+        )
+
+        # edge changes mark both nodes
+        __jac_mach__ = JacMachineState(session=self.session)
+        counter_anchor, other_anchor, bag_anchor = self.load(__jac_mach__, ids)
+        self.assertEqual(counter_anchor.architype.value, 5)
+        self.assertEqual(bag_anchor.architype.items, [1])
+        Jac.connect(counter_anchor.architype, other_anchor.architype)
+        self.assertEqual(counter_anchor.changes, AnchorChange.EDGES)
+        self.assertEqual(other_anchor.changes, AnchorChange.EDGES)
+        self.assertEqual(len(self.close(__jac_mach__)), 3)
+
+    def test_sqlite_session(self) -> None:
+        """Test sqlite sessions and migrating shelve sessions to them."""
+        __jac_mach__ = JacMachineState(session=self.session)
+        counter = Counter(value=3)
+        Jac.connect(Jac.root(), counter)
+        id = counter.__jac__.id
+        self.close(__jac_mach__)
+
+        target = f"sqlite://{self.session}.db?mmap_size=1048576"
+        self.assertEqual(migrate_session(self.session, target), 3)
+
+        __jac_mach__ = JacMachineState(session=target)
+        self.assertIsInstance(__jac_mach__.exec_ctx.mem.__shelf__.dict, SqliteStore)
+        (counter_anchor,) = self.load(__jac_mach__, [id])
+        self.assertEqual(counter_anchor.architype.value, 3)
+        counter_anchor.architype.value = 4
+        Jac.connect(counter_anchor.architype, Counter(value=5))
+        self.assertEqual(len(self.close(__jac_mach__)), 3)
+
+        __jac_mach__ = JacMachineState(session=target)
+        (counter_anchor,) = self.load(__jac_mach__, [id])
+        self.assertEqual(counter_anchor.architype.value, 4)
+        self.assertEqual(
+            [node.value for node in Jac.refs(counter_anchor.architype)], [5]
+        )
+        self.close(__jac_mach__)
+
+        # sources are only read, back to shelve and from sessions that exist
+        self.assertEqual(migrate_session(target, f"{self.session}.copy"), 5)
+        for missing in (f"{self.session}.typo", f"sqlite://{self.session}.typo.db"):
+            with self.assertRaises(FileNotFoundError):
+                migrate_session(missing, f"{self.session}.copy")
+        self.assertFalse([name for name in os.listdir(self.tmp.name) if "typo" in name])
+
+    def test_prefetch(self) -> None:
+        """Test walkers read their next levels in batches."""
+        session = f"sqlite://{self.session}.db"
+        filename = self.fixture_abs_path("prefetch_walker.jac")
+        cli.enter(filename=filename, session=session, entrypoint="build", args=[])
+
+        reads: list[str] = []
+        getitem, get_many = SqliteStore.__getitem__, SqliteStore.get_many
+
+        def read(store: SqliteStore, key: bytes) -> bytes:
+            reads.append("one")
+            return getitem(store, key)
+
+        def read_many(store: SqliteStore, keys: Iterable[bytes]) -> Iterator:
+            reads.append("many")
+            return get_many(store, keys)
+
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        with patch.object(SqliteStore, "__getitem__", read), patch.object(
+            SqliteStore, "get_many", read_many
+        ):
+            cli.enter(
+                filename=filename, session=session, entrypoint="traverse", args=[]
+            )
+        sys.stdout = sys.__stdout__
+
+        self.assertEqual(
+            captured_output.getvalue().split(),
+            ["0", "1", "2", "0", "1", "10", "11", "20", "21"],
+        )
+        # the two levels below root are loaded edges first, then nodes
+        self.assertEqual(reads.count("many"), 4)
+        self.assertLessEqual(reads.count("one"), 2)
+
+    def test_bounded_memory(self) -> None:
+        """Test least recently used anchors are flushed and unloaded."""
+        __jac_mach__ = JacMachineState(session=self.session)
+        counters = [Counter() for _ in range(10)]
+        Jac.connect(Jac.root(), counters)
+        ids = [counter.__jac__.id for counter in counters]
+        self.close(__jac_mach__)
+
+        with patch.object(settings, "memory_max_anchors", 4):
+            __jac_mach__ = JacMachineState(session=self.session)
+        mem = __jac_mach__.exec_ctx.mem
+        stats = __jac_mach__.exec_ctx.mem_stats
+
+        anchors = []
+        for value, id in enumerate(ids):
+            (anchor,) = self.load(__jac_mach__, [id])
+            anchor.architype.value = value
+            anchors.append(anchor)
+        # the root is never unloaded
+        self.assertEqual(len(mem.__mem__), 4)
+        self.assertIn(Jac.root().__jac__.id, mem.__mem__)
+        self.assertEqual(stats.misses, 11)
+        self.assertEqual(stats.evictions, 7)
+        self.assertEqual(stats.flushes, 7)
+
+        self.assertEqual(self.load(__jac_mach__, ids[-1:]), anchors[-1:])
+        self.assertEqual(stats.hits, 1)
+
+        # unloaded anchors are stubs again and reload on access
+        self.assertFalse(anchors[0].is_populated())
+        self.assertEqual(anchors[0].architype.value, 0)
+        self.assertEqual(stats.misses, 12)
+        self.assertEqual(stats.evictions, 8)
+        self.close(__jac_mach__)
+
+        __jac_mach__ = JacMachineState(session=self.session)
+        self.assertEqual(
+            [anchor.architype.value for anchor in self.load(__jac_mach__, ids)],
+            list(range(10)),
+        )
+
+    def test_evict_held_architype(self) -> None:
+        """Test architypes still referenced are kept cached while evicting."""
+        __jac_mach__ = JacMachineState(session=self.session)
+        counters: list[NodeArchitype] = [Counter() for _ in range(20)]
+        Jac.connect(Jac.root(), counters)
+        ids = [counter.__jac__.id for counter in counters]
+        del counters
+        self.close(__jac_mach__)
+
+        with patch.object(settings, "memory_max_anchors", 5):
+            __jac_mach__ = JacMachineState(session=self.session)
+        mem = __jac_mach__.exec_ctx.mem
+        stats = __jac_mach__.exec_ctx.mem_stats
+
+        (anchor,) = self.load(__jac_mach__, ids[:1])
+        held = anchor.architype
+        self.load(__jac_mach__, ids[1:])
+        self.assertGreater(stats.evictions, 0)
+        self.assertTrue(anchor.is_populated())
+        self.assertIs(mem.__mem__[ids[0]].architype, held)
+
+        held.value = 999
+        self.close(__jac_mach__)
+
+        __jac_mach__ = JacMachineState(session=self.session)
+        (anchor,) = self.load(__jac_mach__, ids[:1])
+        self.assertEqual(anchor.architype.value, 999)
@@ -28,6 +28,9 @@ class Settings:
     pyout_jaclib_alias: str = "_"
     pyout_jaclib_format: bool = True
 
+    # Runtime configuration
+    memory_max_anchors: int = 0
+
     # Formatter configuration
     max_line_length: int = 88
 
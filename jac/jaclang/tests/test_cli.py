@@ -403,6 +403,9 @@ class JacCliTests(TestCase):
 
     def test_cache_no_cache_on_run(self) -> None:
         """Basic test for pass."""
+        cache_file = self.fixture_abs_path(os.path.join("__jac_gen__", "hello_nc.jbc"))
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
         process = subprocess.Popen(
             ["jac", "run", f"{self.fixture_abs_path('hello_nc.jac')}", "-nc"],
             stdin=subprocess.PIPE,
@@ -426,6 +429,38 @@ class JacCliTests(TestCase):
         )
         stdout, _ = process.communicate()
         self.assertIn("Hello World!", stdout)
+        self.assertTrue(os.path.exists(cache_file))
+
+    def test_bytecode_cache_warm_run(self) -> None:
+        """Test warm runs load bytecode from the cache without compiling."""
+        from jaclang.compiler.cache import BytecodeCache
+        from jaclang.compiler.program import JacProgram
+
+        filename = self.fixture_abs_path("impl_grab.jac")
+        cache_file = BytecodeCache.get_cache_path(filename)
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+
+        cold = JacProgram(cachable=True)
+        self.assertIsNotNone(cold.get_bytecode(filename))
+        self.assertTrue(os.path.exists(cache_file))
+        self.assertIn(filename, cold.modules)
+
+        warm = JacProgram(cachable=True)
+        self.assertIsNotNone(warm.get_bytecode(filename))
+        self.assertNotIn(filename, warm.modules)
+
+        # annexed impl files are part of the cache key
+        impl_files, _ = JacProgram.get_annex_paths(filename)
+        self.assertEqual(impl_files, [self.fixture_abs_path("impl_grab.impl.jac")])
+        self.assertIsNone(BytecodeCache.load(filename, []))
+        self.assertIsNotNone(BytecodeCache.load(filename, impl_files))
+
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        cli.run(filename)
+        sys.stdout = sys.__stdout__
+        self.assertIn("1.414", captured_output.getvalue())
 
     def test_run_test(self) -> None:
         """Basic test for pass."""
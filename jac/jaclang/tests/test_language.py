@@ -1317,6 +1317,110 @@ class JacLanguageTests(TestCase):
             "Exiting at the end of walker:  test_node(value=", stdout_value[11]
         )
 
+    def test_walker_dispatch_table(self) -> None:
+        """Test walker abilities are resolved once per visited node class."""
+        from jaclang.runtimelib.architype import WalkerDispatch
+
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        (mod,) = Jac.jac_import(
+            self.mach, "entry_exit", base_path=self.fixture_abs_path("./")
+        )
+        sys.stdout = sys.__stdout__
+
+        dispatch = mod.test_walker._jac_dispatch_
+        self.assertIsInstance(dispatch, WalkerDispatch)
+        self.assertIs(WalkerDispatch.get(mod.test_walker), dispatch)
+        self.assertEqual(
+            [i.name for i in dispatch.entries + dispatch.exits],
+            ["log_entry", "log_exit"],
+        )
+        self.assertEqual(
+            [func.__name__ for func, _ in dispatch.visits[mod.test_node]],
+            ["log_visit"],
+        )
+        self.assertEqual(
+            [func.__name__ for func, _ in dispatch.visits[Jac.Root]], ["traverse"]
+        )
+
+        # subclasses get their own table
+        subclass = type("sub_walker", (mod.test_walker,), {})
+        self.assertIsNot(WalkerDispatch.get(subclass), dispatch)
+
+    def test_walker_frontier(self) -> None:
+        """Test walker frontier is a queue and ignores are a set."""
+        from collections import deque
+
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        (mod,) = Jac.jac_import(
+            self.mach, "ignore_dup", base_path=self.fixture_abs_path("./")
+        )
+        sys.stdout = sys.__stdout__
+
+        walker = mod.GuessGame2()
+        anchor = walker.__jac__
+        self.assertIsInstance(anchor.next, deque)
+        self.assertIsInstance(anchor.ignores, set)
+
+        nodes = [mod.turn() for _ in range(3)]
+        Jac.ignore(walker, nodes[0])
+        Jac.ignore(walker, nodes[0])
+        self.assertEqual(anchor.ignores, {nodes[0].__jac__})
+        self.assertTrue(Jac.visit(walker, nodes))
+        self.assertEqual(list(anchor.next), [n.__jac__ for n in nodes[1:]])
+
+    def test_edge_index(self) -> None:
+        """Test typed edge refs and disconnects go through the edge index."""
+        from jaclang.compiler.constant import EdgeDir
+        from jaclang.runtimelib.architype import (
+            EdgeArchitype,
+            GenericEdge,
+            NodeArchitype,
+        )
+
+        class Item(NodeArchitype):
+            pass
+
+        class Link(EdgeArchitype):
+            pass
+
+        hub, *items = [Item() for _ in range(6)]
+        Jac.connect(hub, items[:3], Link)
+        Jac.connect(hub, items[3:], GenericEdge)
+        Jac.connect(items[0], hub, Link)
+
+        anchor = hub.__jac__
+        index = anchor.edge_index
+        self.assertEqual(len(index.directed(True, Link) or []), 3)
+        self.assertEqual(len(index.directed(False) or []), 1)
+        self.assertEqual(
+            Jac.refs(hub, edge_type=Link, filter=lambda i: isinstance(i, Link)),
+            items[:3],
+        )
+        self.assertEqual(Jac.refs(hub), items)
+        self.assertEqual(Jac.refs(hub, dir=EdgeDir.IN), [items[0]])
+        self.assertEqual(Jac.refs(hub, dir=EdgeDir.ANY), items)
+
+        self.assertTrue(Jac.disconnect(hub, items[1], edge_type=Link))
+        self.assertFalse(Jac.disconnect(hub, items[4], edge_type=Link))
+        self.assertIs(anchor.edge_index, index)
+        self.assertEqual(Jac.refs(hub), [items[0], items[2], items[3], items[4]])
+        self.assertEqual(len(anchor.edges), 5)
+        self.assertEqual(items[1].__jac__.edges, [])
+
+        # edges replaced in place are reindexed when removing
+        index = anchor.edge_index
+        anchor.edges[2] = Jac.connect(items[3], items[4], edges_only=True)[0].__jac__
+        self.assertIs(anchor.edge_index, index)
+        self.assertTrue(Jac.disconnect(hub, items[2], edge_type=Link))
+        self.assertEqual(len(anchor.edges), 4)
+
+        # edges changed outside add/remove_edge are reindexed
+        anchor.edges = list(anchor.edges[:1])
+        self.assertIsNot(anchor.edge_index, index)
+        self.assertEqual(Jac.refs(hub), [items[0]])
+
     def test_visit_order(self) -> None:
         """Test entry and exit behavior of walker."""
         captured_output = io.StringIO()
@@ -0,0 +1,65 @@
+"""Benchmark for typed edge refs on hub nodes.
+
+Connects a hub node to N generic children and a handful of typed ones, then
+times a typed edge ref and disconnecting one typed edge. With the adjacency
+index both should stay flat as N grows.
+
+    python scripts/bench_edge_index.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import jaclang  # noqa: F401
+from jaclang.runtimelib.architype import EdgeArchitype, NodeArchitype
+from jaclang.runtimelib.feature import JacFeature as Jac
+from jaclang.runtimelib.machine import JacMachineState
+
+__jac_mach__ = JacMachineState()
+
+TYPED = 10
+REPEAT = 100
+
+
+class Item(NodeArchitype):
+    """Benchmark node."""
+
+
+class Link(EdgeArchitype):
+    """Benchmark edge."""
+
+
+def is_link(edge: EdgeArchitype) -> bool:
+    """Filter emitted for `-->:Link:`."""
+    return isinstance(edge, Link)
+
+
+def main(sizes: tuple[int, ...] = (10_000, 50_000, 100_000)) -> None:
+    """Run the benchmark."""
+    for size in sizes:
+        hub = Item()
+        Jac.connect(hub, [Item() for _ in range(size)])
+        linked: list[NodeArchitype] = [Item() for _ in range(TYPED)]
+        Jac.connect(hub, linked, Link)
+        # directional groups are built on first query
+        Jac.refs(hub, filter=is_link, edge_type=Link)
+        Jac.disconnect(hub, linked.pop(), filter=is_link, edge_type=Link)
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            assert len(Jac.refs(hub, filter=is_link, edge_type=Link)) == TYPED - 1
+        refs = (time.perf_counter() - start) / REPEAT
+
+        start = time.perf_counter()
+        Jac.disconnect(hub, linked[0], filter=is_link, edge_type=Link)
+        disconnect = time.perf_counter() - start
+
+        print(
+            f"{size:>7} edges: refs {refs * 1e6:8.1f} us,"
+            f" disconnect {disconnect * 1e6:8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Micro-benchmark for JacFeature call dispatch.
+
+Compares calling a feature through the pluggy proxy against the resolved
+direct dispatcher that is installed after the first call.
+
+    python scripts/bench_feature_dispatch.py
+"""
+
+import timeit
+
+import jaclang  # noqa: F401
+from jaclang.runtimelib.feature import JacFeature, plugin_manager
+
+
+def main(number: int = 200_000) -> None:
+    """Run the benchmark."""
+    archi = JacFeature.Node()
+
+    plugin_manager.direct_dispatch = False
+    plugin_manager.reset_dispatch()
+    proxied = timeit.timeit(lambda: JacFeature.object_ref(archi), number=number)
+
+    plugin_manager.direct_dispatch = True
+    plugin_manager.reset_dispatch()
+    direct = timeit.timeit(lambda: JacFeature.object_ref(archi), number=number)
+
+    print(f"calls per run:   {number}")
+    print(f"pluggy proxy:    {proxied / number * 1e9:8.1f} ns/call")
+    print(f"direct dispatch: {direct / number * 1e9:8.1f} ns/call")
+    print(f"speedup:         {proxied / direct:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
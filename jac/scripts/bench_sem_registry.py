@@ -0,0 +1,85 @@
+"""Benchmark for semantic registry lookups.
+
+Builds a generated registry of modules with many architypes and fields, the
+way RegistryPass does, then times the lookups done on every `by llm` call
+against a linear scan over the scopes. With the registry index both building
+and lookups should stay flat as the registry grows.
+
+    python scripts/bench_sem_registry.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+
+FIELDS = 10
+REPEAT = 1_000
+
+
+def build(size: int) -> tuple[SemRegistry, list[SemScope]]:
+    """Build a registry with size architypes split across merged modules."""
+    registry = SemRegistry()
+    scopes = []
+    for mod in range(10):
+        module = SemRegistry()
+        mod_scope = SemScope(f"mod{mod}", "Module")
+        for arch in range(size // 10):
+            name = f"Arch{mod}_{arch}"
+            module.add(mod_scope, SemInfo(None, name, "obj", name))  # type: ignore[arg-type]
+            scope = SemScope(name, "obj", mod_scope)
+            for fld in range(FIELDS):
+                module.add(scope, SemInfo(None, f"f{fld}", "int", ""))  # type: ignore[arg-type]
+            scopes.append(scope)
+        registry.registry.update(module.registry)
+    return registry, scopes
+
+
+def linear_lookup(registry: SemRegistry, scope: SemScope, name: str) -> SemInfo | None:
+    """Find semantic information scanning every scope."""
+    for key, infos in registry.registry.items():
+        if str(key) == str(scope):
+            for info in infos:
+                if info.name == name:
+                    return info
+    return None
+
+
+def main(sizes: tuple[int, ...] = (1_000, 5_000, 20_000)) -> None:
+    """Run the benchmark."""
+    for size in sizes:
+        start = time.perf_counter()
+        registry, scopes = build(size)
+        # merging modules reindexes the registry on its next lookup
+        registry.lookup(name="f0")
+        built = time.perf_counter() - start
+        probes = scopes[:: max(len(scopes) // REPEAT, 1)][:REPEAT]
+
+        start = time.perf_counter()
+        for scope in probes:
+            _, info = registry.lookup(name=scope.scope)
+            assert isinstance(info, SemInfo)
+            info.get_children(registry)
+        children = (time.perf_counter() - start) / len(probes)
+
+        start = time.perf_counter()
+        for scope in probes:
+            registry.lookup(scope=scope, name="f5")
+        indexed = (time.perf_counter() - start) / len(probes)
+
+        start = time.perf_counter()
+        for scope in probes[:10]:
+            linear_lookup(registry, scope, "f5")
+        linear = (time.perf_counter() - start) / 10
+
+        print(
+            f"{size:>6} architypes: build {built * 1e3:7.1f} ms,"
+            f" get_children {children * 1e6:5.1f} us,"
+            f" scoped lookup {indexed * 1e6:5.1f} us"
+            f" (linear {linear * 1e6:7.1f} us)"
+        )
+
+
+if __name__ == "__main__":
+    main()
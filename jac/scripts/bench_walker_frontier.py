@@ -0,0 +1,63 @@
+"""Benchmark for walker frontier scaling.
+
+Spawns a walker on a hub node connected to N nodes. The walker visits every
+child (one large BFS frontier) and ignores each node it reaches, so the time
+per node should stay flat as N grows.
+
+    python scripts/bench_walker_frontier.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import jaclang  # noqa: F401
+from jaclang.runtimelib.architype import NodeArchitype, WalkerArchitype
+from jaclang.runtimelib.feature import JacFeature as Jac
+from jaclang.runtimelib.machine import JacMachineState
+
+__jac_mach__ = JacMachineState()
+
+
+class Hub(NodeArchitype):
+    """Benchmark start node."""
+
+
+class Item(NodeArchitype):
+    """Benchmark node."""
+
+
+class Walk(WalkerArchitype):
+    """Benchmark walker."""
+
+    count: int = 0
+
+    @Jac.entry
+    def start(self, here: Hub) -> None:
+        """Visit every child of the hub."""
+        Jac.visit(self, Jac.refs(here))
+
+    @Jac.entry
+    def step(self, here: Item) -> None:
+        """Count and ignore visited nodes."""
+        self.count += 1
+        Jac.ignore(self, here)
+
+
+def main(sizes: tuple[int, ...] = (25_000, 50_000, 100_000)) -> None:
+    """Run the benchmark."""
+    for size in sizes:
+        hub = Hub()
+        Jac.connect(hub, [Item() for _ in range(size)])
+
+        walker = Walk()
+        start = time.perf_counter()
+        Jac.spawn(walker, hub)
+        elapsed = time.perf_counter() - start
+
+        assert walker.count == size
+        print(f"{size:>7} nodes: {elapsed:6.3f}s ({elapsed / size * 1e6:5.2f} us/node)")
+
+
+if __name__ == "__main__":
+    main()